@@ -0,0 +1,122 @@
+from typing import Any
+from uuid import UUID
+
+import structlog
+
+from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageRequest,
+    RecipePage,
+)
+from recipebot.config.config import RecipeCacheSettings
+from recipebot.domain.recipe.recipe import (
+    Recipe,
+    RecipeIngredientMatch,
+    RecipeSummary,
+)
+from recipebot.infra.cache.ttl_lru import TTLLRUCache
+from recipebot.ports.repositories.recipe_repository import RecipeRepositoryABC
+
+logger: structlog.BoundLogger = structlog.get_logger(__name__)
+
+# (user_id, method name, filters json, page json)
+type ListKey = tuple[int, str, str, str]
+
+
+class CachedRecipeRepo(RecipeRepositoryABC):
+    """Caching decorator around another recipe repository.
+
+    Keeps individual recipes and per-user list results in bounded LRU caches
+    with TTL. Writes go straight to the wrapped repository and drop the
+    affected user's entries. Cached recipes are copied on the way out, so
+    handlers mutating them can't corrupt the cache.
+    """
+
+    def __init__(self, repo: RecipeRepositoryABC, cfg: RecipeCacheSettings) -> None:
+        self.repo = repo
+        self._recipes: TTLLRUCache[UUID, Recipe] = TTLLRUCache(
+            "recipes", cfg.max_recipes, cfg.ttl_seconds
+        )
+        self._lists: TTLLRUCache[ListKey, Any] = TTLLRUCache(
+            "recipe_lists", cfg.max_lists, cfg.ttl_seconds
+        )
+
+    async def add(self, recipe_data: Recipe) -> Recipe:
+        recipe = await self.repo.add(recipe_data)
+        self._invalidate_user(recipe.user_id)
+        return recipe
+
+    async def get(self, id: UUID) -> Recipe:
+        recipe = self._recipes.get(id)
+        if recipe is None:
+            recipe = await self.repo.get(id)
+            self._recipes.set(id, recipe.model_copy(deep=True))
+            return recipe
+        return recipe.model_copy(deep=True)
+
+    async def list_filtered(self, filters: RecipeFilters) -> list[Recipe]:
+        key: ListKey = (filters.user_id, "list_filtered", filters.model_dump_json(), "")
+        recipes: list[Recipe] | None = self._lists.get(key)
+        if recipes is None:
+            recipes = await self.repo.list_filtered(filters)
+            self._lists.set(key, [recipe.model_copy(deep=True) for recipe in recipes])
+            return recipes
+        return [recipe.model_copy(deep=True) for recipe in recipes]
+
+    async def list_summaries(
+        self, filters: RecipeFilters, page: PageRequest
+    ) -> RecipePage[RecipeSummary]:
+        key: ListKey = (
+            filters.user_id,
+            "list_summaries",
+            filters.model_dump_json(),
+            page.model_dump_json(),
+        )
+        recipe_page: RecipePage[RecipeSummary] | None = self._lists.get(key)
+        if recipe_page is None:
+            recipe_page = await self.repo.list_summaries(filters, page)
+            self._lists.set(key, recipe_page)
+        return recipe_page
+
+    async def fuzzy_search(self, user_id: int, query: str) -> list[RecipeSummary]:
+        key: ListKey = (user_id, "fuzzy_search", query, "")
+        suggestions: list[RecipeSummary] | None = self._lists.get(key)
+        if suggestions is None:
+            suggestions = await self.repo.fuzzy_search(user_id, query)
+            self._lists.set(key, suggestions)
+        return list(suggestions)
+
+    async def list_by_ingredients(
+        self, user_id: int, ingredient_names: list[str], limit: int = 10
+    ) -> list[RecipeIngredientMatch]:
+        key: ListKey = (
+            user_id,
+            "list_by_ingredients",
+            "\n".join(ingredient_names),
+            str(limit),
+        )
+        matches: list[RecipeIngredientMatch] | None = self._lists.get(key)
+        if matches is None:
+            matches = await self.repo.list_by_ingredients(
+                user_id, ingredient_names, limit
+            )
+            self._lists.set(key, matches)
+        return list(matches)
+
+    async def update(self, recipe_data: Recipe) -> Recipe:
+        try:
+            return await self.repo.update(recipe_data)
+        finally:
+            self._recipes.pop(recipe_data.id)
+            self._invalidate_user(recipe_data.user_id)
+
+    async def delete(self, id: UUID, user_id: int) -> None:
+        try:
+            await self.repo.delete(id, user_id)
+        finally:
+            self._recipes.pop(id)
+            self._invalidate_user(user_id)
+
+    def _invalidate_user(self, user_id: int) -> None:
+        logger.debug("Invalidating recipe cache", user_id=user_id)
+        self._lists.discard_where(lambda key: key[0] == user_id)
@@ -1,3 +1,4 @@
 INSERT INTO users (tg_id, username, first_name, last_name)
 VALUES ($1, $2, $3, $4)
+ON CONFLICT (tg_id) DO NOTHING
 RETURNING tg_id, username, first_name, last_name, created_at;
@@ -9,7 +9,10 @@ from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import (
     AsyncpgConnection,
 )
 from recipebot.adapters.repositories.sql.base.utils import load_query
+from recipebot.config import settings
+from recipebot.config.config import RegistrationCacheSettings
 from recipebot.domain.auth.user import User
+from recipebot.infra.cache.ttl_lru import TTLLRUCache
 from recipebot.ports.repositories.exceptions import UserAlreadyExists, UserNotFound
 from recipebot.ports.repositories.user_repository import UserRepositoryABC
 
@@ -17,17 +20,33 @@ logger = structlog.get_logger(__name__)
 
 
 class UserAsyncpgRepo(UserRepositoryABC):
-    def __init__(self, conn: AsyncpgConnection) -> None:
+    """Asyncpg user repository.
+
+    Lookups go through an in-memory registration cache, so `only_registered`
+    checks don't hit the database for known users. Unknown users are cached
+    for a short negative TTL only.
+    """
+
+    def __init__(
+        self,
+        conn: AsyncpgConnection,
+        cache_cfg: RegistrationCacheSettings = settings.REGISTRATION_CACHE,
+    ) -> None:
         self.conn = conn
+        self.cache_cfg = cache_cfg
+        # tg_id -> User, or False if user is not registered
+        self._registered: TTLLRUCache[int, User | bool] = TTLLRUCache(
+            "registered_users", cache_cfg.max_size, cache_cfg.ttl_seconds
+        )
 
     async def add(self, register_data: TGUser) -> User:
         logger.info("Starting user registration")
-        async with self.conn.get_cursor() as conn:
-            if await self.get(register_data.id):
-                raise UserAlreadyExists(
-                    f"Username {register_data.username} already registered."
-                )
+        if isinstance(self._registered.get(register_data.id), User):
+            raise UserAlreadyExists(
+                f"Username {register_data.username} already registered."
+            )
 
+        async with self.conn.get_cursor() as conn:
             row = await conn.fetchrow(
                 load_query(__file__, INSERT_USER_QUERY),
                 register_data.id,
@@ -35,17 +54,32 @@ class UserAsyncpgRepo(UserRepositoryABC):
                 register_data.first_name,
                 register_data.last_name,
             )
-            if not row:
-                raise Exception("User not created")
+        if not row:
+            # Insert was skipped on conflict, user is registered already. The
+            # row isn't returned, drop a stale "not registered" entry instead,
+            # so the next lookup reads and caches the user
+            self._registered.pop(register_data.id)
+            raise UserAlreadyExists(
+                f"Username {register_data.username} already registered."
+            )
 
-            return User.model_validate(dict(row))
+        user = User.model_validate(dict(row))
+        self._registered.set(user.tg_id, user)
+        return user
 
     async def get(self, id: int) -> User | None:
+        cached = self._registered.get(id)
+        if cached is not None:
+            return cached if isinstance(cached, User) else None
+
         async with self.conn.get_cursor() as conn:
             row = await conn.fetchrow(load_query(__file__, GET_BY_TG_ID_QUERY), id)
-            if not row:
-                return None
-            return User(**dict(row))
+        if not row:
+            self._registered.set(id, False, ttl=self.cache_cfg.negative_ttl_seconds)
+            return None
+        user = User(**dict(row))
+        self._registered.set(id, user)
+        return user
 
     async def get_by_tg_user(self, user: TGUser | None) -> User | None:
         if not user:
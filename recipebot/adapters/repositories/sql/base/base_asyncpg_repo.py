@@ -1,22 +1,31 @@
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 import asyncpg
 import structlog
 from asyncpg.pool import PoolConnectionProxy
 
-from recipebot.adapters.repositories.sql.base.queries import (
-    CREATE_GROUPS_TABLE,
-    CREATE_RECIPE_TAGS_TABLE,
-    CREATE_RECIPES_TABLE,
-    CREATE_USERS_GROUPS_JUNCTION_TABLE,
-    CREATE_USERS_TABLE,
+from recipebot.adapters.repositories.sql.base.migrator import (
+    apply_migrations,
+    load_migrations,
 )
-from recipebot.adapters.repositories.sql.base.utils import load_query
 from recipebot.config import settings
+from recipebot.metrics.db import (
+    DB_POOL_ACQUIRE_SECONDS,
+    DB_POOL_ACQUIRE_TIMEOUTS,
+    DB_POOL_CONNECTIONS,
+    DBPoolConnectionStateEnum,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Transaction opened in the current task, with the connection pool owning it
+_tx_conn: ContextVar[tuple["AsyncpgConnection", PoolConnectionProxy] | None] = (
+    ContextVar("tx_conn", default=None)
+)
+
 
 class AsyncpgConnection:
     """
@@ -25,14 +34,36 @@ class AsyncpgConnection:
 
     def __init__(self) -> None:
         self._pool: asyncpg.Pool | None = None
+        self._schema_ready = False
 
     async def init_pool(self) -> None:
         if self._pool is None:
+            cfg = settings.POSTGRESQL
             self._pool = await asyncpg.create_pool(
-                dsn=settings.POSTGRESQL.dsn,
-                min_size=1,
-                max_size=10,
+                dsn=cfg.dsn,
+                min_size=cfg.pool_min_size,
+                max_size=cfg.pool_max_size,
+                max_inactive_connection_lifetime=cfg.max_inactive_connection_lifetime,
+                command_timeout=cfg.command_timeout,
+                statement_cache_size=cfg.statement_cache_size,
+                # Keep prepared statements of registry queries for the
+                # connection lifetime instead of re-parsing them every 5 min
+                max_cached_statement_lifetime=0,
             )
+            self._register_pool_metrics(self._pool)
+
+    @staticmethod
+    def _register_pool_metrics(pool: asyncpg.Pool) -> None:
+        """Report pool sizes to Prometheus, evaluated on every scrape."""
+        DB_POOL_CONNECTIONS.labels(DBPoolConnectionStateEnum.IN_USE).set_function(
+            lambda: pool.get_size() - pool.get_idle_size()
+        )
+        DB_POOL_CONNECTIONS.labels(DBPoolConnectionStateEnum.IDLE).set_function(
+            pool.get_idle_size
+        )
+        DB_POOL_CONNECTIONS.labels(DBPoolConnectionStateEnum.MAX).set_function(
+            pool.get_max_size
+        )
 
     async def close_pool(self) -> None:
         """Close the connection pool (call at app shutdown / lifespan)."""
@@ -44,10 +75,22 @@ class AsyncpgConnection:
     async def connection(self) -> AsyncIterator[PoolConnectionProxy]:
         """
         Async context manager for getting a connection from the pool.
+        Inside `transaction()` yields the transaction connection instead.
         """
+        if (tx := _tx_conn.get()) is not None and tx[0] is self:
+            yield tx[1]
+            return
         if self._pool is None:
             raise RuntimeError("Connection pool is not initialized")
-        conn = await self._pool.acquire()
+        started = time.perf_counter()
+        try:
+            conn = await self._pool.acquire(timeout=settings.POSTGRESQL.acquire_timeout)
+        except TimeoutError:
+            DB_POOL_ACQUIRE_TIMEOUTS.inc()
+            logger.error("Timed out acquiring DB connection from pool")
+            raise
+        finally:
+            DB_POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - started)
         try:
             yield conn
         finally:
@@ -66,12 +109,27 @@ class AsyncpgConnection:
                 logger.error(f"DB ERROR: {e}")
                 raise
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[PoolConnectionProxy]:
+        """
+        Async context manager running everything inside on a single connection
+        within one transaction, including calls made by other repositories
+        sharing this connection pool.
+        """
+        async with self.get_cursor() as conn, conn.transaction():
+            token = _tx_conn.set((self, conn))
+            try:
+                yield conn
+            finally:
+                _tx_conn.reset(token)
+
     async def init_db(self) -> None:
-        """Check that tables exist, if not create them"""
-        async with self.get_cursor() as conn:
-            await conn.execute(load_query(__file__, CREATE_USERS_TABLE))
-            await conn.execute(load_query(__file__, CREATE_GROUPS_TABLE))
-            await conn.execute(load_query(__file__, CREATE_USERS_GROUPS_JUNCTION_TABLE))
+        """Bring database schema up to date by applying pending migrations.
 
-            await conn.execute(load_query(__file__, CREATE_RECIPES_TABLE))
-            await conn.execute(load_query(__file__, CREATE_RECIPE_TAGS_TABLE))
+        Runs once per process, later calls are no-ops.
+        """
+        if self._schema_ready:
+            return
+        async with self.get_cursor() as conn:
+            await apply_migrations(conn, load_migrations())
+        self._schema_ready = True
@@ -0,0 +1,52 @@
+CREATE TABLE IF NOT EXISTS users (
+    tg_id BIGINT PRIMARY KEY,
+    username VARCHAR(100) NOT NULL,
+    first_name VARCHAR(100),
+    last_name VARCHAR(100),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS groups (
+    tg_chat_id BIGSERIAL PRIMARY KEY,
+    name VARCHAR(50) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS users_groups(
+    user_id BIGINT REFERENCES users(tg_id),
+    group_id BIGINT REFERENCES groups(tg_chat_id),
+    PRIMARY KEY(user_id, group_id)
+);
+
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'recipe_category') THEN
+        CREATE TYPE recipe_category AS ENUM ('BREAKFAST', 'LUNCH', 'DINNER', 'DESERT', 'COCKTAIL');
+    END IF;
+END$$;
+
+CREATE TABLE IF NOT EXISTS recipes (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    title VARCHAR(50) NOT NULL,
+    ingredients JSONB NOT NULL,
+    steps JSONB NOT NULL,
+    category recipe_category NOT NULL,
+    description TEXT,
+    estimated_time TEXT,
+    servings INTEGER,
+    notes TEXT,
+    link TEXT,
+    tags INTEGER[] DEFAULT '{}',
+
+    user_id BIGINT REFERENCES users (tg_id)
+);
+
+CREATE TABLE IF NOT EXISTS recipe_tag (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(50) NOT NULL,
+
+    group_id BIGINT REFERENCES groups (tg_chat_id),
+    user_id BIGINT REFERENCES users (tg_id)
+
+);
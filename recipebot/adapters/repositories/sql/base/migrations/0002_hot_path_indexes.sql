@@ -0,0 +1,29 @@
+-- Merge duplicate tags created before the unique index existed
+WITH dupes AS (
+    SELECT id, MIN(id) OVER (PARTITION BY user_id, name) AS keep_id
+    FROM recipe_tag
+    WHERE user_id IS NOT NULL
+)
+UPDATE recipes r
+SET tags = ARRAY(
+    SELECT DISTINCT COALESCE(d.keep_id, t.id)
+    FROM unnest(r.tags) AS t(id)
+    LEFT JOIN dupes d ON d.id = t.id
+)
+WHERE EXISTS (
+    SELECT 1 FROM dupes d WHERE d.id = ANY(r.tags) AND d.id <> d.keep_id
+);
+
+DELETE FROM recipe_tag rt
+USING recipe_tag keep
+WHERE rt.user_id = keep.user_id
+  AND rt.name = keep.name
+  AND rt.id > keep.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS recipe_tag_user_id_name_key ON recipe_tag (user_id, name);
+
+-- Recipe lists filter by user and are ordered by (title, id) for keyset pages
+CREATE INDEX IF NOT EXISTS recipes_user_id_title_id_idx ON recipes (user_id, title, id);
+
+-- Tag filters match tag ids against recipes.tags array
+CREATE INDEX IF NOT EXISTS recipes_tags_gin_idx ON recipes USING GIN (tags);
@@ -0,0 +1,12 @@
+-- Full-text search document over title, description, ingredient names and steps
+ALTER TABLE recipes ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+    setweight(
+        to_tsvector('english', jsonb_path_query_array(ingredients, '$[*].name')), 'B'
+    ) ||
+    setweight(to_tsvector('english', steps), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS recipes_search_vector_idx ON recipes USING GIN (search_vector);
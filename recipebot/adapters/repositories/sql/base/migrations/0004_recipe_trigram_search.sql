@@ -0,0 +1,13 @@
+-- Trigram indexes for typo tolerant title and ingredient lookups
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Ingredient names flattened into a single text, e.g. '["egg", "flour"]'.
+-- Trigrams are built from words only, so JSON punctuation doesn't matter
+ALTER TABLE recipes ADD COLUMN IF NOT EXISTS ingredient_names TEXT
+GENERATED ALWAYS AS (jsonb_path_query_array(ingredients, '$[*].name')::text) STORED;
+
+CREATE INDEX IF NOT EXISTS recipes_title_trgm_idx
+ON recipes USING GIN (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS recipes_ingredient_names_trgm_idx
+ON recipes USING GIN (ingredient_names gin_trgm_ops);
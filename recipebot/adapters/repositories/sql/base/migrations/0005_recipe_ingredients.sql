@@ -0,0 +1,20 @@
+-- Canonical ingredient names of every recipe, for ingredient-level lookups
+CREATE TABLE IF NOT EXISTS recipe_ingredients (
+    recipe_id UUID NOT NULL REFERENCES recipes (id) ON DELETE CASCADE,
+    user_id BIGINT NOT NULL REFERENCES users (tg_id),
+    name TEXT NOT NULL,
+    PRIMARY KEY (recipe_id, name)
+);
+
+CREATE INDEX IF NOT EXISTS recipe_ingredients_user_id_name_idx
+ON recipe_ingredients (user_id, name);
+
+-- Backfill, names are canonicalized like canonical_ingredient_name does
+INSERT INTO recipe_ingredients (recipe_id, user_id, name)
+SELECT DISTINCT r.id, r.user_id, lower(regexp_replace(btrim(i.name), '\s+', ' ', 'g'))
+FROM recipes r
+CROSS JOIN LATERAL jsonb_array_elements_text(
+    jsonb_path_query_array(r.ingredients, '$[*].name')
+) AS i(name)
+WHERE r.user_id IS NOT NULL AND btrim(i.name) <> ''
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,9 @@
+-- Telegram bot persistence: user/chat/bot data and conversation states.
+-- Every entry is stored on its own, so only changed entries are written
+CREATE TABLE IF NOT EXISTS bot_persistence (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data BYTEA NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (namespace, key)
+);
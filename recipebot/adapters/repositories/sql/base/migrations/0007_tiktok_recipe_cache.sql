@@ -0,0 +1,11 @@
+-- Parsed TikTok recipes shared by everybody importing the same video
+CREATE TABLE IF NOT EXISTS tiktok_recipe_cache (
+    video_id TEXT PRIMARY KEY,
+    description TEXT,
+    recipe JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS tiktok_recipe_cache_expires_at_idx
+ON tiktok_recipe_cache (expires_at);
@@ -0,0 +1,18 @@
+-- TikTok imports running in background, unfinished jobs are resumed on startup
+CREATE TABLE IF NOT EXISTS recipe_import_jobs (
+    id UUID PRIMARY KEY,
+    user_id BIGINT NOT NULL REFERENCES users(tg_id) ON DELETE CASCADE,
+    chat_id BIGINT NOT NULL,
+    message_id BIGINT NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    recipe JSONB,
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS recipe_import_jobs_unfinished_idx
+ON recipe_import_jobs (created_at)
+WHERE status IN ('queued', 'running');
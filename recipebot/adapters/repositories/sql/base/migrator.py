@@ -0,0 +1,93 @@
+"""Versioned schema migrations.
+
+Migrations are `migrations/<version>_<name>.sql` files applied in version
+order. Applied versions are recorded in `schema_migrations`, so every
+migration runs once per database instead of on every boot.
+"""
+
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+import structlog
+from asyncpg.pool import PoolConnectionProxy
+
+from recipebot.adapters.repositories.sql.base.queries import (
+    CREATE_SCHEMA_MIGRATIONS_TABLE,
+    GET_APPLIED_MIGRATIONS_QUERY,
+    INSERT_APPLIED_MIGRATION_QUERY,
+    LOCK_MIGRATIONS_QUERY,
+)
+from recipebot.adapters.repositories.sql.base.utils import load_query
+
+logger = structlog.get_logger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+MIGRATION_FILE_PATTERN = re.compile(r"^(?P<version>\d+)_(?P<name>\w+)\.sql$")
+# Advisory lock key serializing migrations of replicas starting together
+MIGRATIONS_LOCK_KEY = 7_215_001
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    sql: str
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    """Read migration files ordered by version.
+
+    Raises:
+        ValueError: If a file name doesn't match the pattern or two migrations
+            share a version.
+    """
+    migrations: dict[int, Migration] = {}
+    for path in directory.glob("*.sql"):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            raise ValueError(f"Invalid migration file name: {path.name}")
+        version = int(match["version"])
+        if version in migrations:
+            raise ValueError(f"Duplicate migration version {version}: {path.name}")
+        migrations[version] = Migration(version, match["name"], path.read_text())
+    return [migrations[version] for version in sorted(migrations)]
+
+
+async def apply_migrations(
+    conn: PoolConnectionProxy, migrations: list[Migration]
+) -> list[int]:
+    """Apply pending migrations in a single transaction.
+
+    Returns:
+        Versions applied by this call
+    """
+    applied_now: list[int] = []
+    async with conn.transaction():
+        await conn.execute(
+            load_query(__file__, LOCK_MIGRATIONS_QUERY), MIGRATIONS_LOCK_KEY
+        )
+        await conn.execute(load_query(__file__, CREATE_SCHEMA_MIGRATIONS_TABLE))
+        applied = {
+            row["version"]
+            for row in await conn.fetch(
+                load_query(__file__, GET_APPLIED_MIGRATIONS_QUERY)
+            )
+        }
+
+        for migration in migrations:
+            if migration.version in applied:
+                continue
+            bound_logger = logger.bind(
+                version=migration.version, migration=migration.name
+            )
+            bound_logger.info("Applying migration")
+            await conn.execute(migration.sql)
+            await conn.execute(
+                load_query(__file__, INSERT_APPLIED_MIGRATION_QUERY),
+                migration.version,
+                migration.name,
+            )
+            applied_now.append(migration.version)
+
+    logger.info("Database schema is up to date", applied=applied_now)
+    return applied_now
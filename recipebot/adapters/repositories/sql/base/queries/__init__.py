@@ -1,6 +1,4 @@
-CREATE_USERS_TABLE = "create_users_table"
-CREATE_GROUPS_TABLE = "create_groups_table"
-CREATE_USERS_GROUPS_JUNCTION_TABLE = "create_user_groups_junction_table"
-
-CREATE_RECIPE_TAGS_TABLE = "create_recipe_tags_table"
-CREATE_RECIPES_TABLE = "create_recipes_table"
+LOCK_MIGRATIONS_QUERY = "lock_migrations"
+CREATE_SCHEMA_MIGRATIONS_TABLE = "create_schema_migrations_table"
+GET_APPLIED_MIGRATIONS_QUERY = "get_applied_migrations"
+INSERT_APPLIED_MIGRATION_QUERY = "insert_applied_migration"
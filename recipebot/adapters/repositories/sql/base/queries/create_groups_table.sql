@@ -1,4 +0,0 @@
-CREATE TABLE IF NOT EXISTS groups (
-    tg_chat_id BIGSERIAL PRIMARY KEY,
-    name VARCHAR(50) NOT NULL
-);
@@ -0,0 +1 @@
+SELECT version FROM schema_migrations;
@@ -1,6 +1,84 @@
+import os
+from importlib import import_module
 from pathlib import Path
 
+import structlog
+
+from recipebot.ports.repositories.exceptions import MissingQueryFiles
+
+logger = structlog.get_logger(__name__)
+
+QUERIES_DIR = "queries"
+SQL_ROOT = Path(__file__).parent.parent
+SQL_PACKAGE = __name__.rsplit(".", 2)[0]
+
+
+class QueryRegistry:
+    """SQL text of every `queries/*.sql` file under the sql adapters package.
+
+    Files are read once at startup, so repositories don't touch the disk on
+    the event loop. Returning the very same string for every call also lets
+    asyncpg statement cache reuse the prepared statement of each pooled
+    connection.
+    """
+
+    def __init__(self, root: Path = SQL_ROOT, package: str = SQL_PACKAGE) -> None:
+        self._root = root
+        self._package = package
+        # (repository dir, query name) -> sql text
+        self._queries: dict[tuple[str, str], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def load(self) -> None:
+        """Read all query files and check every declared query has a file.
+
+        Raises:
+            MissingQueryFiles: If a query name declared in some
+                `queries/__init__.py` has no matching .sql file.
+        """
+        for path in self._root.rglob(f"{QUERIES_DIR}/**/*.sql"):
+            queries_dir = next(p for p in path.parents if p.name == QUERIES_DIR)
+            name = path.relative_to(queries_dir).with_suffix("").as_posix()
+            self._queries[(str(queries_dir.parent), name)] = path.read_text()
+
+        missing = [
+            f"{queries_dir / name}.sql"
+            for queries_dir, name in self._declared_queries()
+            if (str(queries_dir.parent), name) not in self._queries
+        ]
+        if missing:
+            raise MissingQueryFiles(missing)
+
+        logger.info("Loaded SQL queries", count=len(self._queries))
+
+    def get(self, base_file: str, name: str) -> str:
+        """Get query text declared next to `base_file`."""
+        key = (os.path.dirname(base_file), name)
+        try:
+            return self._queries[key]
+        except KeyError:
+            # Registry wasn't loaded (e.g. one-off scripts), read lazily once
+            query = (Path(key[0]) / QUERIES_DIR / f"{name}.sql").read_text()
+            return self._queries.setdefault(key, query)
+
+    def _declared_queries(self) -> list[tuple[Path, str]]:
+        declared: list[tuple[Path, str]] = []
+        for init_file in self._root.rglob(f"{QUERIES_DIR}/__init__.py"):
+            queries_dir = init_file.parent
+            module_parts = queries_dir.relative_to(self._root).parts
+            module = import_module(".".join((self._package, *module_parts)))
+            declared.extend(
+                (queries_dir, value)
+                for attr, value in vars(module).items()
+                if attr.isupper() and isinstance(value, str)
+            )
+        return declared
+
+
+QUERY_REGISTRY = QueryRegistry()
+
 
 def load_query(base_file: str, name: str) -> str:
-    sql_dir = Path(base_file).parent / "queries"
-    return (sql_dir / f"{name}.sql").read_text()
+    return QUERY_REGISTRY.get(base_file, name)
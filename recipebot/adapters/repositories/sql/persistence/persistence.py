@@ -0,0 +1,268 @@
+import asyncio
+import hashlib
+import pickle  # nosec B403  # only rows written by the bot are unpickled
+import time
+from enum import StrEnum
+from typing import Any
+
+import orjson
+import structlog
+from telegram.ext import BasePersistence, PersistenceInput
+from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey
+
+from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
+from recipebot.adapters.repositories.sql.base.utils import load_query
+from recipebot.adapters.repositories.sql.persistence.queries import (
+    DELETE_PERSISTENCE_ENTRY_QUERY,
+    GET_PERSISTENCE_ENTRIES_QUERY,
+    GET_PERSISTENCE_ENTRY_QUERY,
+    UPSERT_PERSISTENCE_ENTRY_QUERY,
+)
+from recipebot.config import settings
+from recipebot.config.config import PersistenceSettings
+from recipebot.metrics.persistence import (
+    PERSISTENCE_BYTES_WRITTEN,
+    PERSISTENCE_ENTRIES_UNCHANGED,
+    PERSISTENCE_ENTRIES_WRITTEN,
+    PERSISTENCE_FLUSH_SECONDS,
+)
+
+logger = structlog.get_logger(__name__)
+
+# (namespace, key)
+type EntryKey = tuple[str, str]
+
+# Key of single-entry namespaces (bot_data, callback_data)
+SINGLE_ENTRY_KEY = ""
+
+
+class PersistenceNamespace(StrEnum):
+    USER_DATA = "user_data"
+    CHAT_DATA = "chat_data"
+    BOT_DATA = "bot_data"
+    CALLBACK_DATA = "callback_data"
+    CONVERSATION = "conversation"
+
+
+def _conversation_namespace(name: str) -> str:
+    return f"{PersistenceNamespace.CONVERSATION}:{name}"
+
+
+def _metric_namespace(namespace: str) -> str:
+    """Conversation namespaces are reported without the conversation name."""
+    return namespace.partition(":")[0]
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class AsyncpgPersistence(
+    BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any, Any]]
+):
+    """Bot persistence storing every user/chat/conversation entry as its own row.
+
+    Unlike PicklePersistence, which rewrites one file with everybody's data,
+    only entries that actually changed since they were last written are
+    upserted, batched in one transaction per flush.
+
+    User and chat data are loaded lazily: `get_user_data`/`get_chat_data`
+    return nothing at startup and each entry is read on the first update of
+    its user or chat through `refresh_user_data`/`refresh_chat_data`.
+    Conversation states and bot data are small and loaded at startup.
+
+    Application loads persistence before `post_init`, so the shared pool is
+    initialized and migrated here on first use.
+    """
+
+    def __init__(
+        self,
+        conn: AsyncpgConnection,
+        cfg: PersistenceSettings = settings.PERSISTENCE,
+        store_data: PersistenceInput | None = None,
+    ) -> None:
+        super().__init__(store_data=store_data, update_interval=cfg.update_interval)
+        self.conn = conn
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
+        # Entries read from the database (or found missing) by refresh_*
+        self._loaded: set[EntryKey] = set()
+        # Digest of the data last written or loaded for every entry
+        self._written: dict[EntryKey, bytes] = {}
+        # Entries to write on the next flush, None means delete
+        self._pending: dict[EntryKey, bytes | None] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def get_user_data(self) -> dict[int, dict[Any, Any]]:
+        await self._ensure_ready()
+        return {}
+
+    async def get_chat_data(self) -> dict[int, dict[Any, Any]]:
+        await self._ensure_ready()
+        return {}
+
+    async def get_bot_data(self) -> dict[Any, Any]:
+        return await self._load(PersistenceNamespace.BOT_DATA, SINGLE_ENTRY_KEY) or {}
+
+    async def get_callback_data(self) -> CDCData | None:
+        return await self._load(PersistenceNamespace.CALLBACK_DATA, SINGLE_ENTRY_KEY)
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        namespace = _conversation_namespace(name)
+        await self._ensure_ready()
+        async with self.conn.get_cursor() as conn:
+            rows = await conn.fetch(
+                load_query(__file__, GET_PERSISTENCE_ENTRIES_QUERY), namespace
+            )
+        conversations: ConversationDict = {}
+        for row in rows:
+            self._written[(namespace, row["key"])] = _digest(row["data"])
+            # Rows are written by the bot itself, never by users
+            state = pickle.loads(row["data"])  # nosec B301
+            conversations[tuple(orjson.loads(row["key"]))] = state
+        logger.info(
+            "Loaded persisted conversations", name=name, count=len(conversations)
+        )
+        return conversations
+
+    async def update_conversation(
+        self, name: str, key: ConversationKey, new_state: object | None
+    ) -> None:
+        await self._write(
+            _conversation_namespace(name),
+            orjson.dumps(list(key)).decode("utf-8"),
+            new_state,
+        )
+
+    async def update_user_data(self, user_id: int, data: dict[Any, Any]) -> None:
+        await self._write(PersistenceNamespace.USER_DATA, str(user_id), data)
+
+    async def update_chat_data(self, chat_id: int, data: dict[Any, Any]) -> None:
+        await self._write(PersistenceNamespace.CHAT_DATA, str(chat_id), data)
+
+    async def update_bot_data(self, data: dict[Any, Any]) -> None:
+        await self._write(PersistenceNamespace.BOT_DATA, SINGLE_ENTRY_KEY, data)
+
+    async def update_callback_data(self, data: CDCData) -> None:
+        await self._write(PersistenceNamespace.CALLBACK_DATA, SINGLE_ENTRY_KEY, data)
+
+    async def drop_user_data(self, user_id: int) -> None:
+        await self._write(PersistenceNamespace.USER_DATA, str(user_id), None)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        await self._write(PersistenceNamespace.CHAT_DATA, str(chat_id), None)
+
+    async def refresh_user_data(self, user_id: int, user_data: dict[Any, Any]) -> None:
+        await self._refresh(PersistenceNamespace.USER_DATA, str(user_id), user_data)
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict[Any, Any]) -> None:
+        await self._refresh(PersistenceNamespace.CHAT_DATA, str(chat_id), chat_data)
+
+    async def refresh_bot_data(self, bot_data: dict[Any, Any]) -> None:
+        # Loaded at startup, in-memory bot_data is authoritative afterwards
+        pass
+
+    async def flush(self) -> None:
+        """Write all pending entries, called by Application on shutdown."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if self._pending:
+            await self._flush_pending()
+
+    async def _ensure_ready(self) -> None:
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if not self._ready:
+                await self.conn.init_pool()
+                await self.conn.init_db()
+                self._ready = True
+
+    async def _load(self, namespace: str, key: str) -> Any | None:
+        await self._ensure_ready()
+        async with self.conn.get_cursor() as conn:
+            data = await conn.fetchval(
+                load_query(__file__, GET_PERSISTENCE_ENTRY_QUERY), namespace, key
+            )
+        if data is None:
+            return None
+        self._written[(namespace, key)] = _digest(data)
+        # Rows are written by the bot itself, never by users
+        return pickle.loads(data)  # nosec B301
+
+    async def _refresh(self, namespace: str, key: str, data: dict[Any, Any]) -> None:
+        """Fill in-memory data of a user or chat on its first update."""
+        entry_key = (namespace, key)
+        if entry_key in self._loaded:
+            return
+        stored = await self._load(namespace, key)
+        if stored:
+            data.update(stored)
+        self._loaded.add(entry_key)
+
+    async def _write(self, namespace: str, key: str, value: Any | None) -> None:
+        """Queue entry for the shared flush if it changed and wait for the flush.
+
+        Application updates all changed entries concurrently, so they end up
+        queued before the flush task starts and are written in one batch.
+        """
+        entry_key = (namespace, key)
+        data = (
+            None
+            if value is None
+            else pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        if (
+            data is not None
+            and entry_key not in self._pending
+            and self._written.get(entry_key) == _digest(data)
+        ):
+            PERSISTENCE_ENTRIES_UNCHANGED.labels(_metric_namespace(namespace)).inc()
+            return
+
+        self._pending[entry_key] = data
+        if data is None:
+            self._loaded.discard(entry_key)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        await asyncio.shield(self._flush_task)
+
+    async def _flush_pending(self) -> None:
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            upserts = [
+                (*key, data) for key, data in pending.items() if data is not None
+            ]
+            deletes = [key for key, data in pending.items() if data is None]
+
+            bound_logger = logger.bind(upserts=len(upserts), deletes=len(deletes))
+            started = time.perf_counter()
+            try:
+                async with self.conn.transaction() as conn:
+                    if upserts:
+                        await conn.executemany(
+                            load_query(__file__, UPSERT_PERSISTENCE_ENTRY_QUERY),
+                            upserts,
+                        )
+                    if deletes:
+                        await conn.executemany(
+                            load_query(__file__, DELETE_PERSISTENCE_ENTRY_QUERY),
+                            deletes,
+                        )
+            except Exception as exc:
+                bound_logger.exception("Error flushing persistence", exc_info=True)
+                # Retry on the next flush unless newer data was queued meanwhile
+                self._pending = pending | self._pending
+                raise exc
+            finally:
+                PERSISTENCE_FLUSH_SECONDS.observe(time.perf_counter() - started)
+
+            for (namespace, key), data in pending.items():
+                metric_namespace = _metric_namespace(namespace)
+                PERSISTENCE_ENTRIES_WRITTEN.labels(metric_namespace).inc()
+                if data is None:
+                    self._written.pop((namespace, key), None)
+                else:
+                    self._written[(namespace, key)] = _digest(data)
+                    PERSISTENCE_BYTES_WRITTEN.labels(metric_namespace).inc(len(data))
+            bound_logger.debug("Flushed persistence")
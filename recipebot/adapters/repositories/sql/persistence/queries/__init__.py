@@ -0,0 +1,4 @@
+GET_PERSISTENCE_ENTRY_QUERY = "get_persistence_entry"
+GET_PERSISTENCE_ENTRIES_QUERY = "get_persistence_entries"
+UPSERT_PERSISTENCE_ENTRY_QUERY = "upsert_persistence_entry"
+DELETE_PERSISTENCE_ENTRY_QUERY = "delete_persistence_entry"
@@ -0,0 +1 @@
+DELETE FROM bot_persistence WHERE namespace = $1 AND key = $2;
@@ -0,0 +1 @@
+SELECT key, data FROM bot_persistence WHERE namespace = $1;
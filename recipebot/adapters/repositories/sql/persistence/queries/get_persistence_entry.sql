@@ -0,0 +1 @@
+SELECT data FROM bot_persistence WHERE namespace = $1 AND key = $2;
@@ -0,0 +1,4 @@
+INSERT INTO bot_persistence (namespace, key, data)
+VALUES ($1, $2, $3)
+ON CONFLICT (namespace, key) DO UPDATE
+SET data = EXCLUDED.data, updated_at = NOW();
@@ -3,8 +3,12 @@ GET_RECIPE_BY_ID_QUERY = "get_recipe_by_id"
 UPDATE_RECIPE_QUERY = "update_recipe"
 DELETE_RECIPE_QUERY = "delete_recipe"
 SEARCH_RECIPES_FILTERED_QUERY = "search_recipes_filtered"
-
-# Tag queries
-GET_USER_TAGS_QUERY = "tags/get_user_tags"
-CREATE_TAG_QUERY = "tags/create_tag"
-FIND_EXISTING_TAG_QUERY = "tags/find_existing_tag"
+SEARCH_RECIPE_SUMMARIES_PAGE_AFTER_QUERY = "search_recipe_summaries_page_after"
+SEARCH_RECIPE_SUMMARIES_PAGE_BEFORE_QUERY = "search_recipe_summaries_page_before"
+SEARCH_RECIPE_SUMMARIES_RANKED_QUERY = "search_recipe_summaries_ranked"
+COUNT_RECIPES_FILTERED_QUERY = "count_recipes_filtered"
+FUZZY_SEARCH_RECIPE_SUMMARIES_QUERY = "fuzzy_search_recipe_summaries"
+SET_WORD_SIMILARITY_THRESHOLD_QUERY = "set_word_similarity_threshold"
+INSERT_RECIPE_INGREDIENTS_QUERY = "insert_recipe_ingredients"
+DELETE_RECIPE_INGREDIENTS_QUERY = "delete_recipe_ingredients"
+SEARCH_RECIPE_SUMMARIES_BY_INGREDIENTS_QUERY = "search_recipe_summaries_by_ingredients"
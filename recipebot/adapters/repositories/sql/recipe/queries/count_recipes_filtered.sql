@@ -0,0 +1,9 @@
+SELECT COUNT(*)
+FROM recipes r
+WHERE r.user_id = $1
+  AND ($2::text[] IS NULL OR array_length($2::text[], 1) IS NULL OR r.tags && ARRAY(
+        SELECT ft.id FROM recipe_tag ft
+        WHERE ft.user_id = $1 AND ft.name = ANY($2::text[])
+  ))
+  AND ($3::text[] IS NULL OR array_length($3::text[], 1) IS NULL OR r.category = ANY($3::recipe_category[]))
+  AND ($4::text IS NULL OR r.search_vector @@ websearch_to_tsquery('english', $4));
@@ -0,0 +1 @@
+DELETE FROM recipe_ingredients WHERE recipe_id = $1;
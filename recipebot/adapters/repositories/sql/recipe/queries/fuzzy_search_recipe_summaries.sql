@@ -0,0 +1,20 @@
+SELECT m.id, m.title, m.category, t.tag_names
+FROM (
+    SELECT r.id, r.title, r.category, r.tags,
+        GREATEST(
+            word_similarity($2::text, r.title),
+            word_similarity($2::text, r.ingredient_names)
+        ) AS similarity
+    FROM recipes r
+    WHERE r.user_id = $1
+      -- <% uses pg_trgm.word_similarity_threshold and the trigram indexes
+      AND ($2::text <% r.title OR $2::text <% r.ingredient_names)
+    ORDER BY similarity DESC, r.title, r.id
+    LIMIT $3
+) m
+LEFT JOIN LATERAL (
+    SELECT ARRAY_AGG(rt.name ORDER BY rt.name) AS tag_names
+    FROM recipe_tag rt
+    WHERE rt.id = ANY(m.tags)
+) t ON TRUE
+ORDER BY m.similarity DESC, m.title, m.id;
@@ -1,8 +1,10 @@
 SELECT r.id, r.title, r.ingredients, r.steps, r.category,
        r.description, r.estimated_time, r.servings, r.notes, r.link, r.user_id,
-       ARRAY_AGG(rt.name) FILTER (WHERE rt.name IS NOT NULL) as tag_names
+       t.tag_names
 FROM recipes r
-LEFT JOIN recipe_tag rt ON rt.id = ANY(r.tags)
-WHERE r.id = $1
-GROUP BY r.id, r.title, r.ingredients, r.steps, r.category,
-         r.description, r.estimated_time, r.servings, r.notes, r.link, r.user_id;
+LEFT JOIN LATERAL (
+    SELECT ARRAY_AGG(rt.name ORDER BY rt.name) AS tag_names
+    FROM recipe_tag rt
+    WHERE rt.id = ANY(r.tags)
+) t ON TRUE
+WHERE r.id = $1;
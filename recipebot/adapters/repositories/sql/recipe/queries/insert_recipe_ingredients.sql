@@ -0,0 +1,3 @@
+INSERT INTO recipe_ingredients (recipe_id, user_id, name)
+SELECT $1, $2, name FROM unnest($3::text[]) AS name
+ON CONFLICT DO NOTHING;
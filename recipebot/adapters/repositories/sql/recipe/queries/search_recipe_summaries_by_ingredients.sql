@@ -0,0 +1,22 @@
+SELECT p.id, p.title, p.category, t.tag_names, p.matched, p.total
+FROM (
+    SELECT r.id, r.title, r.category, r.tags, m.matched, m.total
+    FROM (
+        SELECT ri.recipe_id, COUNT(*) AS matched, (
+            SELECT COUNT(*) FROM recipe_ingredients a WHERE a.recipe_id = ri.recipe_id
+        ) AS total
+        FROM recipe_ingredients ri
+        WHERE ri.user_id = $1 AND ri.name = ANY($2::text[])
+        GROUP BY ri.recipe_id
+    ) m
+    JOIN recipes r ON r.id = m.recipe_id
+    -- Most matched ingredients first, then fewest missing ones
+    ORDER BY m.matched DESC, m.total - m.matched, r.title, r.id
+    LIMIT $3
+) p
+LEFT JOIN LATERAL (
+    SELECT ARRAY_AGG(rt.name ORDER BY rt.name) AS tag_names
+    FROM recipe_tag rt
+    WHERE rt.id = ANY(p.tags)
+) t ON TRUE
+ORDER BY p.matched DESC, p.total - p.matched, p.title, p.id;
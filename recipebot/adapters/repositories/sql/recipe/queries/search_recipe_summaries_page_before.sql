@@ -0,0 +1,18 @@
+SELECT r.id, r.title, r.category, t.tag_names
+FROM recipes r
+LEFT JOIN LATERAL (
+    SELECT ARRAY_AGG(rt.name ORDER BY rt.name) AS tag_names
+    FROM recipe_tag rt
+    WHERE rt.id = ANY(r.tags)
+) t ON TRUE
+WHERE r.user_id = $1
+  AND ($2::text[] IS NULL OR array_length($2::text[], 1) IS NULL OR r.tags && ARRAY(
+        SELECT ft.id FROM recipe_tag ft
+        WHERE ft.user_id = $1 AND ft.name = ANY($2::text[])
+  ))
+  AND ($3::text[] IS NULL OR array_length($3::text[], 1) IS NULL OR r.category = ANY($3::recipe_category[]))
+  AND (r.title, r.id) < (
+        SELECT c.title, c.id FROM recipes c WHERE c.id = $4 AND c.user_id = $1
+  )
+ORDER BY r.title DESC, r.id DESC
+LIMIT $5;
@@ -1,11 +1,18 @@
-SELECT DISTINCT r.id, r.title, r.ingredients, r.steps, r.category,
+SELECT r.id, r.title, r.ingredients, r.steps, r.category,
        r.description, r.estimated_time, r.servings, r.notes, r.link, r.user_id,
-       ARRAY_AGG(rt.name) FILTER (WHERE rt.name IS NOT NULL) as tag_names
+       t.tag_names
 FROM recipes r
-LEFT JOIN recipe_tag rt ON rt.id = ANY(r.tags)
+LEFT JOIN LATERAL (
+    SELECT ARRAY_AGG(rt.name ORDER BY rt.name) AS tag_names
+    FROM recipe_tag rt
+    WHERE rt.id = ANY(r.tags)
+) t ON TRUE
 WHERE r.user_id = $1
-  AND ($2::text[] IS NULL OR array_length($2::text[], 1) IS NULL OR rt.name = ANY($2))
+  -- Tag names are resolved to ids once (InitPlan), so the overlap can use the GIN index
+  AND ($2::text[] IS NULL OR array_length($2::text[], 1) IS NULL OR r.tags && ARRAY(
+        SELECT ft.id FROM recipe_tag ft
+        WHERE ft.user_id = $1 AND ft.name = ANY($2::text[])
+  ))
   AND ($3::text[] IS NULL OR array_length($3::text[], 1) IS NULL OR r.category = ANY($3::recipe_category[]))
-GROUP BY r.id, r.title, r.ingredients, r.steps, r.category,
-         r.description, r.estimated_time, r.servings, r.notes, r.link, r.user_id
-ORDER BY r.title;
+  AND ($4::text IS NULL OR r.search_vector @@ websearch_to_tsquery('english', $4))
+ORDER BY r.title, r.id;
@@ -0,0 +1 @@
+SELECT set_config('pg_trgm.word_similarity_threshold', $1::text, true);
@@ -9,10 +9,12 @@ class RecipeFilters(BaseModel):
     user_id: int
     tag_names: list[str] | None = None
     category_names: list[str] | None = None
+    # Free-text search over title, description, ingredient names and steps
+    query: str | None = None
 
     def has_filters(self) -> bool:
         """Check if any filters are applied."""
-        return bool(self.tag_names or self.category_names)
+        return bool(self.tag_names or self.category_names or self.query)
 
     def __str__(self) -> str:
         """String representation of the filters."""
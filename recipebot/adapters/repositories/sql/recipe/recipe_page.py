@@ -0,0 +1,130 @@
+"""Keyset pagination primitives for recipe queries."""
+
+from enum import StrEnum
+from typing import Protocol
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from recipebot.config import settings
+
+
+class _IdentifiableRow(Protocol):
+    @property
+    def id(self) -> UUID: ...
+
+
+class PageDirection(StrEnum):
+    """Which side of the cursor row the requested page lies on."""
+
+    AFTER = "a"
+    BEFORE = "b"
+
+
+class PageCursor(BaseModel):
+    """Keyset cursor pointing at a boundary row of a (title, id) ordered page."""
+
+    recipe_id: UUID
+    direction: PageDirection = PageDirection.AFTER
+
+    def encode(self) -> str:
+        """Encode cursor compactly to fit into Telegram callback data (64 bytes)."""
+        return f"{self.direction}{self.recipe_id.hex}"
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor | None":
+        """Decode cursor produced by `encode`, returns None if token is invalid."""
+        if not token:
+            return None
+        try:
+            return cls(direction=PageDirection(token[0]), recipe_id=UUID(token[1:]))
+        except ValueError:
+            return None
+
+
+class PageRequest(BaseModel):
+    """Requested page of recipes.
+
+    If cursor is not provided, the page is resolved with OFFSET from page number.
+    """
+
+    page: int = 1
+    page_size: int = Field(default_factory=lambda: settings.APP.recipe_page_size)
+    cursor: PageCursor | None = None
+
+    @property
+    def offset(self) -> int:
+        return (max(self.page, 1) - 1) * self.page_size
+
+    def clamp(self, total_items: int) -> "PageRequest":
+        """Return a copy with page number limited to the available pages."""
+        total_pages = max((total_items + self.page_size - 1) // self.page_size, 1)
+        return self.model_copy(update={"page": min(max(self.page, 1), total_pages)})
+
+
+class RecipePage[T: _IdentifiableRow]:
+    """Single page of recipes fetched from the repository.
+
+    Exposes the same navigation interface as PaginatedResult, so it can be
+    passed to create_paginated_keyboard directly. Pages not ordered by
+    (title, id), e.g. ranked search results, are created with keyset=False
+    and navigate by page number only.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        items: list[T],
+        page: int,
+        page_size: int,
+        total_items: int,
+        *,
+        item_type: str = "recipes",
+        keyset: bool = True,
+    ):
+        self.items = items
+        self.keyset = keyset
+        self.page_size = page_size
+        self.total_items = total_items
+        self.item_type = item_type
+
+        self.total_pages = (self.total_items + self.page_size - 1) // self.page_size
+        self.page = min(max(page, 1), max(self.total_pages, 1))
+
+    @property
+    def current_page_items(self) -> list[T]:
+        """Items of the current page (already limited by the query)."""
+        return self.items
+
+    @property
+    def has_previous(self) -> bool:
+        """Check if there's a previous page."""
+        return self.page > 1 and bool(self.items)
+
+    @property
+    def has_next(self) -> bool:
+        """Check if there's a next page."""
+        return self.page < self.total_pages and bool(self.items)
+
+    @property
+    def previous_cursor(self) -> PageCursor | None:
+        """Cursor to fetch the previous page (rows before the first item)."""
+        if not (self.keyset and self.has_previous):
+            return None
+        return PageCursor(recipe_id=self.items[0].id, direction=PageDirection.BEFORE)
+
+    @property
+    def next_cursor(self) -> PageCursor | None:
+        """Cursor to fetch the next page (rows after the last item)."""
+        if not (self.keyset and self.has_next):
+            return None
+        return PageCursor(recipe_id=self.items[-1].id, direction=PageDirection.AFTER)
+
+    def get_page_info_text(self) -> str:
+        """Get page information text."""
+        if self.total_pages <= 1:
+            return f"Total: {self.total_items} {self.item_type}"
+
+        return (
+            f"Page {self.page}/{self.total_pages} "
+            f"(showing {len(self.items)} of {self.total_items} {self.item_type})"
+        )
@@ -2,18 +2,42 @@ from uuid import UUID
 
 import orjson
 import structlog
+from asyncpg import Record
+from asyncpg.pool import PoolConnectionProxy
 
 from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
 from recipebot.adapters.repositories.sql.base.utils import load_query
 from recipebot.adapters.repositories.sql.recipe.queries import (
+    COUNT_RECIPES_FILTERED_QUERY,
+    DELETE_RECIPE_INGREDIENTS_QUERY,
     DELETE_RECIPE_QUERY,
+    FUZZY_SEARCH_RECIPE_SUMMARIES_QUERY,
     GET_RECIPE_BY_ID_QUERY,
+    INSERT_RECIPE_INGREDIENTS_QUERY,
     INSERT_RECIPE_QUERY,
+    SEARCH_RECIPE_SUMMARIES_BY_INGREDIENTS_QUERY,
+    SEARCH_RECIPE_SUMMARIES_PAGE_AFTER_QUERY,
+    SEARCH_RECIPE_SUMMARIES_PAGE_BEFORE_QUERY,
+    SEARCH_RECIPE_SUMMARIES_RANKED_QUERY,
     SEARCH_RECIPES_FILTERED_QUERY,
+    SET_WORD_SIMILARITY_THRESHOLD_QUERY,
     UPDATE_RECIPE_QUERY,
 )
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
-from recipebot.domain.recipe.recipe import Recipe
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageDirection,
+    PageRequest,
+    RecipePage,
+)
+from recipebot.config import settings
+from recipebot.config.config import FuzzySearchSettings
+from recipebot.domain.recipe.recipe import (
+    Recipe,
+    RecipeCategory,
+    RecipeIngredientMatch,
+    RecipeSummary,
+    canonical_ingredient_name,
+)
 from recipebot.ports.repositories.exceptions import RecipeNotFound, RepositoryException
 from recipebot.ports.repositories.recipe_repository import RecipeRepositoryABC
 from recipebot.ports.repositories.recipe_tag_repository import RecipeTagRepositoryABC
@@ -23,26 +47,22 @@ logger: structlog.BoundLogger = structlog.get_logger(__name__)
 
 class RecipeAsyncpgRepo(RecipeRepositoryABC):
     def __init__(
-        self, conn: AsyncpgConnection, tag_repo: RecipeTagRepositoryABC
+        self,
+        conn: AsyncpgConnection,
+        tag_repo: RecipeTagRepositoryABC,
+        fuzzy_cfg: FuzzySearchSettings = settings.FUZZY_SEARCH,
     ) -> None:
         self.conn = conn
         self.tag_repo = tag_repo
+        self.fuzzy_cfg = fuzzy_cfg
 
     async def add(self, recipe_data: Recipe) -> Recipe:
         try:
             bound_logger = logger.bind(recipe_id=recipe_data.id)
             bound_logger.info("Adding recipe")
 
-            # Convert tag names to tag IDs for database storage
-            tag_ids = []
-            if recipe_data.tags:
-                for tag_name in recipe_data.tags:
-                    tag = await self.tag_repo.get_or_create_tag(
-                        tag_name, recipe_data.user_id
-                    )
-                    tag_ids.append(tag.id)
-
-            async with self.conn.get_cursor() as conn:
+            async with self.conn.transaction() as conn:
+                tag_ids = await self._resolve_tag_ids(recipe_data)
                 row = await conn.fetchrow(
                     load_query(__file__, INSERT_RECIPE_QUERY),
                     recipe_data.id,
@@ -65,10 +85,10 @@ class RecipeAsyncpgRepo(RecipeRepositoryABC):
                 )
                 if not row:
                     raise RepositoryException("Recipe not created")
+                await self._insert_ingredient_names(conn, row["id"], recipe_data)
 
-                # Get the created recipe with proper tag names
-                recipe_id = row["id"]
-                return await self.get(recipe_id)
+            # Everything but the id is already known, no need to read it back
+            return self._saved_recipe(recipe_data, row["id"])
         except Exception as exc:
             bound_logger.exception("Error adding recipe", exc_info=True)
             raise exc
@@ -87,26 +107,7 @@ class RecipeAsyncpgRepo(RecipeRepositoryABC):
                 if not row:
                     raise RecipeNotFound(recipe_id=id)
 
-            # Convert tag_names array to list of strings for display
-            row_dict = dict(row)
-            if row_dict.get("tag_names"):
-                row_dict["tags"] = [
-                    tag for tag in row_dict["tag_names"] if tag is not None
-                ]
-            else:
-                row_dict["tags"] = []
-
-            # Convert ingredients JSONB back to list of Ingredient objects
-            if row_dict.get("ingredients"):
-                ingredients_data = orjson.loads(row_dict["ingredients"])
-                row_dict["ingredients"] = ingredients_data
-
-            # Convert steps JSONB back to list of strings
-            if row_dict.get("steps"):
-                steps_data = orjson.loads(row_dict["steps"])
-                row_dict["steps"] = steps_data
-
-            return Recipe.model_validate(row_dict)
+            return self._row_to_recipe(row)
         except Exception as exc:
             bound_logger.exception("Error getting recipe", exc_info=True)
             raise exc
@@ -123,50 +124,232 @@ class RecipeAsyncpgRepo(RecipeRepositoryABC):
                     filters.user_id,
                     filters.tag_names,
                     filters.category_names,
+                    filters.query,
                 )
 
-            recipes = []
-            for row in result:
-                row_dict = dict(row)
-                if row_dict.get("tag_names"):
-                    row_dict["tags"] = [
-                        tag for tag in row_dict["tag_names"] if tag is not None
-                    ]
-                else:
-                    row_dict["tags"] = []
-
-                # Convert ingredients JSONB back to list of Ingredient objects
-                if row_dict.get("ingredients"):
-                    ingredients_data = orjson.loads(row_dict["ingredients"])
-                    row_dict["ingredients"] = ingredients_data
-
-                # Convert steps JSONB back to list of strings
-                if row_dict.get("steps"):
-                    steps_data = orjson.loads(row_dict["steps"])
-                    row_dict["steps"] = steps_data
-
-                recipes.append(Recipe.model_validate(row_dict))
-
-            return recipes
+            return [self._row_to_recipe(row) for row in result]
         except Exception as exc:
             bound_logger.exception("Error listing recipes", exc_info=True)
             raise exc
 
+    async def list_summaries(
+        self, filters: RecipeFilters, page: PageRequest
+    ) -> RecipePage[RecipeSummary]:
+        """List a single page of recipe summaries ordered by (title, id).
+
+        Only id, title, category and tag names are selected. Uses keyset
+        pagination when page cursor is provided and falls back to OFFSET
+        otherwise, so only one page of rows leaves the database.
+        Free-text search results are ordered by rank and paginated by OFFSET.
+        """
+        try:
+            bound_logger = logger.bind(
+                filters=filters.model_dump_json(), page=page.model_dump_json()
+            )
+            bound_logger.info("Listing recipe summaries")
+
+            async with self.conn.get_cursor() as conn:
+                total_items = await conn.fetchval(
+                    load_query(__file__, COUNT_RECIPES_FILTERED_QUERY),
+                    filters.user_id,
+                    filters.tag_names,
+                    filters.category_names,
+                    filters.query,
+                )
+                page = page.clamp(total_items)
+                rows = (
+                    await self._fetch_page_rows(conn, filters, page)
+                    if total_items
+                    else []
+                )
+
+            return RecipePage(
+                [self._row_to_summary(row) for row in rows],
+                page.page,
+                page.page_size,
+                total_items,
+                keyset=not filters.query,
+            )
+        except Exception as exc:
+            bound_logger.exception("Error listing recipe summaries", exc_info=True)
+            raise exc
+
+    async def fuzzy_search(self, user_id: int, query: str) -> list[RecipeSummary]:
+        """Find up to top_k recipes with title or ingredients similar to query.
+
+        Matching uses pg_trgm word similarity through the trigram indexes,
+        the threshold is set for the current transaction only.
+        """
+        try:
+            bound_logger = logger.bind(user_id=user_id, query=query)
+            bound_logger.info("Fuzzy searching recipes")
+
+            async with self.conn.transaction() as conn:
+                await conn.execute(
+                    load_query(__file__, SET_WORD_SIMILARITY_THRESHOLD_QUERY),
+                    str(self.fuzzy_cfg.similarity_threshold),
+                )
+                rows = await conn.fetch(
+                    load_query(__file__, FUZZY_SEARCH_RECIPE_SUMMARIES_QUERY),
+                    user_id,
+                    query,
+                    self.fuzzy_cfg.top_k,
+                )
+
+            return [self._row_to_summary(row) for row in rows]
+        except Exception as exc:
+            bound_logger.exception("Error fuzzy searching recipes", exc_info=True)
+            raise exc
+
+    async def list_by_ingredients(
+        self, user_id: int, ingredient_names: list[str], limit: int = 10
+    ) -> list[RecipeIngredientMatch]:
+        """List recipes ranked by how many of the given ingredients they use.
+
+        Matching goes through the recipe_ingredients (user_id, name) index,
+        so only recipes sharing at least one ingredient are read.
+        """
+        try:
+            bound_logger = logger.bind(
+                user_id=user_id, ingredient_names=ingredient_names
+            )
+            bound_logger.info("Listing recipes by ingredients")
+
+            names = list(
+                dict.fromkeys(map(canonical_ingredient_name, ingredient_names))
+            )
+            async with self.conn.get_cursor() as conn:
+                rows = await conn.fetch(
+                    load_query(__file__, SEARCH_RECIPE_SUMMARIES_BY_INGREDIENTS_QUERY),
+                    user_id,
+                    names,
+                    limit,
+                )
+
+            return [
+                RecipeIngredientMatch(
+                    self._row_to_summary(row), row["matched"], row["total"]
+                )
+                for row in rows
+            ]
+        except Exception as exc:
+            bound_logger.exception(
+                "Error listing recipes by ingredients", exc_info=True
+            )
+            raise exc
+
+    async def _fetch_page_rows(
+        self, conn: PoolConnectionProxy, filters: RecipeFilters, page: PageRequest
+    ) -> list[Record]:
+        filter_args = (filters.user_id, filters.tag_names, filters.category_names)
+        cursor = page.cursor
+
+        if filters.query:
+            return await conn.fetch(
+                load_query(__file__, SEARCH_RECIPE_SUMMARIES_RANKED_QUERY),
+                *filter_args,
+                filters.query,
+                page.page_size,
+                page.offset,
+            )
+
+        if cursor and cursor.direction == PageDirection.BEFORE:
+            rows = await conn.fetch(
+                load_query(__file__, SEARCH_RECIPE_SUMMARIES_PAGE_BEFORE_QUERY),
+                *filter_args,
+                cursor.recipe_id,
+                page.page_size,
+            )
+            rows.reverse()
+        else:
+            rows = await conn.fetch(
+                load_query(__file__, SEARCH_RECIPE_SUMMARIES_PAGE_AFTER_QUERY),
+                *filter_args,
+                cursor.recipe_id if cursor else None,
+                page.page_size,
+                0 if cursor else page.offset,
+            )
+
+        if cursor and not rows:
+            # Cursor row was deleted or moved, resolve the page by its number
+            return await self._fetch_page_rows(
+                conn, filters, page.model_copy(update={"cursor": None})
+            )
+        return rows
+
+    @staticmethod
+    def _row_to_summary(row: Record) -> RecipeSummary:
+        return RecipeSummary(
+            row["id"],
+            row["title"],
+            RecipeCategory(row["category"]),
+            row["tag_names"] or [],
+        )
+
+    @staticmethod
+    def _row_to_recipe(row: Record) -> Recipe:
+        row_dict = dict(row)
+        # Convert tag_names array to list of strings for display
+        if row_dict.get("tag_names"):
+            row_dict["tags"] = [tag for tag in row_dict["tag_names"] if tag is not None]
+        else:
+            row_dict["tags"] = []
+
+        # Convert ingredients JSONB back to list of Ingredient objects
+        if row_dict.get("ingredients"):
+            row_dict["ingredients"] = orjson.loads(row_dict["ingredients"])
+
+        # Convert steps JSONB back to list of strings
+        if row_dict.get("steps"):
+            row_dict["steps"] = orjson.loads(row_dict["steps"])
+
+        return Recipe.model_validate(row_dict)
+
+    async def _resolve_tag_ids(self, recipe_data: Recipe) -> list[int]:
+        """Convert tag names to tag IDs for database storage, keeping order."""
+        if not recipe_data.tags:
+            return []
+        tags = await self.tag_repo.get_or_create_tags(
+            recipe_data.tags, recipe_data.user_id
+        )
+        tag_ids = {tag.name: tag.id for tag in tags}
+        return [tag_ids[name] for name in dict.fromkeys(recipe_data.tags)]
+
+    @staticmethod
+    async def _insert_ingredient_names(
+        conn: PoolConnectionProxy, recipe_id: UUID, recipe_data: Recipe
+    ) -> None:
+        """Store canonical ingredient names of the recipe in recipe_ingredients.
+
+        Rows are removed with the recipe by ON DELETE CASCADE.
+        """
+        names = {
+            canonical_ingredient_name(ingredient.name)
+            for ingredient in recipe_data.ingredients
+        }
+        names.discard("")
+        if names:
+            await conn.execute(
+                load_query(__file__, INSERT_RECIPE_INGREDIENTS_QUERY),
+                recipe_id,
+                recipe_data.user_id,
+                sorted(names),
+            )
+
+    @staticmethod
+    def _saved_recipe(recipe_data: Recipe, id: UUID) -> Recipe:
+        """Build the stored recipe from written data, tags are stored deduplicated."""
+        return recipe_data.model_copy(
+            update={"id": id, "tags": list(dict.fromkeys(recipe_data.tags))}
+        )
+
     async def update(self, recipe_data: Recipe) -> Recipe:
         try:
             bound_logger = logger.bind(recipe_id=recipe_data.id)
             bound_logger.info("Updating recipe")
 
-            # Convert tag names to tag IDs for database storage
-            tag_ids = []
-            if recipe_data.tags:
-                for tag_name in recipe_data.tags:
-                    tag = await self.tag_repo.get_or_create_tag(
-                        tag_name, recipe_data.user_id
-                    )
-                    tag_ids.append(tag.id)
-
-            async with self.conn.get_cursor() as conn:
+            async with self.conn.transaction() as conn:
+                tag_ids = await self._resolve_tag_ids(recipe_data)
                 row = await conn.fetchrow(
                     load_query(__file__, UPDATE_RECIPE_QUERY),
                     recipe_data.title,
@@ -187,9 +370,13 @@ class RecipeAsyncpgRepo(RecipeRepositoryABC):
                     recipe_data.id,
                     recipe_data.user_id,
                 )
-            if not row:
-                raise RecipeNotFound(recipe_id=recipe_data.id)
-            return Recipe.model_validate(dict(row))
+                if not row:
+                    raise RecipeNotFound(recipe_id=recipe_data.id)
+                await conn.execute(
+                    load_query(__file__, DELETE_RECIPE_INGREDIENTS_QUERY), row["id"]
+                )
+                await self._insert_ingredient_names(conn, row["id"], recipe_data)
+            return self._saved_recipe(recipe_data, row["id"])
         except Exception as exc:
             bound_logger.exception("Error updating recipe", exc_info=True)
             raise exc
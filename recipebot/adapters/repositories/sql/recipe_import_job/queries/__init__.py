@@ -0,0 +1,4 @@
+INSERT_RECIPE_IMPORT_JOB_QUERY = "insert_recipe_import_job"
+UPDATE_RECIPE_IMPORT_JOB_QUERY = "update_recipe_import_job"
+GET_RECIPE_IMPORT_JOB_QUERY = "get_recipe_import_job"
+LIST_UNFINISHED_RECIPE_IMPORT_JOBS_QUERY = "list_unfinished_recipe_import_jobs"
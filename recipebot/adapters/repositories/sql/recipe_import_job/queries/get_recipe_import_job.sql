@@ -0,0 +1,3 @@
+SELECT id, user_id, chat_id, message_id, url, status, stage, recipe, error
+FROM recipe_import_jobs
+WHERE id = $1;
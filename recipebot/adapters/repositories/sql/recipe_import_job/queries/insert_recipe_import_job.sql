@@ -0,0 +1,2 @@
+INSERT INTO recipe_import_jobs (id, user_id, chat_id, message_id, url, status, stage)
+VALUES ($1, $2, $3, $4, $5, $6, $7);
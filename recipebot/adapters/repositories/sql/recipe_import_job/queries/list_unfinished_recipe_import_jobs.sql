@@ -0,0 +1,4 @@
+SELECT id, user_id, chat_id, message_id, url, status, stage, recipe, error
+FROM recipe_import_jobs
+WHERE status IN ('queued', 'running')
+ORDER BY created_at;
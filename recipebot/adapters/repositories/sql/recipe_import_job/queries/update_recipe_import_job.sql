@@ -0,0 +1,3 @@
+UPDATE recipe_import_jobs
+SET status = $2, stage = $3, recipe = $4, error = $5, updated_at = NOW()
+WHERE id = $1;
@@ -0,0 +1,105 @@
+from uuid import UUID
+
+import structlog
+from asyncpg import Record
+
+from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
+from recipebot.adapters.repositories.sql.base.utils import load_query
+from recipebot.adapters.repositories.sql.recipe_import_job.queries import (
+    GET_RECIPE_IMPORT_JOB_QUERY,
+    INSERT_RECIPE_IMPORT_JOB_QUERY,
+    LIST_UNFINISHED_RECIPE_IMPORT_JOBS_QUERY,
+    UPDATE_RECIPE_IMPORT_JOB_QUERY,
+)
+from recipebot.domain.recipe.recipe import (
+    RecipeDTO,
+    RecipeImportJob,
+    RecipeImportJobStatus,
+    RecipeImportStage,
+)
+from recipebot.ports.repositories.recipe_import_job_repository import (
+    RecipeImportJobRepositoryABC,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class RecipeImportJobAsyncpgRepo(RecipeImportJobRepositoryABC):
+    def __init__(self, conn: AsyncpgConnection) -> None:
+        self.conn = conn
+
+    async def add(self, job: RecipeImportJob) -> None:
+        try:
+            bound_logger = logger.bind(job_id=job.id, user_id=job.user_id)
+            bound_logger.info("Adding recipe import job")
+
+            async with self.conn.get_cursor() as conn:
+                await conn.execute(
+                    load_query(__file__, INSERT_RECIPE_IMPORT_JOB_QUERY),
+                    job.id,
+                    job.user_id,
+                    job.chat_id,
+                    job.message_id,
+                    job.url,
+                    job.status,
+                    job.stage,
+                )
+        except Exception as exc:
+            bound_logger.exception("Error adding recipe import job", exc_info=True)
+            raise exc
+
+    async def update(self, job: RecipeImportJob) -> None:
+        try:
+            bound_logger = logger.bind(job_id=job.id, status=job.status)
+            async with self.conn.get_cursor() as conn:
+                await conn.execute(
+                    load_query(__file__, UPDATE_RECIPE_IMPORT_JOB_QUERY),
+                    job.id,
+                    job.status,
+                    job.stage,
+                    job.recipe.model_dump_json() if job.recipe else None,
+                    job.error,
+                )
+        except Exception as exc:
+            bound_logger.exception("Error updating recipe import job", exc_info=True)
+            raise exc
+
+    async def get(self, job_id: UUID) -> RecipeImportJob | None:
+        try:
+            bound_logger = logger.bind(job_id=job_id)
+            async with self.conn.get_cursor() as conn:
+                row = await conn.fetchrow(
+                    load_query(__file__, GET_RECIPE_IMPORT_JOB_QUERY), job_id
+                )
+        except Exception as exc:
+            bound_logger.exception("Error getting recipe import job", exc_info=True)
+            raise exc
+
+        return self._row_to_job(row) if row else None
+
+    async def list_unfinished(self) -> list[RecipeImportJob]:
+        try:
+            async with self.conn.get_cursor() as conn:
+                rows = await conn.fetch(
+                    load_query(__file__, LIST_UNFINISHED_RECIPE_IMPORT_JOBS_QUERY)
+                )
+        except Exception as exc:
+            logger.exception("Error listing unfinished recipe import jobs")
+            raise exc
+
+        return [self._row_to_job(row) for row in rows]
+
+    def _row_to_job(self, row: Record) -> RecipeImportJob:
+        return RecipeImportJob(
+            id=row["id"],
+            user_id=row["user_id"],
+            chat_id=row["chat_id"],
+            message_id=row["message_id"],
+            url=row["url"],
+            status=RecipeImportJobStatus(row["status"]),
+            stage=RecipeImportStage(row["stage"]),
+            recipe=RecipeDTO.model_validate_json(row["recipe"])
+            if row["recipe"]
+            else None,
+            error=row["error"],
+        )
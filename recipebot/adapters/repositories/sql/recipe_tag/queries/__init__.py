@@ -1,3 +1,4 @@
 GET_USER_TAGS_QUERY = "get_user_tags"
 CREATE_TAG_QUERY = "create_tag"
 FIND_EXISTING_TAG_QUERY = "find_existing_tag"
+GET_OR_CREATE_TAGS_QUERY = "get_or_create_tags"
@@ -0,0 +1,7 @@
+WITH input AS (
+    SELECT DISTINCT name FROM unnest($1::text[]) AS name
+)
+INSERT INTO recipe_tag (name, user_id)
+SELECT name, $2 FROM input
+ON CONFLICT (user_id, name) DO UPDATE SET name = EXCLUDED.name
+RETURNING id, name, group_id, user_id;
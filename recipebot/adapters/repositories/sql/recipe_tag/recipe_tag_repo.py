@@ -7,6 +7,7 @@ from recipebot.adapters.repositories.sql.base.utils import load_query
 from recipebot.adapters.repositories.sql.recipe_tag.queries import (
     CREATE_TAG_QUERY,
     FIND_EXISTING_TAG_QUERY,
+    GET_OR_CREATE_TAGS_QUERY,
     GET_USER_TAGS_QUERY,
 )
 from recipebot.domain.recipe.recipe import RecipeTag
@@ -83,3 +84,29 @@ class RecipeTagAsyncpgRepo(RecipeTagRepositoryABC):
                 user_id=user_id,
             )
             return await self.create_tag(new_tag)
+
+    async def get_or_create_tags(
+        self, names: list[str], user_id: int
+    ) -> list[RecipeTag]:
+        """Get existing tags or create missing ones in a single statement.
+
+        Conflicting names are updated to themselves, so every name is returned,
+        also when a concurrent transaction inserted it first.
+        """
+        if not names:
+            return []
+        async with self.conn.get_cursor() as conn:
+            result = await conn.fetch(
+                load_query(__file__, GET_OR_CREATE_TAGS_QUERY),
+                names,
+                user_id,
+            )
+            return [
+                RecipeTag(
+                    id=row["id"],
+                    name=row["name"],
+                    group_id=row["group_id"],
+                    user_id=row["user_id"],
+                )
+                for row in result
+            ]
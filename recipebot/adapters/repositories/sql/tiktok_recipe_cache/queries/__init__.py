@@ -0,0 +1,3 @@
+GET_TIKTOK_RECIPE_QUERY = "get_tiktok_recipe"
+UPSERT_TIKTOK_RECIPE_QUERY = "upsert_tiktok_recipe"
+DELETE_EXPIRED_TIKTOK_RECIPES_QUERY = "delete_expired_tiktok_recipes"
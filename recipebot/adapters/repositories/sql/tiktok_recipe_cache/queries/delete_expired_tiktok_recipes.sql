@@ -0,0 +1 @@
+DELETE FROM tiktok_recipe_cache WHERE expires_at <= NOW();
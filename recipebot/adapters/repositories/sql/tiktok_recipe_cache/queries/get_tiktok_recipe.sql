@@ -0,0 +1,3 @@
+SELECT video_id, description, recipe, EXTRACT(EPOCH FROM expires_at - NOW()) AS ttl
+FROM tiktok_recipe_cache
+WHERE video_id = $1 AND expires_at > NOW();
@@ -0,0 +1,7 @@
+INSERT INTO tiktok_recipe_cache (video_id, description, recipe, expires_at)
+VALUES ($1, $2, $3, NOW() + make_interval(secs => $4))
+ON CONFLICT (video_id) DO UPDATE
+SET description = EXCLUDED.description,
+    recipe = EXCLUDED.recipe,
+    created_at = NOW(),
+    expires_at = EXCLUDED.expires_at;
@@ -0,0 +1,101 @@
+import structlog
+
+from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
+from recipebot.adapters.repositories.sql.base.utils import load_query
+from recipebot.adapters.repositories.sql.tiktok_recipe_cache.queries import (
+    DELETE_EXPIRED_TIKTOK_RECIPES_QUERY,
+    GET_TIKTOK_RECIPE_QUERY,
+    UPSERT_TIKTOK_RECIPE_QUERY,
+)
+from recipebot.config import settings
+from recipebot.config.config import TikTokRecipeCacheSettings
+from recipebot.domain.recipe.recipe import RecipeDTO, TikTokRecipeCacheEntry
+from recipebot.infra.cache.ttl_lru import TTLLRUCache
+from recipebot.metrics.cache import (
+    TIKTOK_RECIPE_CACHE_LOOKUPS,
+    TikTokRecipeCacheResultEnum,
+)
+from recipebot.ports.repositories.tiktok_recipe_cache_repository import (
+    TikTokRecipeCacheRepositoryABC,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class TikTokRecipeCacheAsyncpgRepo(TikTokRecipeCacheRepositoryABC):
+    """Parsed TikTok recipes stored in Postgres with TTL.
+
+    An in-memory LRU in front of the table serves repeated imports of the
+    same video without a database round trip. Entries are copied on the way
+    out, so callers mutating the recipe can't corrupt the cache.
+    """
+
+    def __init__(
+        self,
+        conn: AsyncpgConnection,
+        cfg: TikTokRecipeCacheSettings = settings.TIKTOK_RECIPE_CACHE,
+    ) -> None:
+        self.conn = conn
+        self.cfg = cfg
+        self._entries: TTLLRUCache[str, TikTokRecipeCacheEntry] = TTLLRUCache(
+            "tiktok_recipes", cfg.memory_max_size, cfg.memory_ttl_seconds
+        )
+
+    async def get(self, video_id: str) -> TikTokRecipeCacheEntry | None:
+        entry = self._entries.get(video_id)
+        if entry is not None:
+            TIKTOK_RECIPE_CACHE_LOOKUPS.labels(
+                TikTokRecipeCacheResultEnum.MEMORY_HIT
+            ).inc()
+            return entry.model_copy(deep=True)
+
+        try:
+            bound_logger = logger.bind(video_id=video_id)
+            async with self.conn.get_cursor() as conn:
+                row = await conn.fetchrow(
+                    load_query(__file__, GET_TIKTOK_RECIPE_QUERY), video_id
+                )
+        except Exception as exc:
+            bound_logger.exception("Error getting cached TikTok recipe", exc_info=True)
+            raise exc
+
+        if not row:
+            TIKTOK_RECIPE_CACHE_LOOKUPS.labels(TikTokRecipeCacheResultEnum.MISS).inc()
+            return None
+
+        TIKTOK_RECIPE_CACHE_LOOKUPS.labels(
+            TikTokRecipeCacheResultEnum.DATABASE_HIT
+        ).inc()
+        entry = TikTokRecipeCacheEntry(
+            video_id=row["video_id"],
+            description=row["description"],
+            recipe=RecipeDTO.model_validate_json(row["recipe"]),
+        )
+        # Don't keep the entry in memory longer than in the database
+        self._entries.set(
+            video_id, entry, ttl=min(self.cfg.memory_ttl_seconds, float(row["ttl"]))
+        )
+        return entry.model_copy(deep=True)
+
+    async def add(self, entry: TikTokRecipeCacheEntry) -> None:
+        try:
+            bound_logger = logger.bind(video_id=entry.video_id)
+            bound_logger.info("Caching parsed TikTok recipe")
+
+            async with self.conn.get_cursor() as conn:
+                await conn.execute(
+                    load_query(__file__, UPSERT_TIKTOK_RECIPE_QUERY),
+                    entry.video_id,
+                    entry.description,
+                    entry.recipe.model_dump_json(),
+                    self.cfg.ttl_seconds,
+                )
+                # Misses are rare and LLM bound anyway, purge expired entries here
+                await conn.execute(
+                    load_query(__file__, DELETE_EXPIRED_TIKTOK_RECIPES_QUERY)
+                )
+        except Exception as exc:
+            bound_logger.exception("Error caching TikTok recipe", exc_info=True)
+            raise exc
+
+        self._entries.set(entry.video_id, entry.model_copy(deep=True))
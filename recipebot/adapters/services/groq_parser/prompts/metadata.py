@@ -0,0 +1,47 @@
+import json
+from collections.abc import Iterable
+
+from groq.types.chat import ChatCompletionMessageParam
+
+from .base import BASE_SYSTEM_PROMPT
+
+METADATA_EXTRACTION_RULES = """
+**Rules for recipe metadata:**
+1. Extract only `title`, `desc`, `servings`, `estimated_time` and `notes`.
+2. `title` is the name of the dish, make one up from the ingredients if it isn't mentioned.
+3. `desc` is a short summary, could include group names, like "Chicken with sauce".
+4. Infer `estimated_time` and `servings` if mentioned, use null otherwise.
+5. `notes` are tips or substitutions from the text, null if there are none.
+6. Do NOT extract ingredients or steps.
+"""
+
+METADATA_FEW_SHOTS: list[ChatCompletionMessageParam] = [
+    {
+        "role": "user",
+        "content": "Fish and Chips for 2. Fish: 500g cod. Batter: 100g flour, 1 egg, 100ml beer. Ready in 30 minutes! Use sparkling water instead of beer.",
+    },
+    {
+        "role": "assistant",
+        "content": json.dumps(
+            {
+                "title": "Fish and Chips",
+                "desc": "Fish in beer batter",
+                "servings": 2,
+                "estimated_time": "30 minutes",
+                "notes": "Sparkling water can be used instead of beer.",
+            }
+        ),
+    },
+]
+
+
+def get_tt_recipe_metadata_prompt(
+    user_text: str,
+) -> Iterable[ChatCompletionMessageParam]:
+    system_content = f"{BASE_SYSTEM_PROMPT}\n\n{METADATA_EXTRACTION_RULES}"
+
+    return [
+        {"role": "system", "content": system_content},
+        *METADATA_FEW_SHOTS,
+        {"role": "user", "content": user_text},
+    ]
@@ -1,6 +1,16 @@
+import asyncio
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from groq.types.chat import ChatCompletionMessageParam
+from pydantic import BaseModel, ValidationError
+
 from recipebot.adapters.services.groq_parser.prompts.ingredients import (
     get_tt_recipe_ingredients_prompt,
 )
+from recipebot.adapters.services.groq_parser.prompts.metadata import (
+    get_tt_recipe_metadata_prompt,
+)
 from recipebot.adapters.services.groq_parser.prompts.steps import (
     get_tt_recipe_steps_prompt,
 )
@@ -9,44 +19,172 @@ from recipebot.adapters.services.groq_parser.prompts.tt_recipe_prompt import (
 )
 from recipebot.adapters.services.groq_parser.schemas import (
     IngredientsExtractionSchema,
+    RecipeMetadataExtractionSchema,
     StepsExtractionSchema,
 )
 from recipebot.config import settings
-from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO
-from recipebot.infra.groq.client import GroqClient
-from recipebot.ports.services.recipe_parser.recipe_parser import RecipeParserABC
+from recipebot.config.config import TiktokDescriptionParseSettings
+from recipebot.config.enums import TiktokDescriptionParseMode
+from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO, RecipePreview
+from recipebot.infra.groq.client import GroqClient, PartialCallback
+from recipebot.infra.groq.scheduler import GroqPriority
+from recipebot.ports.services.recipe_parser.recipe_parser import (
+    PreviewCallback,
+    RecipeParserABC,
+)
+
+T = TypeVar("T", bound=BaseModel)
 
 
 class GroqRecipeParser(RecipeParserABC):
-    def __init__(self, groq_client: GroqClient):
+    def __init__(
+        self,
+        groq_client: GroqClient,
+        cfg: TiktokDescriptionParseSettings = settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS,
+    ):
         self.groq_client = groq_client
+        self.cfg = cfg
+
+    async def parse(
+        self, description: str, on_preview: PreviewCallback | None = None
+    ) -> RecipeDTO:
+        if not self.cfg.stream_preview:
+            on_preview = None
+        if self.cfg.mode == TiktokDescriptionParseMode.SPLIT:
+            return await self._parse_split(description, on_preview)
+
+        on_partial = None
+        if on_preview is not None:
 
-    async def parse(self, description: str) -> RecipeDTO:
-        prompt = get_tt_recipe_prompt(description)
-        dto = await self.groq_client.get_json_structured_output_completion(
-            model=settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS.model,
-            messages=prompt,
-            schema=RecipeDTO,
-            schema_name="RecipeDTO",
+            async def on_partial(partial: dict[str, Any]) -> None:
+                await on_preview(
+                    RecipePreview(
+                        title=_partial_title(partial),
+                        ingredients=_partial_ingredients(partial),
+                    )
+                )
+
+        return await self._complete(
+            get_tt_recipe_prompt(description),
+            RecipeDTO,
+            "RecipeDTO",
+            # TikTok imports run as background jobs, users typing recipes go first
+            GroqPriority.BACKGROUND,
+            on_partial,
         )
-        return dto
 
     async def parse_ingredients(self, ingredients_text: str) -> list[Ingredient]:
-        prompt = get_tt_recipe_ingredients_prompt(ingredients_text)
-        ingredients = await self.groq_client.get_json_structured_output_completion(
-            model=settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS.model,
-            messages=prompt,
-            schema=IngredientsExtractionSchema,
-            schema_name="Ingredients",
+        return await self._extract_ingredients(
+            ingredients_text, GroqPriority.INTERACTIVE
         )
-        return ingredients.ingredients
 
     async def parse_steps(self, steps_text: str) -> list[str]:
-        prompt = get_tt_recipe_steps_prompt(steps_text)
-        steps = await self.groq_client.get_json_structured_output_completion(
-            model=settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS.model,
-            messages=prompt,
-            schema=StepsExtractionSchema,
-            schema_name="Steps",
+        return await self._extract_steps(steps_text, GroqPriority.INTERACTIVE)
+
+    async def _parse_split(
+        self, description: str, on_preview: PreviewCallback | None
+    ) -> RecipeDTO:
+        """Extract parts of the recipe by concurrent completions and merge them.
+
+        Each completion generates only its part, so the recipe takes as long
+        as its longest part instead of all of them one after another.
+        """
+        on_metadata = on_ingredients = None
+        if on_preview is not None:
+            # Title and ingredients come from different completions
+            preview = RecipePreview()
+
+            async def on_metadata(partial: dict[str, Any]) -> None:
+                preview.title = _partial_title(partial)
+                await on_preview(preview.model_copy())
+
+            async def on_ingredients(partial: dict[str, Any]) -> None:
+                preview.ingredients = _partial_ingredients(partial)
+                await on_preview(preview.model_copy())
+
+        metadata, ingredients, steps = await asyncio.gather(
+            self._complete(
+                get_tt_recipe_metadata_prompt(description),
+                RecipeMetadataExtractionSchema,
+                "RecipeMetadata",
+                GroqPriority.BACKGROUND,
+                on_metadata,
+            ),
+            self._extract_ingredients(
+                description, GroqPriority.BACKGROUND, on_ingredients
+            ),
+            self._extract_steps(description, GroqPriority.BACKGROUND),
+        )
+        return RecipeDTO(**metadata.model_dump(), ingredients=ingredients, steps=steps)
+
+    async def _extract_ingredients(
+        self,
+        ingredients_text: str,
+        priority: GroqPriority,
+        on_partial: PartialCallback | None = None,
+    ) -> list[Ingredient]:
+        ingredients = await self._complete(
+            get_tt_recipe_ingredients_prompt(ingredients_text),
+            IngredientsExtractionSchema,
+            "Ingredients",
+            priority,
+            on_partial,
+        )
+        return ingredients.ingredients
+
+    async def _extract_steps(
+        self, steps_text: str, priority: GroqPriority
+    ) -> list[str]:
+        steps = await self._complete(
+            get_tt_recipe_steps_prompt(steps_text),
+            StepsExtractionSchema,
+            "Steps",
+            priority,
         )
         return steps.steps
+
+    async def _complete(
+        self,
+        messages: Iterable[ChatCompletionMessageParam],
+        schema: type[T],
+        schema_name: str,
+        priority: GroqPriority,
+        on_partial: PartialCallback | None = None,
+    ) -> T:
+        if on_partial is None:
+            return await self.groq_client.get_json_structured_output_completion(
+                model=self.cfg.model,
+                messages=messages,
+                schema=schema,
+                schema_name=schema_name,
+                priority=priority,
+            )
+        return await self.groq_client.stream_json_structured_output_completion(
+            model=self.cfg.model,
+            messages=messages,
+            schema=schema,
+            schema_name=schema_name,
+            on_partial=on_partial,
+            priority=priority,
+        )
+
+
+def _partial_title(partial: dict[str, Any]) -> str | None:
+    title = partial.get("title")
+    return title if isinstance(title, str) and title else None
+
+
+def _partial_ingredients(partial: dict[str, Any]) -> list[Ingredient]:
+    """Ingredients with a name so far, the last one may be cut."""
+    ingredients = partial.get("ingredients")
+    if not isinstance(ingredients, list):
+        return []
+    parsed = []
+    for ingredient in ingredients:
+        if not isinstance(ingredient, dict) or not ingredient.get("name"):
+            continue
+        try:
+            parsed.append(Ingredient.model_validate(ingredient))
+        except ValidationError:
+            continue
+    return parsed
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from recipebot.domain.recipe.recipe import Ingredient
 
@@ -9,3 +9,14 @@ class IngredientsExtractionSchema(BaseModel):
 
 class StepsExtractionSchema(BaseModel):
     steps: list[str]
+
+
+class RecipeMetadataExtractionSchema(BaseModel):
+    title: str
+    desc: str | None = Field(
+        None,
+        description="Short summary, could include group names, like Chicken with sauce",
+    )
+    servings: int | None = None
+    estimated_time: str | None = Field("Not mentioned", description="Estimated time")
+    notes: str | None = None
@@ -0,0 +1,68 @@
+from recipebot.adapters.services.rule_based_parser.rules import (
+    Extraction,
+    clean_lines,
+    extract_ingredients,
+    extract_recipe,
+    extract_steps,
+    split_list,
+)
+from recipebot.config import settings
+from recipebot.config.config import TiktokDescriptionParseSettings
+from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO
+from recipebot.metrics.recipes import (
+    RECIPE_PARSE_CONFIDENCE,
+    RECIPE_PARSES,
+    RecipeParserEnum,
+)
+from recipebot.ports.services.recipe_parser.recipe_parser import (
+    PreviewCallback,
+    RecipeParserABC,
+)
+
+
+class RuleBasedRecipeParser(RecipeParserABC):
+    """Parses well structured texts by rules, the rest with the fallback.
+
+    Most TikTok descriptions already list ingredients and steps under their
+    own headers, those don't need an LLM round trip. Texts the rules aren't
+    confident about, below `rule_based_min_confidence`, go to the fallback.
+    """
+
+    def __init__(
+        self,
+        fallback: RecipeParserABC,
+        cfg: TiktokDescriptionParseSettings = settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS,
+    ):
+        self.fallback = fallback
+        self.cfg = cfg
+
+    async def parse(
+        self, description: str, on_preview: PreviewCallback | None = None
+    ) -> RecipeDTO:
+        extraction = extract_recipe(description)
+        if self._confident("recipe", extraction) and extraction.value is not None:
+            return extraction.value
+        return await self.fallback.parse(description, on_preview)
+
+    async def parse_ingredients(self, ingredients_text: str) -> list[Ingredient]:
+        extraction = extract_ingredients(split_list(ingredients_text))
+        if self._confident("ingredients", extraction):
+            return extraction.value
+        return await self.fallback.parse_ingredients(ingredients_text)
+
+    async def parse_steps(self, steps_text: str) -> list[str]:
+        extraction = extract_steps(clean_lines(steps_text))
+        if self._confident("steps", extraction):
+            return extraction.value
+        return await self.fallback.parse_steps(steps_text)
+
+    def _confident(self, kind: str, extraction: Extraction) -> bool:
+        """Record which parser handles the text, also when nothing was extracted."""
+        RECIPE_PARSE_CONFIDENCE.labels(kind).observe(extraction.confidence)
+        confident = (
+            extraction.value is not None
+            and extraction.confidence >= self.cfg.rule_based_min_confidence
+        )
+        parser = RecipeParserEnum.RULES if confident else RecipeParserEnum.LLM
+        RECIPE_PARSES.labels(kind, parser).inc()
+        return confident
@@ -0,0 +1,293 @@
+"""Rules recognizing well structured recipe texts without an LLM.
+
+Covers the common TikTok layout: a title line, an "Ingredients:" section of
+one ingredient per line and a "Steps:" section of one step per line. Every
+extraction comes with a confidence in [0, 1], low when the text had to be
+guessed at and the LLM would do better.
+"""
+
+import re
+from enum import StrEnum
+from typing import NamedTuple
+
+from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO
+
+DEFAULT_GROUP = "Main"
+
+# Ingredient lines without a quantity, or steps split out of a paragraph,
+# are likely right but the LLM may read them better
+UNCERTAIN_INGREDIENT_SCORE = 0.5
+PARAGRAPH_STEPS_SCORE = 0.6
+
+# Longer first lines are descriptions rather than titles
+MAX_TITLE_LENGTH = 80
+# Longer lines ending with a colon are sentences rather than group headers
+MAX_GROUP_HEADER_WORDS = 4
+
+
+class Section(StrEnum):
+    INTRO = "intro"
+    INGREDIENTS = "ingredients"
+    STEPS = "steps"
+    NOTES = "notes"
+
+
+SECTION_HEADERS = {
+    Section.INGREDIENTS: r"ingredients?|(?:what )?you(?:'ll| will)? need",
+    Section.STEPS: (
+        r"steps?|instructions?|method|directions?|preparation|how to(?: make)?(?: it)?"
+    ),
+    Section.NOTES: r"notes?|tips?",
+}
+SECTION_HEADER_PATTERN = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?P<{section}>{header})" for section, header in SECTION_HEADERS.items()
+    )
+    + r")(?:\s*:\s*(?P<rest>.*))?$",
+    re.IGNORECASE,
+)
+
+QUANTITY = (
+    r"(?:\d+(?:[.,]\d+)?(?:\s*[-–]\s*\d+(?:[.,]\d+)?)?(?:\s+\d+/\d+)?"
+    r"|\d+/\d+|\d*[½¼¾⅓⅔⅛])"
+)
+UNIT_ALIASES = {
+    "g": "g",
+    "gr": "g",
+    "gram": "g",
+    "grams": "g",
+    "kg": "kg",
+    "mg": "mg",
+    "ml": "ml",
+    "cl": "cl",
+    "dl": "dl",
+    "l": "l",
+    "liter": "l",
+    "liters": "l",
+    "litre": "l",
+    "litres": "l",
+    "oz": "oz",
+    "ounce": "oz",
+    "ounces": "oz",
+    "lb": "lb",
+    "lbs": "lb",
+    "pound": "lb",
+    "pounds": "lb",
+    "cup": "cup",
+    "cups": "cup",
+    "tbsp": "tbsp",
+    "tbs": "tbsp",
+    "tablespoon": "tbsp",
+    "tablespoons": "tbsp",
+    "tsp": "tsp",
+    "teaspoon": "tsp",
+    "teaspoons": "tsp",
+    "pc": "pc",
+    "pcs": "pc",
+    "piece": "pc",
+    "pieces": "pc",
+    "clove": "clove",
+    "cloves": "clove",
+    "can": "can",
+    "cans": "can",
+    "slice": "slice",
+    "slices": "slice",
+    "stick": "stick",
+    "sticks": "stick",
+    "pinch": "pinch",
+    "pinches": "pinch",
+    "handful": "handful",
+    "handfuls": "handful",
+    "bunch": "bunch",
+    "sprig": "sprig",
+    "sprigs": "sprig",
+    "pack": "pack",
+    "packs": "pack",
+    "package": "pack",
+}
+# Longest first, so "tbsp" isn't read as "t" + "bsp"
+UNIT = "|".join(sorted(UNIT_ALIASES, key=len, reverse=True))
+
+QUANTITY_FIRST_PATTERN = re.compile(
+    rf"^(?P<qty>{QUANTITY})\s*(?P<unit>{UNIT})?\.?\s+(?:of\s+)?(?P<name>\S.*)$",
+    re.IGNORECASE,
+)
+# "Flour - 200g", "Flour: 200 g", "Flour (200g)"
+QUANTITY_LAST_PATTERN = re.compile(
+    rf"^(?P<name>.*?[^\W\d].*?)\s*(?:[:–—-]\s*|\s|\()"
+    rf"(?P<qty>{QUANTITY})\s*(?P<unit>{UNIT})?\.?\)?$",
+    re.IGNORECASE,
+)
+NO_QUANTITY_PATTERN = re.compile(
+    r"\b(?:to taste|as needed|optional|for garnish|for serving|for frying)\b",
+    re.IGNORECASE,
+)
+
+# Bullets, emoji and markdown before the text of a line
+DECORATION_PATTERN = re.compile(r"^[^\w(½¼¾⅓⅔⅛]+")
+TRAILING_DECORATION_PATTERN = re.compile(r"[^\w).!?:%½¼¾⅓⅔⅛]+$")
+HASHTAGS_PATTERN = re.compile(r"(?:\s*#\S+)+\s*$")
+LIST_NUMBER_PATTERN = re.compile(r"^(?:step\s*)?\d+\s*[.):]\s+", re.IGNORECASE)
+OUTRO_PATTERN = re.compile(
+    r"^(?:enjoy|follow|like|subscribe|save this|share|comment)\b", re.IGNORECASE
+)
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!])\s+(?=[A-Z])")
+SERVINGS_PATTERN = re.compile(
+    r"\b(?:serves|servings?|portions?)\s*:?\s*(\d+)\b|\bfor (\d+) (?:people|persons|servings)\b",
+    re.IGNORECASE,
+)
+TIME_PATTERN = re.compile(
+    r"\b(\d+(?:\s*[-–]\s*\d+)?\s*(?:minutes?|mins?|hours?|hrs?))\b", re.IGNORECASE
+)
+
+
+class Extraction[T](NamedTuple):
+    value: T
+    confidence: float
+
+
+def extract_recipe(text: str) -> Extraction[RecipeDTO | None]:
+    """Extract recipe of a text with titled ingredients and steps sections."""
+    sections = split_sections(text)
+    intro = sections.get(Section.INTRO, [])
+    title = intro[0] if intro and len(intro[0]) <= MAX_TITLE_LENGTH else None
+    ingredients = extract_ingredients(sections.get(Section.INGREDIENTS, []))
+    steps = extract_steps(sections.get(Section.STEPS, []))
+    if title is None or not ingredients.value or not steps.value:
+        return Extraction(None, 0.0)
+
+    notes = sections.get(Section.NOTES)
+    servings = SERVINGS_PATTERN.search(text)
+    estimated_time = TIME_PATTERN.search("\n".join(intro + (notes or [])))
+    recipe = RecipeDTO(
+        title=title,
+        desc=None,
+        ingredients=ingredients.value,
+        steps=steps.value,
+        servings=int(servings[1] or servings[2]) if servings else None,
+        estimated_time=estimated_time[1] if estimated_time else None,
+        notes=" ".join(notes) if notes else None,
+    )
+    return Extraction(recipe, ingredients.confidence * steps.confidence)
+
+
+def split_sections(text: str) -> dict[Section, list[str]]:
+    """Group cleaned up lines of the text by the section header above them."""
+    sections: dict[Section, list[str]] = {}
+    section = Section.INTRO
+    for raw_line in text.splitlines():
+        line = clean_line(raw_line)
+        if not line:
+            continue
+        if match := SECTION_HEADER_PATTERN.match(line):
+            section = Section(
+                next(name for name in SECTION_HEADERS if match[name] is not None)
+            )
+            lines = sections.setdefault(section, [])
+            if rest := (match["rest"] or "").strip():
+                lines.extend(
+                    split_list(rest) if section == Section.INGREDIENTS else [rest]
+                )
+            continue
+        sections.setdefault(section, []).append(line)
+    return sections
+
+
+def clean_lines(text: str) -> list[str]:
+    return [line for raw_line in text.splitlines() if (line := clean_line(raw_line))]
+
+
+def split_list(text: str) -> list[str]:
+    """Split cleaned up lines, or items of a single line, e.g. "flour, eggs"."""
+    lines = clean_lines(text)
+    if len(lines) == 1:
+        return [item.strip() for item in lines[0].split(",") if item.strip()]
+    return lines
+
+
+def clean_line(line: str) -> str:
+    line = HASHTAGS_PATTERN.sub("", line)
+    line = DECORATION_PATTERN.sub("", line)
+    return TRAILING_DECORATION_PATTERN.sub("", line).strip()
+
+
+def extract_ingredients(lines: list[str]) -> Extraction[list[Ingredient]]:
+    """Parse one ingredient per line, lines like "Sauce:" start a group."""
+    ingredients: list[Ingredient] = []
+    scores: list[float] = []
+    group = DEFAULT_GROUP
+    for numbered_line in lines:
+        line = LIST_NUMBER_PATTERN.sub("", numbered_line)
+        if _is_group_header(line):
+            group = _group_name(line)
+            continue
+        ingredient, score = parse_ingredient(line, group)
+        ingredients.append(ingredient)
+        scores.append(score)
+
+    if not ingredients:
+        return Extraction([], 0.0)
+    return Extraction(ingredients, sum(scores) / len(scores))
+
+
+def parse_ingredient(line: str, group: str = DEFAULT_GROUP) -> Extraction[Ingredient]:
+    """Parse quantity, unit and name of an ingredient line."""
+    match = QUANTITY_FIRST_PATTERN.match(line) or QUANTITY_LAST_PATTERN.match(line)
+    if match is None:
+        score = 1.0 if NO_QUANTITY_PATTERN.search(line) else UNCERTAIN_INGREDIENT_SCORE
+        return Extraction(
+            Ingredient(name=line, qty=None, unit=None, group=group), score
+        )
+
+    unit = match["unit"]
+    return Extraction(
+        Ingredient(
+            name=match["name"].strip(" ,:-"),
+            qty=match["qty"],
+            unit=UNIT_ALIASES[unit.lower()] if unit else None,
+            group=group,
+        ),
+        1.0,
+    )
+
+
+def extract_steps(lines: list[str]) -> Extraction[list[str]]:
+    """Take one step per line, unnumbered lines continue a numbered step.
+
+    A single paragraph is split into sentences, with a lower confidence.
+    """
+    lines = [
+        line
+        for line in lines
+        if not OUTRO_PATTERN.match(line) and not _is_group_header(line)
+    ]
+    if not lines:
+        return Extraction([], 0.0)
+
+    if len(lines) == 1:
+        sentences = SENTENCE_END_PATTERN.split(LIST_NUMBER_PATTERN.sub("", lines[0]))
+        return Extraction(
+            sentences, PARAGRAPH_STEPS_SCORE if len(sentences) > 1 else 1.0
+        )
+
+    numbered = any(LIST_NUMBER_PATTERN.match(line) for line in lines)
+    steps: list[str] = []
+    for line in lines:
+        step = LIST_NUMBER_PATTERN.sub("", line)
+        if numbered and steps and step == line:
+            steps[-1] = f"{steps[-1]} {step}"
+        else:
+            steps.append(step)
+    return Extraction(steps, 1.0)
+
+
+def _is_group_header(line: str) -> bool:
+    return line.endswith(":") and len(line.split()) <= MAX_GROUP_HEADER_WORDS
+
+
+def _group_name(header: str) -> str:
+    name = re.sub(
+        r"^for (?:the )?", "", header.rstrip(":").strip(), flags=re.IGNORECASE
+    )
+    return name[:1].upper() + name[1:]
@@ -1,10 +1,9 @@
-import json
 import logging
 import re
 from http import HTTPMethod
-from typing import cast
 from urllib.parse import urlparse
 
+import orjson
 from bs4 import BeautifulSoup, Tag
 from pydantic import AnyHttpUrl
 
@@ -19,6 +18,73 @@ from recipebot.ports.services.tt_resolver.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+VIDEO_ID_PATTERN = re.compile(r"/(?:video|photo)/(\d+)")
+
+UNIVERSAL_DATA_SCRIPT_ID = "__UNIVERSAL_DATA_FOR_REHYDRATION__"
+# Opening tag of the data script, attributes may come in any order
+UNIVERSAL_DATA_SCRIPT_PATTERN = re.compile(
+    rf"<script\b[^>]*\bid=[\"']?{UNIVERSAL_DATA_SCRIPT_ID}[\"']?[^>]*>"
+)
+SCRIPT_END_TAG = "</script>"
+
+
+class UniversalDataExtractor:
+    """Find JSON payload of TikTok data script in a page read in chunks.
+
+    `feed` returns True once the closing tag of the script is read, so the
+    rest of the page doesn't have to be downloaded. Only the new chunk (plus
+    a possibly incomplete tag before it) is searched on every call.
+    """
+
+    def __init__(self) -> None:
+        self.payload: str | None = None
+        self._chunks: list[str] = []
+        # Unmatched text that may be the beginning of the opening tag
+        self._tag_start = ""
+        # Payload read so far, None until the opening tag is found
+        self._payload_parts: list[str] | None = None
+        # End of the payload read so far, the end tag may be split by chunks
+        self._payload_tail = ""
+
+    @property
+    def html(self) -> str:
+        """Page read so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> bool:
+        self._chunks.append(chunk)
+        if self.payload is not None:
+            return True
+
+        if self._payload_parts is None:
+            window = self._tag_start + chunk
+            start_tag = UNIVERSAL_DATA_SCRIPT_PATTERN.search(window)
+            if start_tag is None:
+                self._tag_start = self._incomplete_tag(window)
+                return False
+            self._tag_start = ""
+            self._payload_parts = []
+            chunk = window[start_tag.end() :]
+
+        window = self._payload_tail + chunk
+        end = window.find(SCRIPT_END_TAG)
+        if end == -1:
+            self._payload_parts.append(chunk)
+            self._payload_tail = window[-(len(SCRIPT_END_TAG) - 1) :]
+            return False
+
+        # Window starts with the tail, which is already in the payload parts
+        read = "".join(self._payload_parts)
+        self.payload = read[: len(read) - len(self._payload_tail)] + window[:end]
+        return True
+
+    @staticmethod
+    def _incomplete_tag(text: str) -> str:
+        tag_start = text.rfind("<")
+        if tag_start == -1 or ">" in text[tag_start:]:
+            return ""
+        return text[tag_start:]
+
 
 class HttpxTTResolver(TTResolverABC):
     def __init__(self, transport: AbstractAsyncHTTPTransport):
@@ -40,19 +106,38 @@ class HttpxTTResolver(TTResolverABC):
                 raise
             raise InvalidTikTokURL(f"Invalid URL: {url} - {str(e)}")
 
+    def canonical_video_id(self, url: str) -> str | None:
+        match = VIDEO_ID_PATTERN.search(urlparse(url).path)
+        return match.group(1) if match else None
+
     async def resolve(self, url: str) -> ResolutionResult:
+        """Resolve description reading the page only up to the data script.
+
+        The connection is closed as soon as the script is read, the rest of
+        the page isn't downloaded.
+        """
         self._validate_tiktok_url(url)
 
         try:
             data = HTTPRequestData(url=url, method=HTTPMethod.GET)
-            html, metadata = await self.transport.request(data)
+            extractor = UniversalDataExtractor()
+            async with self.transport.stream(data) as response:
+                final_url = str(response.url)
+                async for chunk in response.aiter_text():
+                    if extractor.feed(chunk):
+                        break
+                logger.debug(
+                    f"Read {response.num_bytes_downloaded} bytes of TikTok page"
+                )
         except Exception as e:
             raise TikTokNotAccessible(f"Failed to access TikTok URL {url}: {str(e)}")
 
         try:
-            description = self._extract_description(cast(str, html))
+            description = self._extract_streamed_description(extractor)
             return ResolutionResult(
-                description=description, source_url=AnyHttpUrl(metadata.final_url)
+                description=description,
+                source_url=AnyHttpUrl(final_url),
+                video_id=self.canonical_video_id(final_url),
             )
 
         except Exception as e:
@@ -60,10 +145,29 @@ class HttpxTTResolver(TTResolverABC):
                 f"Failed to extract description from TikTok URL {url}: {str(e)}"
             )
 
-    def _extract_description(self, html: str) -> str | None:
+    def _extract_streamed_description(
+        self, extractor: UniversalDataExtractor
+    ) -> str | None:
+        """Extract video description from the page read by the extractor.
+
+        Falls back to parsing the page with BeautifulSoup if the script tag
+        wasn't found by search, or its JSON is invalid.
+        """
+        if extractor.payload is None:
+            return self._extract_description_with_soup(extractor.html)
+        return self._decode_description(extractor.payload, extractor.html)
+
+    def _decode_description(self, payload: str, html: str) -> str | None:
+        try:
+            return self._description_from_data(orjson.loads(payload))
+        except orjson.JSONDecodeError:
+            logger.warning("Fast path found invalid TikTok data, using parser")
+        return self._extract_description_with_soup(html)
+
+    def _extract_description_with_soup(self, html: str) -> str | None:
         try:
             soup = BeautifulSoup(html, "html.parser")
-            script_tag = soup.find("script", id="__UNIVERSAL_DATA_FOR_REHYDRATION__")
+            script_tag = soup.find("script", id=UNIVERSAL_DATA_SCRIPT_ID)
 
             if not script_tag or not isinstance(script_tag, Tag):
                 logger.warning("TikTok data script tag not found in page")
@@ -75,32 +179,13 @@ class HttpxTTResolver(TTResolverABC):
                 return None
 
             try:
-                data = json.loads(script_content)
-            except json.JSONDecodeError as e:
+                data = orjson.loads(str(script_content))
+            except orjson.JSONDecodeError as e:
                 raise DescriptionNotFound(
                     f"Invalid JSON in TikTok data script: {str(e)}"
                 )
 
-            default_scope = data.get("__DEFAULT_SCOPE__", {})
-            if not default_scope:
-                logger.warning("No default scope found in TikTok data")
-                return None
-
-            item_struct = (
-                default_scope.get("webapp.video-detail", {})
-                .get("itemInfo", {})
-                .get("itemStruct", {})
-            )
-            if not item_struct:
-                logger.warning("Video details not found in TikTok data")
-                return None
-
-            desc = item_struct.get("desc")
-            if not desc:
-                logger.warning("No description found in video details")
-                return None
-
-            return desc
+            return self._description_from_data(data)
 
         except DescriptionNotFound:
             raise
@@ -108,3 +193,26 @@ class HttpxTTResolver(TTResolverABC):
             raise DescriptionNotFound(
                 f"Failed to extract description from TikTok page: {str(e)}"
             )
+
+    @staticmethod
+    def _description_from_data(data: dict) -> str | None:
+        default_scope = data.get("__DEFAULT_SCOPE__", {})
+        if not default_scope:
+            logger.warning("No default scope found in TikTok data")
+            return None
+
+        item_struct = (
+            default_scope.get("webapp.video-detail", {})
+            .get("itemInfo", {})
+            .get("itemStruct", {})
+        )
+        if not item_struct:
+            logger.warning("Video details not found in TikTok data")
+            return None
+
+        desc = item_struct.get("desc")
+        if not desc:
+            logger.warning("No description found in video details")
+            return None
+
+        return desc
@@ -1,10 +1,10 @@
 import urllib.parse
 
 import structlog
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from recipebot.config.enums import AppEnvironment
+from recipebot.config.enums import AppEnvironment, TiktokDescriptionParseMode
 
 logger = structlog.get_logger(__name__)
 
@@ -29,6 +29,15 @@ class PostgreSQLSettings(BaseSettings):
     password: SecretStr | None = SecretStr("pass")
     name: str = "postgres"
 
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    # Seconds an idle pooled connection lives before being closed
+    max_inactive_connection_lifetime: float = 300.0
+    command_timeout: float | None = 60.0
+    statement_cache_size: int = 100
+    # Seconds to wait for a free pooled connection
+    acquire_timeout: float = 10.0
+
     @property
     def dsn(self) -> str:
         """
@@ -44,11 +53,31 @@ class PostgreSQLSettings(BaseSettings):
 
 
 class HTTPTransportSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="http_transport__", env_file=".env", extra="ignore"
+    )
     chunk_size: int = 8192
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
     default_timeout: int = 30
     follow_redirects: bool = False  # Disable auto-follow to capture redirect info
 
+    http2: bool = True
+    max_connections: int = 20
+    # Idle connections kept open for reuse by the next requests
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+    # Retries of transient errors (connection errors, 429 and 5xx responses)
+    max_retries: int = 2
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 5.0
+    # Time budget of one call, including retries and the followed redirect
+    deadline: float = 15.0
+    # Consecutive failures of a host opening its circuit
+    circuit_failure_threshold: int = 5
+    # Time an open circuit fails fast before letting a trial request through
+    circuit_reset_timeout: float = 30.0
+
     @property
     def common_headers(self) -> dict[str, str]:
         return {"user-agent": self.user_agent}
@@ -103,18 +132,105 @@ class AppSettings(BaseSettings):
             return []
 
 
+class RecipeCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="recipe_cache__", env_file=".env", extra="ignore"
+    )
+    enabled: bool = True
+    ttl_seconds: float = 300
+    max_recipes: int = 1024
+    max_lists: int = 1024
+
+
+class RegistrationCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="registration_cache__", env_file=".env", extra="ignore"
+    )
+    max_size: int = 10_000
+    # Users never unregister, so positive entries only expire to bound staleness
+    ttl_seconds: float = 24 * 60 * 60
+    negative_ttl_seconds: float = 30
+
+
+class FuzzySearchSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="fuzzy_search__", env_file=".env", extra="ignore"
+    )
+    # pg_trgm word similarity in [0, 1] a title or ingredient must reach
+    similarity_threshold: float = 0.4
+    top_k: int = 5
+
+
+class TikTokRecipeCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="tiktok_recipe_cache__", env_file=".env", extra="ignore"
+    )
+    enabled: bool = True
+    # Video descriptions rarely change, parsed recipes are kept for a week
+    ttl_seconds: float = 7 * 24 * 60 * 60
+    memory_max_size: int = 1024
+    memory_ttl_seconds: float = 60 * 60
+
+
+class RecipeImportSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="recipe_import__", env_file=".env", extra="ignore"
+    )
+    # TikTok imports running at once, each holds an HTTP fetch and a Groq call
+    workers: int = 4
+    # Imports waiting for a worker before new ones are rejected
+    max_queued: int = 100
+    # Seconds between edits of the processing message with the recipe so far
+    preview_interval: float = 1.0
+
+
+class PersistenceSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="persistence__", env_file=".env", extra="ignore"
+    )
+    # Seconds between writes of changed user data and conversation states
+    update_interval: float = 15
+
+
+class GroqModelLimits(BaseModel):
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
 class GroqSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="groq__", env_file=".env", extra="ignore"
     )
     api_key: SecretStr = SecretStr("api_key")
 
+    # Rate limits of the account, applied to every model separately
+    requests_per_minute: int = 60
+    tokens_per_minute: int = 10_000
+    # Per-model overrides, as JSON: {"<model>": {"requests_per_minute": ...}}
+    model_limits: dict[str, GroqModelLimits] = {}
+    max_concurrency: int = 8
+    # Requests waiting for rate limits before new ones are rejected
+    max_queued: int = 100
+    # Retries of 429 responses after their retry-after, and of connection
+    # and 5xx errors after an exponential backoff
+    max_retries: int = 3
+    retry_backoff_base: float = 0.5
+    # Completion tokens reserved for a request until its usage is known
+    completion_tokens_estimate: int = 1024
+    # Seconds between parses of a streamed completion, each parses all of it
+    partial_interval: float = 0.2
+
 
 class TiktokDescriptionParseSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="tiktok_description_parse__", env_file=".env", extra="ignore"
     )
     model: str = "moonshotai/kimi-k2-instruct-0905"
+    mode: TiktokDescriptionParseMode = TiktokDescriptionParseMode.SINGLE
+    # Stream completions to preview the recipe while it's generated
+    stream_preview: bool = True
+    # Texts parsed by rules with lower confidence go to the LLM, above 1 always do
+    rule_based_min_confidence: float = 0.8
 
 
 class Settings(BaseSettings):
@@ -122,6 +238,12 @@ class Settings(BaseSettings):
     POSTGRESQL: PostgreSQLSettings = PostgreSQLSettings()
     HTTP_TRANSPORT: HTTPTransportSettings = HTTPTransportSettings()
     APP: AppSettings = AppSettings()
+    RECIPE_CACHE: RecipeCacheSettings = RecipeCacheSettings()
+    REGISTRATION_CACHE: RegistrationCacheSettings = RegistrationCacheSettings()
+    FUZZY_SEARCH: FuzzySearchSettings = FuzzySearchSettings()
+    PERSISTENCE: PersistenceSettings = PersistenceSettings()
+    RECIPE_IMPORT: RecipeImportSettings = RecipeImportSettings()
+    TIKTOK_RECIPE_CACHE: TikTokRecipeCacheSettings = TikTokRecipeCacheSettings()
     GROQ_SETTINGS: GroqSettings = GroqSettings()
     TIKTOK_DESCRIPTION_PARSE_SETTINGS: TiktokDescriptionParseSettings = (
         TiktokDescriptionParseSettings()
@@ -5,3 +5,10 @@ class AppEnvironment(StrEnum):
     DEV = "dev"
     PROD = "prod"
     TEST = "test"
+
+
+class TiktokDescriptionParseMode(StrEnum):
+    # One completion generating the whole recipe
+    SINGLE = "single"
+    # Ingredients, steps and metadata extracted by concurrent completions
+    SPLIT = "split"
@@ -1,5 +1,6 @@
 from collections import defaultdict
 from enum import StrEnum
+from typing import NamedTuple
 from uuid import UUID, uuid4
 
 from pydantic import AnyHttpUrl, BaseModel, Field
@@ -20,6 +21,11 @@ class RecipeTag(BaseModel):
     user_id: int
 
 
+def canonical_ingredient_name(name: str) -> str:
+    """Normalize ingredient name for matching, e.g. ' Green  Peas' -> 'green peas'."""
+    return " ".join(name.lower().split())
+
+
 class Ingredient(BaseModel):
     name: str
     qty: str | None = Field(None, description="Quantity as string")
@@ -99,6 +105,13 @@ class RecipeDTO(BaseModel):
         return recipe_text
 
 
+class RecipePreview(BaseModel):
+    """Part of a recipe parsed so far, shown while the rest is generated."""
+
+    title: str | None = None
+    ingredients: list[Ingredient] = Field(default_factory=list)
+
+
 class Recipe(RecipeDTO):
     id: UUID = Field(default_factory=uuid4)
     category: RecipeCategory
@@ -120,3 +133,64 @@ class Recipe(RecipeDTO):
             recipe_text += f"\n🏷️ Tags: {tags_str}"
 
         return recipe_text
+
+
+class RecipeSummary(NamedTuple):
+    """Lightweight recipe projection for rendering recipe lists."""
+
+    id: UUID
+    title: str
+    category: RecipeCategory
+    tags: list[str]
+
+
+class RecipeIngredientMatch(NamedTuple):
+    """Recipe found by ingredients with the number of matched ingredients."""
+
+    recipe: RecipeSummary
+    matched: int
+    total: int
+
+
+class TikTokRecipeCacheEntry(BaseModel):
+    """Description and parsed recipe of a TikTok video, shared between users."""
+
+    video_id: str
+    description: str | None
+    recipe: RecipeDTO
+
+
+class RecipeImportJobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class RecipeImportStage(StrEnum):
+    QUEUED = "queued"
+    FETCHING = "fetching"
+    PARSING = "parsing"
+    FINISHED = "finished"
+
+
+class RecipeImportJob(BaseModel):
+    """Import of a recipe from TikTok running in background.
+
+    `message_id` is the "processing" message in the user's chat, edited to
+    report progress of the job.
+    """
+
+    id: UUID = Field(default_factory=uuid4)
+    user_id: int
+    chat_id: int
+    message_id: int
+    url: str
+    status: RecipeImportJobStatus = RecipeImportJobStatus.QUEUED
+    stage: RecipeImportStage = RecipeImportStage.QUEUED
+    recipe: RecipeDTO | None = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {RecipeImportJobStatus.DONE, RecipeImportJobStatus.FAILED}
@@ -34,6 +34,7 @@ from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes import (
     search_category_selection_handler,
     search_execution_handler,
     search_mode_selection_handler,
+    search_query_conversation,
     search_recipes_handler,
     search_tag_pagination_handler,
     search_tag_selection_handler,
@@ -78,6 +79,7 @@ def add_handlers(app: Application) -> None:
     app.add_handler(delete_recipe_selection_handler)
     app.add_handler(delete_confirmation_handler)
     app.add_handler(delete_pagination_handler)
+    app.add_handler(search_query_conversation)
     app.add_handler(search_mode_selection_handler)
     app.add_handler(search_execution_handler)
     app.add_handler(search_tag_pagination_handler)
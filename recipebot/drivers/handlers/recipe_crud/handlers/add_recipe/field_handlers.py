@@ -3,7 +3,6 @@ from telegram import (
 )
 from telegram.ext import ContextTypes, ConversationHandler
 
-from recipebot.adapters.services.groq_parser.recipe_parser import GroqRecipeParser
 from recipebot.domain.recipe.recipe import Recipe, RecipeCategory
 from recipebot.drivers.handlers.main_keyboard import MAIN_KEYBOARD
 from recipebot.drivers.handlers.recipe_crud.handlers.add_recipe.constants import (
@@ -58,7 +57,7 @@ async def handle_ingredients(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     await update.message.reply_text(ADD_INGREDIENTS_PROCESSING)
 
-    recipe_parser = GroqRecipeParser(get_state()["groq_client"])
+    recipe_parser = get_state()["recipe_parser"]
     ingredients = await recipe_parser.parse_ingredients(update.message.text or "")
     context.user_data["ingredients"] = [i.model_dump() for i in ingredients]
     await update.message.reply_text(ADD_INGREDIENTS_SUCCESS)
@@ -75,7 +74,7 @@ async def handle_steps(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
 
     await update.message.reply_text(ADD_STEPS_PROCESSING)
 
-    recipe_parser = GroqRecipeParser(get_state()["groq_client"])
+    recipe_parser = get_state()["recipe_parser"]
     steps = await recipe_parser.parse_steps(update.message.text or "")
     context.user_data["steps"] = steps
 
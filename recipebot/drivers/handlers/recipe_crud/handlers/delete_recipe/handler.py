@@ -5,6 +5,12 @@ from telegram import Update
 from telegram.ext import CallbackQueryHandler, CommandHandler, ContextTypes
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageCursor,
+    PageRequest,
+    RecipePage,
+)
+from recipebot.domain.recipe.recipe import RecipeSummary
 from recipebot.drivers.handlers.auth.decorators import only_registered
 from recipebot.drivers.handlers.main_keyboard import MAIN_KEYBOARD
 from recipebot.drivers.handlers.recipe_crud.handlers.delete_recipe.handler_context import (
@@ -18,9 +24,8 @@ from recipebot.drivers.handlers.recipe_crud.handlers.delete_recipe.utils import
     parse_delete_recipe_callback,
 )
 from recipebot.drivers.handlers.recipe_crud.shared import (
-    PaginatedResult,
     create_paginated_keyboard,
-    parse_pagination_callback,
+    parse_keyset_pagination_callback,
 )
 from recipebot.drivers.state import get_state
 from recipebot.ports.repositories.exceptions import RecipeNotFound
@@ -31,21 +36,27 @@ async def delete_recipe(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await _show_delete_recipe_list(update, context, page=1)
 
 
-async def _show_delete_recipe_list(
+async def _show_delete_recipe_list(  # noqa: PLR0913
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
     page: int = 1,
     edit_message: bool = False,
+    *,
+    cursor: PageCursor | None = None,
+    recipe_page: RecipePage[RecipeSummary] | None = None,
 ):
     """Show paginated recipe list for deletion."""
     if not update.effective_chat or not update.effective_user:
         raise Exception("Not chat or user in the update")
 
-    recipe_repo = get_state()["recipe_repo"]
-    filters = RecipeFilters(user_id=update.effective_user.id)
-    recipes = await recipe_repo.list_filtered(filters)
+    if recipe_page is None:
+        recipe_repo = get_state()["recipe_repo"]
+        filters = RecipeFilters(user_id=update.effective_user.id)
+        recipe_page = await recipe_repo.list_summaries(
+            filters, PageRequest(page=page, cursor=cursor)
+        )
 
-    if not recipes:
+    if not recipe_page.total_items:
         if edit_message and update.callback_query:
             await update.callback_query.edit_message_text(
                 "You don't have any recipes yet. "
@@ -57,18 +68,15 @@ async def _show_delete_recipe_list(
             )
         return
 
-    # Create paginated result
-    paginated_result = PaginatedResult(recipes, page)
-
     # Create paginated keyboard
     def item_callback_factory(recipe, current_page):
         return f"delete_recipe_{recipe.id}"
 
     reply_markup = create_paginated_keyboard(
-        paginated_result, item_callback_factory, navigation_prefix="delete_page"
+        recipe_page, item_callback_factory, navigation_prefix="delete_page"
     )
 
-    message_text = f"Select a recipe to delete:\n\n{paginated_result.get_page_info_text()}\n\nOr use main keyboard below."
+    message_text = f"Select a recipe to delete:\n\n{recipe_page.get_page_info_text()}\n\nOr use main keyboard below."
 
     if edit_message and update.callback_query:
         await update.callback_query.edit_message_text(
@@ -201,9 +209,9 @@ async def _return_to_recipe_selection(query, context: ContextTypes.DEFAULT_TYPE)
 
     recipe_repo = get_state()["recipe_repo"]
     filters = RecipeFilters(user_id=user_id)
-    recipes = await recipe_repo.list_filtered(filters)
+    recipe_page = await recipe_repo.list_summaries(filters, PageRequest())
 
-    if not recipes:
+    if not recipe_page.total_items:
         await query.edit_message_text(
             "You don't have any recipes left. Use /add to create a new recipe!",
             reply_markup=MAIN_KEYBOARD,
@@ -218,7 +226,13 @@ async def _return_to_recipe_selection(query, context: ContextTypes.DEFAULT_TYPE)
     mock_update.effective_user = query.from_user
 
     # Show paginated recipe selection
-    await _show_delete_recipe_list(mock_update, context, page=1, edit_message=True)  # type: ignore
+    await _show_delete_recipe_list(
+        mock_update,  # type: ignore[arg-type]
+        context,
+        page=1,
+        edit_message=True,
+        recipe_page=recipe_page,
+    )
 
 
 async def handle_delete_pagination(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -230,12 +244,15 @@ async def handle_delete_pagination(update: Update, context: ContextTypes.DEFAULT
     await query.answer()
 
     # Parse pagination callback
-    page = parse_pagination_callback(query.data, "delete_page")
-    if page is None:
+    parsed = parse_keyset_pagination_callback(query.data, "delete_page")
+    if parsed is None:
         return
+    page, cursor = parsed
 
     # Show the requested page
-    await _show_delete_recipe_list(update, context, page=page, edit_message=True)
+    await _show_delete_recipe_list(
+        update, context, page=page, edit_message=True, cursor=cursor
+    )
 
 
 # Handlers
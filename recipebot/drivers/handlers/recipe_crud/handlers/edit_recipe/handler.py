@@ -13,6 +13,10 @@ from telegram.ext import (
 from telegram.warnings import PTBUserWarning
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageCursor,
+    PageRequest,
+)
 from recipebot.domain.recipe.recipe import RecipeCategory
 from recipebot.drivers.handlers.auth.decorators import only_registered
 from recipebot.drivers.handlers.basic_fallback import (
@@ -57,9 +61,8 @@ from recipebot.drivers.handlers.recipe_crud.handlers.edit_recipe.utils import (
     start_field_editing,
 )
 from recipebot.drivers.handlers.recipe_crud.shared import (
-    PaginatedResult,
     create_paginated_keyboard,
-    parse_pagination_callback,
+    parse_keyset_pagination_callback,
 )
 from recipebot.drivers.state import get_state
 from recipebot.ports.repositories.exceptions import RecipeNotFound
@@ -80,6 +83,7 @@ async def _show_edit_recipe_list(
     context: ContextTypes.DEFAULT_TYPE,
     page: int = 1,
     edit_message: bool = False,
+    cursor: PageCursor | None = None,
 ):
     """Show paginated recipe list for editing."""
     if not update.effective_chat or not update.effective_user:
@@ -87,9 +91,11 @@ async def _show_edit_recipe_list(
 
     recipe_repo = get_state()["recipe_repo"]
     filters = RecipeFilters(user_id=update.effective_user.id)
-    recipes = await recipe_repo.list_filtered(filters)
+    recipe_page = await recipe_repo.list_summaries(
+        filters, PageRequest(page=page, cursor=cursor)
+    )
 
-    if not recipes:
+    if not recipe_page.total_items:
         message = NO_RECIPES
         if edit_message and update.callback_query:
             await update.callback_query.edit_message_text(message)
@@ -100,18 +106,15 @@ async def _show_edit_recipe_list(
             )
         return
 
-    # Create paginated result
-    paginated_result = PaginatedResult(recipes, page)
-
     # Create paginated keyboard
     def item_callback_factory(recipe, current_page):
         return f"edit_recipe_{recipe.id}"
 
     reply_markup = create_paginated_keyboard(
-        paginated_result, item_callback_factory, navigation_prefix="edit_page"
+        recipe_page, item_callback_factory, navigation_prefix="edit_page"
     )
 
-    message_text = f"Select a recipe to edit:\n\n{paginated_result.get_page_info_text()}\n\nYou can use /cancel to cancel the process at any time."
+    message_text = f"Select a recipe to edit:\n\n{recipe_page.get_page_info_text()}\n\nYou can use /cancel to cancel the process at any time."
 
     if edit_message and update.callback_query:
         await update.callback_query.edit_message_text(
@@ -142,12 +145,15 @@ async def handle_edit_pagination(update: Update, context: ContextTypes.DEFAULT_T
     await query.answer()
 
     # Parse pagination callback
-    page = parse_pagination_callback(query.data, "edit_page")
-    if page is None:
+    parsed = parse_keyset_pagination_callback(query.data, "edit_page")
+    if parsed is None:
         return
+    page, cursor = parsed
 
     # Show the requested page
-    await _show_edit_recipe_list(update, context, page=page, edit_message=True)
+    await _show_edit_recipe_list(
+        update, context, page=page, edit_message=True, cursor=cursor
+    )
 
 
 async def handle_recipe_selection_for_edit(
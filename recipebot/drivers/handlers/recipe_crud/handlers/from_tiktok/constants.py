@@ -10,6 +10,20 @@ TIKTOK_START = (
 TIKTOK_URL_INVALID = "That doesn't look like a valid TikTok URL. Please try again with a TikTok share URL."
 
 TIKTOK_PROCESSING = "🔄 Processing your TikTok video... This may take a moment."
+TIKTOK_PROCESSING_FETCHING = "🔄 Fetching your TikTok video..."
+TIKTOK_PROCESSING_PARSING = "🤖 Extracting the recipe from the video description..."
+TIKTOK_PROCESSING_WAIT = (
+    "⏳ Still working on your TikTok recipe, I'll message you as soon as it's ready."
+)
+TIKTOK_PROCESSING_BUSY = (
+    "😓 Too many recipes are being imported right now. Please try again in a minute "
+    "or /cancel."
+)
+TIKTOK_RECIPE_READY = "📱 Here's your recipe from TikTok:\n"
+TIKTOK_ENHANCE = (
+    "🔧 **Let's enhance your recipe for better search and organization!**\n"
+    "Please add a category and tags to make it easier to find later."
+)
 TIKTOK_PROCESSING_SUCCESS = "✅ Successfully extracted recipe from TikTok!"
 TIKTOK_PROCESSING_ERROR = "❌ Sorry, I couldn't extract a recipe from that TikTok URL. Please check the URL and try again."
 TIKTOK_PROCESSING_FAILED = (
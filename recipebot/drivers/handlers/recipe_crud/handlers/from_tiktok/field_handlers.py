@@ -1,3 +1,5 @@
+from typing import cast
+from uuid import UUID
 
 from telegram import (
     InlineKeyboardButton,
@@ -6,11 +8,13 @@ from telegram import (
 )
 from telegram.ext import ContextTypes, ConversationHandler
 
-from recipebot.adapters.services.groq_parser.recipe_parser import (
-    GroqRecipeParser,
+from recipebot.domain.recipe.recipe import (
+    Recipe,
+    RecipeCategory,
+    RecipeDTO,
+    RecipeImportJob,
+    RecipeImportJobStatus,
 )
-from recipebot.adapters.services.tt_resolver import HttpxTTResolver, TTResolverABC
-from recipebot.domain.recipe.recipe import Recipe, RecipeCategory, RecipeDTO
 from recipebot.drivers.handlers.basic_fallback import MAIN_KEYBOARD
 from recipebot.drivers.handlers.recipe_crud.handlers.add_recipe.field_handlers import (
     add_tag_to_recipe,
@@ -19,36 +23,35 @@ from recipebot.drivers.handlers.recipe_crud.handlers.add_recipe.field_handlers i
 from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.constants import (
     CATEGORY,
     MANUAL_ENTRY,
+    PROCESSING,
     TAGS,
     TIKTOK_CANCEL,
-    TIKTOK_CATEGORY,
     TIKTOK_MANUAL_ENTRY_PROMPT,
     TIKTOK_PROCESSING,
+    TIKTOK_PROCESSING_BUSY,
     TIKTOK_PROCESSING_ERROR,
     TIKTOK_PROCESSING_FAILED,
-    TIKTOK_PROCESSING_SUCCESS,
+    TIKTOK_PROCESSING_WAIT,
     TIKTOK_SAVE_SUCCESS,
     URL,
 )
 from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.handler_context import (
     TikTokRecipeContextKey,
 )
+from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.layout import (
+    create_manual_entry_keyboard,
+)
 from recipebot.drivers.handlers.recipe_crud.shared.keyboards import (
     create_category_reply_keyboard,
 )
 from recipebot.drivers.state import get_state
-from recipebot.infra.transport.httpx_transport import init_transport
 from recipebot.metrics.recipes import RECIPES_CREATED, RecipeCreationSourceEnum
 from recipebot.ports.repositories.recipe_repository import RecipeRepositoryABC
-from recipebot.ports.services.tt_resolver.exceptions import (
-    InvalidTikTokURL,
-    TikTokNotAccessible,
-)
-from recipebot.tasks.recipe_from_tt.recipe_from_tt import RecipeFromTTTask
+from recipebot.tasks.recipe_from_tt.import_queue import RecipeImportQueueFull
 
 
 async def handle_tiktok_url(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    """Handle TikTok URL input and process it."""
+    """Queue import of the TikTok URL, the job reports back on its own."""
     if not update.message or not update.message.text:
         await update.message.reply_text(
             "Please send a valid TikTok URL."
@@ -61,59 +64,91 @@ async def handle_tiktok_url(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     user_input = update.message.text.strip()
 
-    # Send processing message
-    await update.message.reply_text(TIKTOK_PROCESSING)
+    # Send processing message, edited by the job to report progress
+    processing_message = await update.message.reply_text(TIKTOK_PROCESSING)
+    job = RecipeImportJob(
+        user_id=update.effective_user.id,
+        chat_id=update.message.chat_id,
+        message_id=processing_message.message_id,
+        url=user_input,
+    )
 
     try:
-        # Get dependencies from bot data
-        async with init_transport() as transport:
-            tt_resolver: TTResolverABC = HttpxTTResolver(transport)
-            recipe_parser = GroqRecipeParser(get_state()["groq_client"])
-            task = RecipeFromTTTask(
-                tt_resolver=tt_resolver,
-                recipe_parser=recipe_parser,
-            )
-            recipe_dto: RecipeDTO = await task.run(user_input)
-
-        if context.user_data is None:
-            context.user_data = {}
-        context.user_data[TikTokRecipeContextKey.PARSED_RECIPE] = (
-            recipe_dto.model_dump()
+        await get_state()["recipe_import_queue"].submit(job)
+    except RecipeImportQueueFull:
+        await processing_message.edit_text(TIKTOK_PROCESSING_BUSY)
+        return URL
+    except Exception as e:
+        await processing_message.edit_text(
+            f"{TIKTOK_PROCESSING_ERROR}\n\nUnexpected error: {str(e)}\nYou can /cancel and try again"
         )
+        return URL
 
-        await update.message.reply_text("📱 Here's your recipe from TikTok:\n")
-        await update.message.reply_text(recipe_dto.to_md())
+    if context.user_data is None:
+        context.user_data = {}
+    context.user_data[TikTokRecipeContextKey.IMPORT_JOB_ID] = str(job.id)
 
-        if len(recipe_dto.ingredients) == 0:
-            return await handle_manual_entry_choice(update, context)
+    return PROCESSING
 
-        await update.message.reply_text(TIKTOK_PROCESSING_SUCCESS)
 
-        # Display the parsed recipe
+async def handle_processing_reply(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    """Continue the conversation with the result of the import job.
 
-        # Explain next steps for enhancing the recipe
-        await update.message.reply_text(
-            "🔧 **Let's enhance your recipe for better search and organization!**\n"
-            "Please add a category and tags to make it easier to find later."
-        )
+    Completion message of the job asks for the category, so the reply is
+    handled as in CATEGORY state. After a failed job the reply is a new URL.
+    """
+    if not update.message:
+        return PROCESSING
 
-        await update.message.reply_text(
-            TIKTOK_CATEGORY,
-            reply_markup=create_category_reply_keyboard(),
-        )
+    job = await _get_import_job(context)
+    if job is None or job.status == RecipeImportJobStatus.FAILED:
+        return await handle_tiktok_url(update, context)
 
-        return CATEGORY
+    if not job.finished:
+        await update.message.reply_text(TIKTOK_PROCESSING_WAIT)
+        return PROCESSING
 
-    except (InvalidTikTokURL, TikTokNotAccessible) as e:
-        await update.message.reply_text(
-            f"{TIKTOK_PROCESSING_ERROR}\n\nError: {str(e)}\n You can submit a valid URL or /cancel"
-        )
-        return URL
-    except Exception as e:
-        await update.message.reply_text(
-            f"{TIKTOK_PROCESSING_ERROR}\n\nUnexpected error: {str(e)}\nYou can /cancel and try again"
-        )
-        return URL
+    recipe_dto = _store_parsed_recipe(context, job)
+    if len(recipe_dto.ingredients) == 0:
+        return await handle_manual_entry_choice(update, context)
+
+    return await handle_category(update, context)
+
+
+async def handle_processing_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    """Manual entry choice offered by the job when the recipe is incomplete."""
+    job = await _get_import_job(context)
+    if job is None or job.status != RecipeImportJobStatus.DONE:
+        if update.callback_query:
+            await update.callback_query.answer()
+        return PROCESSING
+
+    _store_parsed_recipe(context, job)
+    return await handle_manual_entry_callback(update, context)
+
+
+async def _get_import_job(
+    context: ContextTypes.DEFAULT_TYPE,
+) -> RecipeImportJob | None:
+    job_id = (context.user_data or {}).get(TikTokRecipeContextKey.IMPORT_JOB_ID)
+    if job_id is None:
+        return None
+    return await get_state()["recipe_import_job_repo"].get(UUID(job_id))
+
+
+def _store_parsed_recipe(
+    context: ContextTypes.DEFAULT_TYPE, job: RecipeImportJob
+) -> RecipeDTO:
+    recipe_dto = cast(RecipeDTO, job.recipe)
+    if context.user_data is None:
+        context.user_data = {}
+    context.user_data.pop(TikTokRecipeContextKey.IMPORT_JOB_ID, None)
+    context.user_data[TikTokRecipeContextKey.PARSED_RECIPE] = recipe_dto.model_dump()
+    return recipe_dto
 
 
 async def handle_category(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -271,16 +306,9 @@ async def handle_manual_entry_choice(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> int:
     """Handle user's choice when TikTok parsing fails - offer manual entry or cancel."""
-    # Create inline keyboard for user choice
-    keyboard = [
-        [InlineKeyboardButton("Fill Manually", callback_data="manual_entry")],
-        [InlineKeyboardButton("Cancel", callback_data="cancel_manual")],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     if update.message:
         await update.message.reply_text(
-            TIKTOK_PROCESSING_FAILED, reply_markup=reply_markup
+            TIKTOK_PROCESSING_FAILED, reply_markup=create_manual_entry_keyboard()
         )
     return MANUAL_ENTRY
 
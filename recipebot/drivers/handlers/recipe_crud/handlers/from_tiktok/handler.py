@@ -29,6 +29,8 @@ from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.constants impor
 from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.field_handlers import (
     handle_category,
     handle_manual_entry_callback,
+    handle_processing_callback,
+    handle_processing_reply,
     handle_tags,
     handle_tiktok_url,
 )
@@ -57,7 +59,13 @@ from_tiktok_handler = ConversationHandler(
     entry_points=[CommandHandler("from_tiktok", from_tiktok_start)],
     states={
         URL: [MessageHandler(filters.TEXT & ~filters.COMMAND, handle_tiktok_url)],
-        PROCESSING: [],  # This state is handled internally
+        # Import job is running, its completion message is answered here
+        PROCESSING: [
+            MessageHandler(filters.TEXT & ~filters.COMMAND, handle_processing_reply),
+            CallbackQueryHandler(
+                handle_processing_callback, pattern="^(manual_entry|cancel_manual)$"
+            ),
+        ],
         MANUAL_ENTRY: [
             CallbackQueryHandler(
                 handle_manual_entry_callback, pattern="^(manual_entry|cancel_manual)$"
@@ -7,6 +7,7 @@ class TikTokRecipeContextKey(StrEnum):
     """Enum for TikTok recipe handler context keys."""
 
     TIKTOK_URL = "tiktok_url"
+    IMPORT_JOB_ID = "import_job_id"
     PARSED_RECIPE = "parsed_recipe"
     PENDING_TIKTOK_DATA = "pending_tiktok_data"
     CATEGORY = "category"
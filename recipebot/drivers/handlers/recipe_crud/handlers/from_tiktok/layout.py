@@ -0,0 +1,11 @@
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+
+def create_manual_entry_keyboard() -> InlineKeyboardMarkup:
+    """Choice offered when no complete recipe was extracted from the video."""
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton("Fill Manually", callback_data="manual_entry")],
+            [InlineKeyboardButton("Cancel", callback_data="cancel_manual")],
+        ]
+    )
@@ -0,0 +1,119 @@
+import math
+import time
+from typing import cast
+from uuid import UUID
+
+from telegram import Bot
+
+from recipebot.config import settings
+from recipebot.domain.recipe.recipe import (
+    RecipeDTO,
+    RecipeImportJob,
+    RecipeImportStage,
+    RecipePreview,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.constants import (
+    TIKTOK_CATEGORY,
+    TIKTOK_ENHANCE,
+    TIKTOK_PROCESSING_ERROR,
+    TIKTOK_PROCESSING_FAILED,
+    TIKTOK_PROCESSING_FETCHING,
+    TIKTOK_PROCESSING_PARSING,
+    TIKTOK_PROCESSING_SUCCESS,
+    TIKTOK_RECIPE_READY,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.layout import (
+    create_manual_entry_keyboard,
+)
+from recipebot.drivers.handlers.recipe_crud.shared.keyboards import (
+    create_category_reply_keyboard,
+)
+from recipebot.ports.services.recipe_import_notifier import RecipeImportNotifierABC
+
+STAGE_MESSAGES = {
+    RecipeImportStage.FETCHING: TIKTOK_PROCESSING_FETCHING,
+    RecipeImportStage.PARSING: TIKTOK_PROCESSING_PARSING,
+}
+
+
+class TelegramRecipeImportNotifier(RecipeImportNotifierABC):
+    """Edits the "processing" message of the job and asks for the next step.
+
+    The conversation stays in PROCESSING state while the job runs, the reply
+    to the completion message is handled there (see `handle_processing_reply`).
+    Recipe previews are shown at most every `preview_interval` seconds, so
+    the edits stay within Telegram flood limits.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        preview_interval: float = settings.RECIPE_IMPORT.preview_interval,
+    ) -> None:
+        self.bot = bot
+        self.preview_interval = preview_interval
+        # Monotonic time and text of the last preview shown for the job
+        self._previews: dict[UUID, tuple[float, str]] = {}
+
+    async def progress(self, job: RecipeImportJob) -> None:
+        if text := STAGE_MESSAGES.get(job.stage):
+            await self._edit_processing_message(job, text)
+
+    async def preview(self, job: RecipeImportJob, preview: RecipePreview) -> None:
+        if not preview.title and not preview.ingredients:
+            return
+        text = _render_preview(preview)
+        now = time.monotonic()
+        shown_at, shown_text = self._previews.get(job.id, (-math.inf, None))
+        # Telegram rejects edits that don't change the message
+        if text == shown_text or now - shown_at < self.preview_interval:
+            return
+        self._previews[job.id] = (now, text)
+        await self._edit_processing_message(job, text)
+
+    async def completed(self, job: RecipeImportJob) -> None:
+        self._previews.pop(job.id, None)
+        recipe = cast(RecipeDTO, job.recipe)
+        await self._edit_processing_message(job, TIKTOK_RECIPE_READY)
+        await self.bot.send_message(job.chat_id, recipe.to_md())
+
+        if len(recipe.ingredients) == 0:
+            await self.bot.send_message(
+                job.chat_id,
+                TIKTOK_PROCESSING_FAILED,
+                reply_markup=create_manual_entry_keyboard(),
+            )
+            return
+
+        await self.bot.send_message(job.chat_id, TIKTOK_PROCESSING_SUCCESS)
+        await self.bot.send_message(job.chat_id, TIKTOK_ENHANCE)
+        await self.bot.send_message(
+            job.chat_id,
+            TIKTOK_CATEGORY,
+            reply_markup=create_category_reply_keyboard(),
+        )
+
+    async def failed(self, job: RecipeImportJob) -> None:
+        self._previews.pop(job.id, None)
+        await self._edit_processing_message(
+            job,
+            f"{TIKTOK_PROCESSING_ERROR}\n\nError: {job.error}\n"
+            " You can submit a valid URL or /cancel",
+        )
+
+    async def _edit_processing_message(self, job: RecipeImportJob, text: str) -> None:
+        await self.bot.edit_message_text(
+            text, chat_id=job.chat_id, message_id=job.message_id
+        )
+
+
+def _render_preview(preview: RecipePreview) -> str:
+    lines = [TIKTOK_PROCESSING_PARSING, ""]
+    if preview.title:
+        lines.append(f"🍽️ {preview.title}")
+    if preview.ingredients:
+        lines.append("🍳 Ingredients:")
+        lines.extend(
+            f"• {ingredient.basic_info()}" for ingredient in preview.ingredients
+        )
+    return "\n".join(lines)
@@ -4,16 +4,24 @@ from telegram import Update
 from telegram.ext import CallbackQueryHandler, CommandHandler, ContextTypes
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageCursor,
+    PageRequest,
+    RecipePage,
+)
+from recipebot.domain.recipe.recipe import RecipeSummary
 from recipebot.drivers.handlers.auth.decorators import only_registered
 from recipebot.drivers.handlers.main_keyboard import MAIN_KEYBOARD
+from recipebot.drivers.handlers.recipe_crud.handlers.list_recipes.handler_context import (
+    ListRecipesContextKey,
+)
 from recipebot.drivers.handlers.recipe_crud.handlers.list_recipes.utils import (
     parse_recipe_callback,
 )
 from recipebot.drivers.handlers.recipe_crud.shared import (
-    PaginatedResult,
     create_filter_description,
     create_paginated_keyboard,
-    parse_pagination_callback,
+    parse_keyset_pagination_callback,
 )
 from recipebot.drivers.state import get_state
 from recipebot.ports.repositories.exceptions import RecipeNotFound
@@ -24,23 +32,36 @@ async def list_recipes(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await _show_recipe_list(update, context, page=1)
 
 
-async def _show_recipe_list(  # noqa: PLR0912
+async def _show_recipe_list(  # noqa: PLR0912, PLR0913
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
     page: int = 1,
     edit_message: bool = False,
     filters: RecipeFilters | None = None,
+    *,
+    cursor: PageCursor | None = None,
+    recipe_page: RecipePage[RecipeSummary] | None = None,
 ):
-    """Show paginated recipe list."""
+    """Show paginated recipe list.
+
+    Only the requested page is fetched from the repository. Already fetched
+    recipe_page can be passed to skip the query. Filters are kept in
+    user_data, so the navigation buttons page through the same results.
+    """
     if not update.effective_chat or not update.effective_user:
         raise Exception("Not chat or user in the update")
 
     recipe_repo = get_state()["recipe_repo"]
     if filters is None:
         filters = RecipeFilters(user_id=update.effective_user.id)
-    recipes = await recipe_repo.list_filtered(filters)
+    if context.user_data is not None:
+        context.user_data[ListRecipesContextKey.FILTERS] = filters.model_dump()
+    if recipe_page is None:
+        recipe_page = await recipe_repo.list_summaries(
+            filters, PageRequest(page=page, cursor=cursor)
+        )
 
-    if not recipes:
+    if not recipe_page.total_items:
         filter_desc = create_filter_description(filters)
         message = f"No recipes found{filter_desc}. Try adjusting your filters or use /add to create a new recipe!"
 
@@ -53,15 +74,12 @@ async def _show_recipe_list(  # noqa: PLR0912
             )
         return
 
-    # Create paginated result
-    paginated_result = PaginatedResult(recipes, page)
-
     # Create paginated keyboard
     def item_callback_factory(recipe, current_page):
         return f"recipe_{recipe.id}"
 
     reply_markup = create_paginated_keyboard(
-        paginated_result, item_callback_factory, navigation_prefix="list_page"
+        recipe_page, item_callback_factory, navigation_prefix="list_page"
     )
 
     # Create filter description for the header
@@ -69,7 +87,9 @@ async def _show_recipe_list(  # noqa: PLR0912
     if filter_desc:
         filter_desc += "\n\n"
 
-    message_text = f"{filter_desc}Select a recipe to view:\n\n{paginated_result.get_page_info_text()}"
+    message_text = (
+        f"{filter_desc}Select a recipe to view:\n\n{recipe_page.get_page_info_text()}"
+    )
 
     if edit_message and update.callback_query:
         await update.callback_query.edit_message_text(
@@ -133,12 +153,22 @@ async def handle_pagination(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.answer()
 
     # Parse pagination callback
-    page = parse_pagination_callback(query.data, "list_page")
-    if page is None:
+    parsed = parse_keyset_pagination_callback(query.data, "list_page")
+    if parsed is None:
         return
+    page, cursor = parsed
+
+    # Page through the same search, a text query is ranked and paged in SQL
+    filters = None
+    if context.user_data and (
+        saved := context.user_data.get(ListRecipesContextKey.FILTERS)
+    ):
+        filters = RecipeFilters.model_validate(saved)
 
     # Show the requested page
-    await _show_recipe_list(update, context, page=page, edit_message=True)
+    await _show_recipe_list(
+        update, context, page=page, edit_message=True, filters=filters, cursor=cursor
+    )
 
 
 list_recipes_handler = CommandHandler("list", list_recipes)
@@ -0,0 +1,10 @@
+"""Context keys for list recipes handler."""
+
+from enum import StrEnum
+
+
+class ListRecipesContextKey(StrEnum):
+    """Enum for list recipes handler context keys."""
+
+    # Filters of the shown list, reused by Next/Previous buttons
+    FILTERS = "list_filters"
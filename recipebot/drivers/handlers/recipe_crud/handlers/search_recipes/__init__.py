@@ -1,5 +1,15 @@
-from telegram.ext import CallbackQueryHandler, CommandHandler
+from telegram.ext import (
+    CallbackQueryHandler,
+    CommandHandler,
+    ConversationHandler,
+    MessageHandler,
+    filters,
+)
 
+from recipebot.drivers.handlers.basic_fallback import (
+    basic_fallback_handler,
+    get_cancel_handler,
+)
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.category_search.category_handlers import (
     handle_category_pagination,
     handle_category_selection,
@@ -11,11 +21,22 @@ from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.handler impo
 )
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.handler_context import (
     SearchRecipesCallbackPattern,
+    SearchRecipesMode,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.messages import (
+    TEXT_QUERY_CANCEL,
 )
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.tag_search.tag_handlers import (
     handle_tag_pagination,
     handle_tag_selection,
 )
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.text_search.text_constants import (
+    SEARCH_QUERY_INPUT,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.text_search.text_handlers import (
+    ask_search_query,
+    handle_search_query,
+)
 
 search_recipes_handler = CommandHandler("search", search_recipes_handler)
 search_mode_selection_handler = CallbackQueryHandler(
@@ -39,3 +60,26 @@ search_execution_handler = CallbackQueryHandler(
     handle_search_execution,
     pattern=f"^{SearchRecipesCallbackPattern.SEARCH_PREFIX}$",
 )
+
+# Must be registered before search_mode_selection_handler, which matches all modes
+search_query_conversation = ConversationHandler(
+    entry_points=[
+        CallbackQueryHandler(
+            ask_search_query,
+            pattern=rf"^{SearchRecipesCallbackPattern.MODE_PREFIX}{SearchRecipesMode.TEXT}$",
+        )
+    ],
+    states={
+        SEARCH_QUERY_INPUT: [
+            MessageHandler(filters.TEXT & ~filters.COMMAND, handle_search_query)
+        ],
+    },
+    fallbacks=[
+        CommandHandler("cancel", get_cancel_handler(TEXT_QUERY_CANCEL)),  # type: ignore[list-item]
+        basic_fallback_handler,  # type: ignore[list-item]
+    ],
+    persistent=True,
+    per_message=False,
+    conversation_timeout=300,  # 5 minutes timeout
+    name="search_query_conversation",
+)
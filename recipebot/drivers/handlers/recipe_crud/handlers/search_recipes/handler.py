@@ -1,3 +1,4 @@
+import html
 import logging
 
 from telegram import Update
@@ -5,6 +6,8 @@ from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import PageRequest
+from recipebot.domain.recipe.recipe import RecipeSummary
 from recipebot.drivers.handlers.auth.decorators import only_registered
 from recipebot.drivers.handlers.main_keyboard import MAIN_KEYBOARD
 from recipebot.drivers.handlers.recipe_crud.handlers.list_recipes.handler import (
@@ -20,8 +23,10 @@ from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.handler_cont
 )
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.layout import (
     create_search_mode_keyboard,
+    create_suggestions_keyboard,
 )
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.messages import (
+    DID_YOU_MEAN_MESSAGE,
     SEARCH_INIT_MESSAGE,
     SEARCH_MODE_SELECTION_MESSAGE,
     get_current_filters_message,
@@ -30,6 +35,7 @@ from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.tag_search.t
     show_tag_selection,
 )
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.utils import (
+    get_search_query,
     get_selected_filters,
 )
 from recipebot.drivers.handlers.recipe_crud.shared import (
@@ -123,16 +129,23 @@ async def handle_search_execution(update: Update, context: ContextTypes.DEFAULT_
         user_id=update.effective_user.id,
         tag_names=selected_tags,
         category_names=selected_categories,
+        query=get_search_query(context),
     )
 
     # Check if there are any recipes with these filters
     recipe_repo = get_state()["recipe_repo"]
-    recipes = await recipe_repo.list_filtered(filters)
+    recipe_page = await recipe_repo.list_summaries(filters, PageRequest())
 
-    if not recipes:
-        # No recipes found - show message and return to mode selection
+    if not recipe_page.total_items:
         filter_desc = create_filter_description(filters)
-        error_message = f"No recipes found{filter_desc}. Try adjusting your filters or use /add to create a new recipe!"
+        if filters.query:
+            suggestions = await recipe_repo.fuzzy_search(filters.user_id, filters.query)
+            if suggestions:
+                await _show_suggestions(update, context, filter_desc, suggestions)
+                return
+
+        # No recipes found - show message and return to mode selection
+        error_message = f"No recipes found{html.escape(filter_desc)}. Try adjusting your filters or use /add to create a new recipe!"
 
         # Return to mode selection screen with error message
         if update.callback_query:
@@ -148,6 +161,7 @@ async def handle_search_execution(update: Update, context: ContextTypes.DEFAULT_
     if context.user_data:
         context.user_data.pop(SearchRecipesContextKey.SELECTED_TAGS, None)
         context.user_data.pop(SearchRecipesContextKey.SELECTED_CATEGORIES, None)
+        context.user_data.pop(SearchRecipesContextKey.SEARCH_QUERY, None)
 
     await _show_recipe_list(
         update,
@@ -155,6 +169,7 @@ async def handle_search_execution(update: Update, context: ContextTypes.DEFAULT_
         page=1,
         edit_message=True,  # Edit the search message instead of sending new one
         filters=filters,
+        recipe_page=recipe_page,
     )
 
     # Send message about using main keyboard for other actions
@@ -165,6 +180,37 @@ async def handle_search_execution(update: Update, context: ContextTypes.DEFAULT_
     )
 
 
+async def _show_suggestions(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    filter_desc: str,
+    suggestions: list[RecipeSummary],
+):
+    """Show "did you mean" recipes found by fuzzy search, keeping the filters."""
+    if not update.effective_chat:
+        raise Exception("Not chat in the update")
+
+    logger.info("Showing fuzzy search suggestions")
+    text = DID_YOU_MEAN_MESSAGE.format(
+        filter_desc=html.escape(filter_desc),
+        current_filters=get_current_filters_message(context),
+    )
+    reply_markup = create_suggestions_keyboard(suggestions)
+
+    if update.callback_query:
+        await update.callback_query.answer()
+        await update.callback_query.edit_message_text(
+            text=text, parse_mode=ParseMode.HTML, reply_markup=reply_markup
+        )
+    else:
+        await context.bot.send_message(
+            chat_id=update.effective_chat.id,
+            text=text,
+            parse_mode=ParseMode.HTML,
+            reply_markup=reply_markup,
+        )
+
+
 async def _show_mode_selection_screen(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -10,6 +10,7 @@ class SearchRecipesContextKey(StrEnum):
 
     SELECTED_TAGS = "selected_tags"
     SELECTED_CATEGORIES = "selected_categories"
+    SEARCH_QUERY = "search_query"
 
 
 class SearchRecipesMode(StrEnum):
@@ -17,6 +18,7 @@ class SearchRecipesMode(StrEnum):
 
     CATEGORY = "category"
     TAG = "tag"
+    TEXT = "text"
 
 
 class SearchRecipesFilterOperation(StrEnum):
@@ -45,7 +47,7 @@ class SearchRecipesCallbackPattern(StrEnum):
       Example: 'search_tag_page_2'
 
     - Mode selection: {MODE_PREFIX}{mode}
-      Example: 'search_mode_tag', 'search_mode_category'
+      Example: 'search_mode_tag', 'search_mode_category', 'search_mode_text'
     """
 
     RESULT_PREFIX = "search_result_"
@@ -1,5 +1,6 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+from recipebot.domain.recipe.recipe import RecipeSummary
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.handler_context import (
     SearchRecipesCallbackPattern,
     SearchRecipesMode,
@@ -21,6 +22,12 @@ def create_search_mode_keyboard() -> InlineKeyboardMarkup:
                 callback_data=f"{SearchRecipesCallbackPattern.MODE_PREFIX}{SearchRecipesMode.TAG}",
             )
         ],
+        [
+            InlineKeyboardButton(
+                "By Text",
+                callback_data=f"{SearchRecipesCallbackPattern.MODE_PREFIX}{SearchRecipesMode.TEXT}",
+            )
+        ],
         [
             InlineKeyboardButton(
                 "🔍 Search",
@@ -30,3 +37,22 @@ def create_search_mode_keyboard() -> InlineKeyboardMarkup:
     ]
 
     return InlineKeyboardMarkup(keyboard)
+
+
+def create_suggestions_keyboard(
+    suggestions: list[RecipeSummary],
+) -> InlineKeyboardMarkup:
+    """Create inline keyboard with "did you mean" recipes and a back button."""
+    keyboard = [
+        [InlineKeyboardButton(recipe.title, callback_data=f"recipe_{recipe.id}")]
+        for recipe in suggestions
+    ]
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                "🔙 Back to mode selection",
+                callback_data=SearchRecipesCallbackPattern.MODE_PREFIX,
+            )
+        ]
+    )
+    return InlineKeyboardMarkup(keyboard)
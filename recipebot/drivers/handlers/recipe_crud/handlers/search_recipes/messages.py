@@ -1,12 +1,15 @@
+import html
+
 from telegram.ext import ContextTypes
 
 from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.utils import (
+    get_search_query,
     get_selected_filters,
 )
 
 SEARCH_INIT_MESSAGE = (
     "Let's search for recipes! But we need to create a filter first.\n"
-    "Would you like to search by category or tag?\n\n"
+    "Would you like to search by category, tag or text?\n\n"
     "{current_filters}"
     "<i>You can use main keyboard to make another action.</i>"
 )
@@ -30,23 +33,45 @@ CATEGORY_SELECTION_MESSAGE = (
 )
 
 
-def _format_filters(tags: list[str], categories: list[str]) -> str:
-    """Format tags and categories into a readable string."""
+TEXT_QUERY_MESSAGE = (
+    "Send words to look for in recipe titles, descriptions, ingredients and steps.\n"
+    "For example: <i>chickpeas curry</i>\n\n"
+    "{current_filters}"
+    "<i>Use /cancel to return without searching.</i>"
+)
+
+TEXT_QUERY_CANCEL = "Text search cancelled."
+
+DID_YOU_MEAN_MESSAGE = (
+    "No recipes found{filter_desc}.\n\n"
+    "Did you mean one of these recipes?\n\n"
+    "{current_filters}"
+)
+
+
+def _format_filters(
+    tags: list[str], categories: list[str], query: str | None = None
+) -> str:
+    """Format tags, categories and text query into a readable string."""
     tag_str = ", ".join([f"#{tag}" for tag in tags]) or "None"
     category_str = (
         ", ".join([f"{category.capitalize()}" for category in categories]) or "None"
     )
-    return f"Tags: {tag_str}\nCategories: {category_str}"
+    filters_str = f"Tags: {tag_str}\nCategories: {category_str}"
+    if query:
+        filters_str += f"\nText: {html.escape(query)}"
+    return filters_str
 
 
 def get_current_filters_message(context: ContextTypes.DEFAULT_TYPE) -> str:
     """Get formatted message showing current filters from context."""
     selected_tags, selected_categories = get_selected_filters(context)
+    query = get_search_query(context)
 
-    if not selected_tags and not selected_categories:
+    if not selected_tags and not selected_categories and not query:
         return "No filters selected\n\n"
 
-    filters_str = _format_filters(selected_tags, selected_categories)
+    filters_str = _format_filters(selected_tags, selected_categories, query)
     return (
         f"Current filters:\n{filters_str}\n\n"
         "Press button with X to remove filter, press button with + to add filter. "
@@ -0,0 +1,7 @@
+"""Constants specific to text search functionality."""
+
+# Conversation states
+SEARCH_QUERY_INPUT = 0
+
+# Longer queries are cut, websearch syntax doesn't need more
+SEARCH_QUERY_MAX_LENGTH = 200
@@ -0,0 +1,58 @@
+"""Handlers for free-text recipe search."""
+
+import logging
+
+from telegram import Update
+from telegram.constants import ParseMode
+from telegram.ext import ContextTypes, ConversationHandler
+
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.handler import (
+    handle_search_execution,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.handler_context import (
+    SearchRecipesContextKey,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.messages import (
+    TEXT_QUERY_MESSAGE,
+    get_current_filters_message,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.search_recipes.text_search.text_constants import (
+    SEARCH_QUERY_INPUT,
+    SEARCH_QUERY_MAX_LENGTH,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def ask_search_query(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Ask user for free-text search query."""
+    query = update.callback_query
+    if not query:
+        raise Exception("No callback query in the update")
+    await query.answer()
+
+    logger.debug("User selected text search mode")
+    await query.edit_message_text(
+        text=TEXT_QUERY_MESSAGE.format(
+            current_filters=get_current_filters_message(context)
+        ),
+        parse_mode=ParseMode.HTML,
+    )
+    return SEARCH_QUERY_INPUT
+
+
+async def handle_search_query(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> int:
+    """Save free-text query and execute search with all selected filters."""
+    if not update.message or not update.message.text:
+        raise Exception("No message in the update")
+    if context.user_data is None:
+        raise Exception("No user data in the context")
+
+    search_query = update.message.text.strip()[:SEARCH_QUERY_MAX_LENGTH]
+    context.user_data[SearchRecipesContextKey.SEARCH_QUERY] = search_query
+    logger.info("User executed text search")
+
+    await handle_search_execution(update, context)
+    return ConversationHandler.END
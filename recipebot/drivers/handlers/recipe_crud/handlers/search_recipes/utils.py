@@ -26,3 +26,10 @@ def get_selected_filters(
     )
 
     return selected_tags, selected_categories
+
+
+def get_search_query(context: ContextTypes.DEFAULT_TYPE) -> str | None:
+    """Extract free-text search query from context."""
+    if context.user_data is None:
+        return None
+    return context.user_data.get(SearchRecipesContextKey.SEARCH_QUERY)
@@ -16,6 +16,7 @@ from recipebot.drivers.handlers.recipe_crud.shared.keyboards import (
 from recipebot.drivers.handlers.recipe_crud.shared.pagination import (
     PaginatedResult,
     create_paginated_keyboard,
+    parse_keyset_pagination_callback,
     parse_pagination_callback,
 )
 
@@ -33,4 +34,5 @@ __all__ = [
     "PaginatedResult",
     "create_paginated_keyboard",
     "parse_pagination_callback",
+    "parse_keyset_pagination_callback",
 ]
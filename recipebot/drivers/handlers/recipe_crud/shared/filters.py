@@ -7,13 +7,15 @@ def create_filter_description(filters: RecipeFilters, prefix: str = "with") -> s
     """Create a human-readable description of applied filters.
 
     Args:
-        filters: The RecipeFilters object containing tag and category filters
+        filters: The RecipeFilters object containing tag, category and text filters
         prefix: The word to use before the filter list (e.g., "with", "Filtered by")
 
     Returns:
         A formatted string describing the filters, or empty string if no filters
     """
     filter_parts = []
+    if filters.query:
+        filter_parts.append(f'text: "{filters.query}"')
     if filters.tag_names:
         filter_parts.append(
             f"tags: {', '.join(f'#{tag}' for tag in filters.tag_names)}"
@@ -5,6 +5,10 @@ from typing import Any
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageCursor,
+    RecipePage,
+)
 from recipebot.config import settings
 
 
@@ -68,8 +72,29 @@ class PaginatedResult:
         )
 
 
+def _navigation_callback(
+    paginated_result: PaginatedResult | RecipePage,
+    navigation_prefix: str,
+    forward: bool,
+) -> str:
+    """Create callback data for navigation button.
+
+    Keyset pages carry the boundary row cursor: '{prefix}_{page}_{cursor}'.
+    """
+    page = paginated_result.page + 1 if forward else paginated_result.page - 1
+    if isinstance(paginated_result, RecipePage):
+        cursor = (
+            paginated_result.next_cursor
+            if forward
+            else paginated_result.previous_cursor
+        )
+        if cursor:
+            return f"{navigation_prefix}_{page}_{cursor.encode()}"
+    return f"{navigation_prefix}_{page}"
+
+
 def create_paginated_keyboard(
-    paginated_result: PaginatedResult,
+    paginated_result: PaginatedResult | RecipePage,
     item_callback_factory: Callable[[Any, int], str],
     navigation_prefix: str = "page",
     additional_buttons: list[InlineKeyboardButton] = [],
@@ -78,7 +103,7 @@ def create_paginated_keyboard(
     """Create a paginated inline keyboard.
 
     Args:
-        paginated_result: The paginated result object
+        paginated_result: The paginated result object or a page fetched from repository
         item_callback_factory: Function that creates callback data for each item
         navigation_prefix: Prefix for navigation buttons (e.g., 'page', 'delete_page')
         additional_buttons: Additional buttons to add to the keyboard
@@ -116,7 +141,9 @@ def create_paginated_keyboard(
             nav_buttons.append(
                 InlineKeyboardButton(
                     "⬅️ Previous",
-                    callback_data=f"{navigation_prefix}_{paginated_result.page - 1}",
+                    callback_data=_navigation_callback(
+                        paginated_result, navigation_prefix, forward=False
+                    ),
                 )
             )
 
@@ -126,7 +153,9 @@ def create_paginated_keyboard(
             nav_buttons.append(
                 InlineKeyboardButton(
                     "Next ➡️",
-                    callback_data=f"{navigation_prefix}_{paginated_result.page + 1}",
+                    callback_data=_navigation_callback(
+                        paginated_result, navigation_prefix, forward=True
+                    ),
                 )
             )
 
@@ -157,3 +186,27 @@ def parse_pagination_callback(callback_data: str, prefix: str = "page") -> int |
         return int(page_str)
     except ValueError:
         return None
+
+
+def parse_keyset_pagination_callback(
+    callback_data: str, prefix: str = "page"
+) -> tuple[int, PageCursor | None] | None:
+    """Parse keyset pagination callback data.
+
+    Args:
+        callback_data: Callback data (e.g., 'list_page_2_a<hex id>', 'list_page_2')
+        prefix: The pagination prefix to look for
+
+    Returns:
+        Tuple of (page number, cursor) or None if not a pagination callback
+    """
+    if not callback_data.startswith(f"{prefix}_"):
+        return None
+
+    page_str, _, cursor_token = callback_data[len(f"{prefix}_") :].partition("_")
+    try:
+        page = int(page_str)
+    except ValueError:
+        return None
+
+    return page, PageCursor.decode(cursor_token)
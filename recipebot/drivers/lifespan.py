@@ -1,41 +1,110 @@
 import structlog
 from telegram.ext._application import Application
 
+from recipebot.adapters.repositories.cache.recipe_repo import CachedRecipeRepo
 from recipebot.adapters.repositories.sql.auth.user_repo.user_repo import UserAsyncpgRepo
 from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
+from recipebot.adapters.repositories.sql.base.utils import QUERY_REGISTRY
 from recipebot.adapters.repositories.sql.recipe.recipe_repo import RecipeAsyncpgRepo
+from recipebot.adapters.repositories.sql.recipe_import_job.recipe_import_job_repo import (
+    RecipeImportJobAsyncpgRepo,
+)
 from recipebot.adapters.repositories.sql.recipe_tag.recipe_tag_repo import (
     RecipeTagAsyncpgRepo,
 )
+from recipebot.adapters.repositories.sql.tiktok_recipe_cache.tiktok_recipe_cache_repo import (
+    TikTokRecipeCacheAsyncpgRepo,
+)
+from recipebot.adapters.services.groq_parser.recipe_parser import GroqRecipeParser
+from recipebot.adapters.services.rule_based_parser.recipe_parser import (
+    RuleBasedRecipeParser,
+)
+from recipebot.adapters.services.tt_resolver import HttpxTTResolver
 from recipebot.config import settings
+from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.notifier import (
+    TelegramRecipeImportNotifier,
+)
 from recipebot.drivers.state import container
 from recipebot.infra.groq.client import GroqClient
+from recipebot.infra.transport.base import AbstractAsyncHTTPTransport
+from recipebot.infra.transport.httpx_transport import create_transport
+from recipebot.ports.repositories.recipe_repository import RecipeRepositoryABC
+from recipebot.tasks.recipe_from_tt.import_queue import RecipeImportQueue
+from recipebot.tasks.recipe_from_tt.recipe_from_tt import RecipeFromTTTask
 
 logger = structlog.get_logger(__name__)
 
 
 async def on_startup(app: Application):
+    logger.info("Bot startup: loading SQL queries")
+    QUERY_REGISTRY.load()
+
     logger.info("Bot startup: initializing DB connection pool")
-    asyncpg_conn = AsyncpgConnection()
+    asyncpg_conn: AsyncpgConnection = container.setdefault(
+        "asyncpg_conn", AsyncpgConnection()
+    )
     await asyncpg_conn.init_pool()
     await asyncpg_conn.init_db()
 
     logger.info("Bot startup: initializing SQL repositories")
     user_repo = UserAsyncpgRepo(asyncpg_conn)
     tag_repo = RecipeTagAsyncpgRepo(asyncpg_conn)
-    recipe_repo = RecipeAsyncpgRepo(asyncpg_conn, tag_repo)
+    recipe_repo: RecipeRepositoryABC = RecipeAsyncpgRepo(asyncpg_conn, tag_repo)
+    if settings.RECIPE_CACHE.enabled:
+        recipe_repo = CachedRecipeRepo(recipe_repo, settings.RECIPE_CACHE)
+    tiktok_recipe_cache = (
+        TikTokRecipeCacheAsyncpgRepo(asyncpg_conn, settings.TIKTOK_RECIPE_CACHE)
+        if settings.TIKTOK_RECIPE_CACHE.enabled
+        else None
+    )
 
     logger.info("Bot startup: initializing Groq client")
     groq_client = GroqClient(settings.GROQ_SETTINGS)
+    recipe_parser = RuleBasedRecipeParser(
+        GroqRecipeParser(groq_client, settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS),
+        settings.TIKTOK_DESCRIPTION_PARSE_SETTINGS,
+    )
+
+    logger.info("Bot startup: initializing HTTP transport")
+    http_transport = create_transport(settings.HTTP_TRANSPORT)
+
+    logger.info("Bot startup: starting recipe import workers")
+    recipe_import_job_repo = RecipeImportJobAsyncpgRepo(asyncpg_conn)
+    recipe_import_queue = RecipeImportQueue(
+        RecipeFromTTTask(
+            tt_resolver=HttpxTTResolver(http_transport),
+            recipe_parser=recipe_parser,
+            recipe_cache=tiktok_recipe_cache,
+        ),
+        recipe_import_job_repo,
+        TelegramRecipeImportNotifier(app.bot),
+        settings.RECIPE_IMPORT,
+    )
+    await recipe_import_queue.start()
 
     container["user_repo"] = user_repo
     container["recipe_repo"] = recipe_repo
     container["tag_repo"] = tag_repo
     container["asyncpg_conn"] = asyncpg_conn
     container["groq_client"] = groq_client
+    container["recipe_parser"] = recipe_parser
+    container["http_transport"] = http_transport
+    container["tiktok_recipe_cache"] = tiktok_recipe_cache
+    container["recipe_import_job_repo"] = recipe_import_job_repo
+    container["recipe_import_queue"] = recipe_import_queue
 
 
 async def on_shutdown(app: Application):
+    logger.info("Bot shutdown: stopping recipe import workers")
+    recipe_import_queue: RecipeImportQueue | None = container.get("recipe_import_queue")
+    if recipe_import_queue:
+        await recipe_import_queue.stop()
+
+    logger.info("Bot shutdown: closing HTTP transport")
+    http_transport: AbstractAsyncHTTPTransport | None = container.get("http_transport")
+    if http_transport:
+        await http_transport.aclose()
+
     logger.info("Bot shutdown: closing DB connection pool")
     asyncpg_conn: AsyncpgConnection | None = container["asyncpg_conn"]
     if asyncpg_conn:
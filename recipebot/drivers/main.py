@@ -1,14 +1,19 @@
 import logging
 from threading import Thread
 
-from telegram.ext import ApplicationBuilder, PicklePersistence
+from telegram.ext import ApplicationBuilder
 from telegram.ext._application import Application
 
+from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
+from recipebot.adapters.repositories.sql.persistence.persistence import (
+    AsyncpgPersistence,
+)
 from recipebot.config import settings
 from recipebot.config.logging import configure_logging
 from recipebot.drivers.handlers import add_handlers
 from recipebot.drivers.lifespan import on_shutdown, on_startup
 from recipebot.drivers.metrics_server import start_metrics_server
+from recipebot.drivers.state import container
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +23,10 @@ def main() -> None:
     metrics_thread = Thread(target=start_metrics_server, daemon=True)
     metrics_thread.start()
 
-    persistence = PicklePersistence(filepath="recipebot.pickle")
+    # Shared with repositories, persistence is loaded before on_startup runs
+    asyncpg_conn = AsyncpgConnection()
+    container["asyncpg_conn"] = asyncpg_conn
+    persistence = AsyncpgPersistence(asyncpg_conn)
     app: Application = (
         ApplicationBuilder()
         .token(settings.TELEGRAM_BOT_SETTINGS.token.get_secret_value())
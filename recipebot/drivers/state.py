@@ -4,9 +4,18 @@ from typing_extensions import TypedDict
 
 from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
 from recipebot.infra.groq.client import GroqClient
+from recipebot.infra.transport.base import AbstractAsyncHTTPTransport
+from recipebot.ports.repositories.recipe_import_job_repository import (
+    RecipeImportJobRepositoryABC,
+)
 from recipebot.ports.repositories.recipe_repository import RecipeRepositoryABC
 from recipebot.ports.repositories.recipe_tag_repository import RecipeTagRepositoryABC
+from recipebot.ports.repositories.tiktok_recipe_cache_repository import (
+    TikTokRecipeCacheRepositoryABC,
+)
 from recipebot.ports.repositories.user_repository import UserRepositoryABC
+from recipebot.ports.services.recipe_parser import RecipeParserABC
+from recipebot.tasks.recipe_from_tt.import_queue import RecipeImportQueue
 
 
 class BotState(TypedDict):
@@ -15,6 +24,11 @@ class BotState(TypedDict):
     tag_repo: RecipeTagRepositoryABC
     asyncpg_conn: AsyncpgConnection
     groq_client: GroqClient
+    recipe_parser: RecipeParserABC
+    http_transport: AbstractAsyncHTTPTransport
+    tiktok_recipe_cache: TikTokRecipeCacheRepositoryABC | None
+    recipe_import_job_repo: RecipeImportJobRepositoryABC
+    recipe_import_queue: RecipeImportQueue
 
 
 container: dict[str, Any] = {}
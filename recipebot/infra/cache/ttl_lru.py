@@ -0,0 +1,82 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from recipebot.metrics.cache import (
+    CACHE_EVICTIONS,
+    CACHE_HITS,
+    CACHE_MISSES,
+    CacheEvictionReasonEnum,
+)
+
+
+class TTLLRUCache[K: Hashable, V]:
+    """Bounded in-process LRU cache with per-entry time to live.
+
+    Not thread safe, meant to be used from the event loop only.
+    Hits, misses and evictions are reported to Prometheus under `name` label.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (expires_at, value), ordered from least to most recently used
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self._clock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get value and mark it as recently used, returns default on miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            CACHE_EVICTIONS.labels(self.name, CacheEvictionReasonEnum.EXPIRED).inc()
+            entry = None
+
+        if entry is None:
+            CACHE_MISSES.labels(self.name).inc()
+            return default
+
+        self._entries.move_to_end(key)
+        CACHE_HITS.labels(self.name).inc()
+        return entry[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store value, evicting least recently used entries over max_size.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live of this entry in seconds, defaults to cache ttl
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            CACHE_EVICTIONS.labels(self.name, CacheEvictionReasonEnum.SIZE).inc()
+
+    def pop(self, key: K) -> None:
+        """Drop entry if present."""
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        """Drop all entries whose key matches the predicate."""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,20 +1,71 @@
+import asyncio
 import json
-from collections.abc import Iterable
-from typing import TypeVar
+import math
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any, TypeVar
 
-from groq import AsyncGroq
-from groq.types.chat import ChatCompletionMessageParam
+from groq import (
+    APIConnectionError,
+    AsyncGroq,
+    AsyncStream,
+    InternalServerError,
+    RateLimitError,
+)
+from groq.types import CompletionUsage
+from groq.types.chat import ChatCompletionChunk, ChatCompletionMessageParam
+from groq.types.chat.completion_create_params import ResponseFormat
 from pydantic import BaseModel
 
 from recipebot.config.config import GroqSettings
-from recipebot.infra.groq.metrics import collect_metrics
+from recipebot.infra.groq.metrics import collect_usage_metrics
+from recipebot.infra.groq.partial_json import parse_partial_json
+from recipebot.infra.groq.scheduler import GroqPriority, GroqScheduler
 
 T = TypeVar("T", bound=BaseModel)
 
+# Called with the JSON object of a streamed completion parsed so far
+type PartialCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+# Rough size of a token, enough to reserve budget until the usage is known
+CHARS_PER_TOKEN = 4
+# Wait when a 429 response says nothing about when to retry
+DEFAULT_RETRY_AFTER = 1.0
+# Groq reset headers look like "1m26.4s" or "7.66s"
+RESET_DURATION_PATTERN = re.compile(
+    r"^(?:(?P<h>\d+)h)?(?:(?P<m>\d+)m)?(?:(?P<s>\d+(?:\.\d+)?)s)?$"
+)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float:
+    """Get time to wait from headers of a 429 response."""
+    if retry_after := headers.get("retry-after"):
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+    resets = []
+    for header in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        match = RESET_DURATION_PATTERN.match(headers.get(header, ""))
+        if match and any(match.groups()):
+            resets.append(
+                int(match["h"] or 0) * 3600
+                + int(match["m"] or 0) * 60
+                + float(match["s"] or 0)
+            )
+    return max(resets, default=DEFAULT_RETRY_AFTER)
+
 
 class GroqClient:
-    def __init__(self, settings: GroqSettings):
-        self.client = AsyncGroq(api_key=settings.api_key.get_secret_value())
+    def __init__(self, settings: GroqSettings, scheduler: GroqScheduler | None = None):
+        # Retried in _complete, 429 responses pause the whole model in the scheduler
+        self.client = AsyncGroq(
+            api_key=settings.api_key.get_secret_value(), max_retries=0
+        )
+        self.settings = settings
+        self.scheduler = scheduler or GroqScheduler(settings)
 
     async def get_json_structured_output_completion(
         self,
@@ -22,30 +73,167 @@ class GroqClient:
         messages: Iterable[ChatCompletionMessageParam],
         schema: type[T],
         schema_name: str,
+        priority: GroqPriority = GroqPriority.INTERACTIVE,
     ) -> T:
         """Get structured output completion with usage metrics.
 
+        The request waits for rate limit budget of the model in the scheduler
+        queue, requests of higher priority go first.
+
         Returns:
             Parsed response
+
+        Raises:
+            GroqQueueFull: If too many requests are waiting for rate limits.
+            RateLimitError: If still rate limited after `max_retries`.
+            APIConnectionError: If still unreachable after `max_retries`.
+            InternalServerError: If still failing after `max_retries`.
         """
-        response = await self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": schema_name,
-                    "schema": schema.model_json_schema(),
-                },
-            },
-            temperature=0,
+        content = await self._complete(
+            model, messages, schema, schema_name, priority=priority
         )
-        content = response.choices[0].message.content
-        if content is None:
+        return schema.model_validate(json.loads(content))
+
+    async def stream_json_structured_output_completion(  # noqa: PLR0913
+        self,
+        model: str,
+        messages: Iterable[ChatCompletionMessageParam],
+        schema: type[T],
+        schema_name: str,
+        *,
+        on_partial: PartialCallback,
+        priority: GroqPriority = GroqPriority.INTERACTIVE,
+    ) -> T:
+        """Get structured output completion, reporting it while it's generated.
+
+        Same as `get_json_structured_output_completion`, but the response is
+        streamed and `on_partial` is called with the JSON parsed so far. The
+        text is parsed at most every `partial_interval` seconds and only
+        changed values are reported.
+
+        Returns:
+            Parsed response
+
+        Raises:
+            GroqQueueFull: If too many requests are waiting for rate limits.
+            RateLimitError: If still rate limited after `max_retries`.
+            APIConnectionError: If still unreachable after `max_retries`.
+            InternalServerError: If still failing after `max_retries`.
+        """
+        content = await self._complete(
+            model,
+            messages,
+            schema,
+            schema_name,
+            priority=priority,
+            on_partial=on_partial,
+        )
+        return schema.model_validate(json.loads(content))
+
+    async def _complete(  # noqa: PLR0913
+        self,
+        model: str,
+        messages: Iterable[ChatCompletionMessageParam],
+        schema: type[BaseModel],
+        schema_name: str,
+        *,
+        priority: GroqPriority,
+        on_partial: PartialCallback | None = None,
+    ) -> str:
+        messages = list(messages)
+        json_schema = schema.model_json_schema()
+        estimated_tokens = self._estimate_tokens(messages, json_schema)
+        response_format: ResponseFormat = {
+            "type": "json_schema",
+            "json_schema": {"name": schema_name, "schema": json_schema},
+        }
+
+        attempt = 0
+        while True:
+            async with self.scheduler.reserve(
+                model, estimated_tokens, priority
+            ) as reservation:
+                try:
+                    if on_partial is None:
+                        response = await self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            response_format=response_format,
+                            temperature=0,
+                        )
+                        content = response.choices[0].message.content
+                        usage = response.usage
+                    else:
+                        stream = await self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            response_format=response_format,
+                            temperature=0,
+                            stream=True,
+                        )
+                        content, usage = await self._read_stream(stream, on_partial)
+                except RateLimitError as exc:
+                    # Rejected requests use no tokens, refund the reservation
+                    reservation.used_tokens = 0
+                    if attempt >= self.settings.max_retries:
+                        raise
+                    # Paused before the slot is released, so nothing is sent
+                    self.scheduler.pause(
+                        model, retry_after_seconds(exc.response.headers)
+                    )
+                    backoff = 0.0
+                except (APIConnectionError, InternalServerError):
+                    reservation.used_tokens = 0
+                    if attempt >= self.settings.max_retries:
+                        raise
+                    backoff = self.settings.retry_backoff_base * 2**attempt
+                else:
+                    # TODO: Log metrics to database
+                    usage_metrics = collect_usage_metrics(usage, model)
+                    usage_metrics.log_metrics()
+                    reservation.used_tokens = usage_metrics.total_tokens or None
+                    break
+
+            # Back off without holding a concurrency slot
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+        if not content:
             raise ValueError("Received empty response from Groq API")
+        return content
+
+    async def _read_stream(
+        self, stream: AsyncStream[ChatCompletionChunk], on_partial: PartialCallback
+    ) -> tuple[str, CompletionUsage | None]:
+        parts: list[str] = []
+        usage = None
+        last_partial = None
+        parsed_at = -math.inf
+        async for chunk in stream:
+            # Groq sends usage of a stream in its last chunk
+            if chunk.x_groq and chunk.x_groq.usage:
+                usage = chunk.x_groq.usage
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            parts.append(chunk.choices[0].delta.content)
 
-        # TODO: Log metrics to database
-        collect_metrics(response, model).log_metrics()
+            # The whole text is parsed again every time, don't do it per chunk
+            now = time.monotonic()
+            if now - parsed_at < self.settings.partial_interval:
+                continue
+            parsed_at = now
+            partial = parse_partial_json("".join(parts))
+            if isinstance(partial, dict) and partial != last_partial:
+                last_partial = partial
+                await on_partial(partial)
+        return "".join(parts), usage
 
-        parsed_response = schema.model_validate(json.loads(content))
-        return parsed_response
+    def _estimate_tokens(
+        self, messages: list[ChatCompletionMessageParam], json_schema: dict
+    ) -> int:
+        prompt_chars = len(json.dumps(messages, default=str)) + len(
+            json.dumps(json_schema)
+        )
+        return (
+            prompt_chars // CHARS_PER_TOKEN + self.settings.completion_tokens_estimate
+        )
@@ -1,6 +1,7 @@
 import logging
 from typing import Any
 
+from groq.types import CompletionUsage
 from groq.types.chat import ChatCompletion
 from pydantic import BaseModel, Field
 
@@ -47,7 +48,13 @@ class GroqUsageMetrics(BaseModel):
 
 def collect_metrics(response: ChatCompletion, model: str) -> GroqUsageMetrics:
     """Collect usage metrics from Groq API response."""
-    usage = response.usage
+    return collect_usage_metrics(response.usage, model)
+
+
+def collect_usage_metrics(
+    usage: CompletionUsage | None, model: str
+) -> GroqUsageMetrics:
+    """Collect usage metrics, e.g. from the last chunk of a streamed response."""
     if not usage:
         logger.warning(f"No usage metrics found for model {model}")
         return GroqUsageMetrics(
@@ -0,0 +1,75 @@
+"""Parsing of JSON documents that are still being streamed."""
+
+from typing import Any
+
+import orjson
+
+CLOSERS = {"{": "}", "[": "]"}
+
+
+def parse_partial_json(text: str) -> Any:  # noqa: PLR0912
+    """Parse the longest usable prefix of an incomplete JSON document.
+
+    Open objects and arrays are closed, a string value being streamed is cut
+    where it ends so far, e.g. '{"title": "Panc' -> {"title": "Panc"}. Keys
+    without a value yet are dropped, as well as a number or literal that may
+    be cut in the middle.
+
+    Returns:
+        Parsed value, None if nothing usable has arrived yet
+    """
+    stack: list[str] = []
+    in_string = escape = False
+    is_key = expect_key = False
+    # text[:safe_end] + closing of safe_stack is valid JSON
+    safe_end, safe_stack = 0, ""
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+                if not is_key:
+                    safe_end, safe_stack = i + 1, "".join(stack)
+            continue
+
+        if char == '"':
+            in_string, is_key = True, expect_key
+        elif char in CLOSERS:
+            stack.append(CLOSERS[char])
+            expect_key = char == "{"
+            safe_end, safe_stack = i + 1, "".join(stack)
+        elif char in "}]":
+            if not stack:
+                break
+            stack.pop()
+            safe_end, safe_stack = i + 1, "".join(stack)
+        elif char == ",":
+            # Number or literal before the comma is complete
+            safe_end, safe_stack = i, "".join(stack)
+            expect_key = stack[-1:] == ["}"]
+        elif char == ":":
+            expect_key = False
+
+    if in_string and not is_key:
+        # Drop an escape sequence cut in the middle, e.g. "\" or "\u00"
+        value = text[: text.rfind("\\")] if escape or _in_unicode_escape(text) else text
+        try:
+            return orjson.loads(value + '"' + "".join(reversed(stack)))
+        except orjson.JSONDecodeError:
+            pass
+
+    if safe_end == 0:
+        return None
+    try:
+        return orjson.loads(text[:safe_end] + "".join(reversed(safe_stack)))
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _in_unicode_escape(text: str) -> bool:
+    backslash = text.rfind("\\u")
+    return backslash != -1 and len(text) - backslash < 6  # noqa: PLR2004
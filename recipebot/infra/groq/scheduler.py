@@ -0,0 +1,259 @@
+"""Rate-limited scheduling of Groq requests.
+
+Groq limits requests and tokens per minute for every model. Requests wait
+here for the budget instead of being rejected with 429 by the API.
+"""
+
+import asyncio
+import heapq
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from itertools import count
+from typing import NamedTuple
+
+import structlog
+
+from recipebot.config.config import GroqSettings
+from recipebot.metrics.groq import (
+    GROQ_QUEUE_WAIT_SECONDS,
+    GROQ_QUEUED,
+    GROQ_RATE_LIMIT_PAUSES,
+    GROQ_TOKENS,
+)
+
+logger = structlog.get_logger(__name__)
+
+SECONDS_PER_MINUTE = 60
+
+
+class GroqPriority(IntEnum):
+    """Lower value is scheduled first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class GroqQueueFull(Exception):
+    """Too many requests are waiting for the Groq rate limits."""
+
+
+class TokenBucket:
+    """Budget refilled continuously up to its capacity.
+
+    Level may go below zero when a request used more than it reserved, the
+    debt is then paid off by the refill before the next request.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.per_second = per_second
+        self._clock = clock
+        self._level = capacity
+        self._updated_at = clock()
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` (at most the capacity) can be consumed."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.per_second)
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self._level = min(self.capacity, self._level - amount)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(
+            self.capacity, self._level + (now - self._updated_at) * self.per_second
+        )
+        self._updated_at = now
+
+
+class Reservation:
+    """Budget reserved for one request, `used_tokens` is set from its usage."""
+
+    def __init__(self, model: str, tokens: int) -> None:
+        self.model = model
+        self.tokens = tokens
+        self.used_tokens: int | None = None
+
+
+class _Waiter(NamedTuple):
+    priority: int
+    # Order of requests of the same priority, unique so futures aren't compared
+    seq: int
+    tokens: int
+    future: asyncio.Future[None]
+    queued_at: float
+
+
+class _ModelQueue:
+    def __init__(
+        self,
+        model: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float],
+    ) -> None:
+        self.model = model
+        self.requests = TokenBucket(
+            requests_per_minute, requests_per_minute / SECONDS_PER_MINUTE, clock
+        )
+        self.tokens = TokenBucket(
+            tokens_per_minute, tokens_per_minute / SECONDS_PER_MINUTE, clock
+        )
+        self.waiting: list[_Waiter] = []
+        # Set by 429 responses, nothing is sent before this time
+        self.paused_until = 0.0
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class GroqScheduler:
+    """Schedules Groq requests within per-model rate limits.
+
+    Requests wait in a priority queue of their model until the model has
+    request and token budget and fewer than `max_concurrency` requests are
+    in flight overall. Tokens are reserved from an estimate and corrected
+    with the actual usage once the response arrives. A 429 response pauses
+    the whole model for its retry-after instead of every request retrying
+    on its own.
+
+    Not thread safe, meant to be used from the event loop only.
+    """
+
+    def __init__(
+        self,
+        cfg: GroqSettings,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cfg = cfg
+        self._clock = clock
+        self._models: dict[str, _ModelQueue] = {}
+        self._in_flight = 0
+        self._seq = count()
+
+    @asynccontextmanager
+    async def reserve(
+        self,
+        model: str,
+        tokens: int,
+        priority: GroqPriority = GroqPriority.INTERACTIVE,
+    ) -> AsyncIterator[Reservation]:
+        """Wait for budget of the model and hold a concurrency slot.
+
+        Raises:
+            GroqQueueFull: If `max_queued` requests are already waiting.
+        """
+        reservation = Reservation(model, tokens)
+        await self._acquire(reservation, priority)
+        try:
+            yield reservation
+        finally:
+            self._release(reservation)
+
+    def pause(self, model: str, seconds: float) -> None:
+        """Stop sending requests of the model, e.g. after 429 response."""
+        queue = self._model_queue(model)
+        queue.paused_until = max(queue.paused_until, self._clock() + seconds)
+        GROQ_RATE_LIMIT_PAUSES.labels(model).inc()
+        logger.warning("Groq rate limited, pausing model", model=model, seconds=seconds)
+
+    async def _acquire(self, reservation: Reservation, priority: GroqPriority) -> None:
+        queued = sum(len(queue.waiting) for queue in self._models.values())
+        if queued >= self.cfg.max_queued:
+            raise GroqQueueFull(f"{queued} Groq requests are queued")
+
+        queue = self._model_queue(reservation.model)
+        waiter = _Waiter(
+            priority,
+            next(self._seq),
+            reservation.tokens,
+            asyncio.get_running_loop().create_future(),
+            self._clock(),
+        )
+        heapq.heappush(queue.waiting, waiter)
+        GROQ_QUEUED.labels(reservation.model).inc()
+        self._dispatch(queue)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if not waiter.future.cancelled():
+                # Slot was granted but the request gave up before using it
+                self._release(reservation)
+            elif waiter in queue.waiting:
+                queue.waiting.remove(waiter)
+                heapq.heapify(queue.waiting)
+                GROQ_QUEUED.labels(reservation.model).dec()
+                self._dispatch(queue)
+            raise
+
+        GROQ_QUEUE_WAIT_SECONDS.labels(
+            reservation.model, priority.name.lower()
+        ).observe(self._clock() - waiter.queued_at)
+
+    def _release(self, reservation: Reservation) -> None:
+        if reservation.used_tokens is not None:
+            GROQ_TOKENS.labels(reservation.model).inc(reservation.used_tokens)
+            # Pay for tokens used above the estimate, refund the unused ones
+            self._model_queue(reservation.model).tokens.consume(
+                reservation.used_tokens - reservation.tokens
+            )
+        self._in_flight -= 1
+        for queue in self._models.values():
+            self._dispatch(queue)
+
+    def _dispatch(self, queue: _ModelQueue) -> None:
+        """Grant budget to waiting requests of the model in priority order."""
+        while queue.waiting and self._in_flight < self.cfg.max_concurrency:
+            waiter = queue.waiting[0]
+            if waiter.future.done():
+                # Cancelled, but its task hasn't removed it yet
+                heapq.heappop(queue.waiting)
+                GROQ_QUEUED.labels(queue.model).dec()
+                continue
+
+            delay = max(
+                queue.paused_until - self._clock(),
+                queue.requests.time_until(1),
+                queue.tokens.time_until(waiter.tokens),
+            )
+            if delay > 0:
+                self._schedule_dispatch(queue, delay)
+                return
+
+            heapq.heappop(queue.waiting)
+            GROQ_QUEUED.labels(queue.model).dec()
+            queue.requests.consume(1)
+            queue.tokens.consume(waiter.tokens)
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    def _schedule_dispatch(self, queue: _ModelQueue, delay: float) -> None:
+        if queue.timer is not None:
+            queue.timer.cancel()
+        queue.timer = asyncio.get_running_loop().call_later(
+            delay, self._dispatch, queue
+        )
+
+    def _model_queue(self, model: str) -> _ModelQueue:
+        if model not in self._models:
+            limits = self.cfg.model_limits.get(model)
+            self._models[model] = _ModelQueue(
+                model,
+                limits.requests_per_minute if limits else self.cfg.requests_per_minute,
+                limits.tokens_per_minute if limits else self.cfg.tokens_per_minute,
+                self._clock,
+            )
+        return self._models[model]
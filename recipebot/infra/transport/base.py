@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 
 from httpx import Response
 
@@ -16,9 +17,16 @@ class AbstractAsyncHTTPTransport(ABC):
     ) -> tuple[ResponseContent, ResponseMetadata]: ...
 
     @abstractmethod
-    async def stream(self, data: HTTPRequestData) -> Response:
-        """Streaming request
+    def stream(self, data: HTTPRequestData) -> AbstractAsyncContextManager[Response]:
+        """Streaming request, the body is read by the caller.
+
+        Exiting the context closes the response, so the caller can stop
+        reading early without downloading the rest of the body.
 
         Returns:
-            httpx.Response object
+            Context manager of httpx.Response object
         """
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """Close underlying connections"""
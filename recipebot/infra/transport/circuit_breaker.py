@@ -0,0 +1,69 @@
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+from recipebot.metrics.http import HTTP_CLIENT_CIRCUIT_OPEN
+
+
+class CircuitStateEnum(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while a host keeps failing.
+
+    The circuit opens after `failure_threshold` consecutive failures. Once
+    `reset_timeout` passes, one trial request is let through (half-open):
+    its success closes the circuit, its failure opens it again. A trial that
+    never reports back is replaced by a new one after another `reset_timeout`.
+
+    Not thread safe, meant to be used from the event loop only.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitStateEnum.CLOSED
+        self._failures = 0
+        # Time the circuit opened or the last trial request was let through
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitStateEnum:
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request to the host may be sent now."""
+        if self._state == CircuitStateEnum.CLOSED:
+            return True
+        if self._clock() - self._opened_at < self.reset_timeout:
+            return False
+        self._state = CircuitStateEnum.HALF_OPEN
+        self._opened_at = self._clock()
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state != CircuitStateEnum.CLOSED:
+            self._state = CircuitStateEnum.CLOSED
+            HTTP_CLIENT_CIRCUIT_OPEN.labels(self.host).set(0)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if (
+            self._state == CircuitStateEnum.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            self._state = CircuitStateEnum.OPEN
+            self._opened_at = self._clock()
+            HTTP_CLIENT_CIRCUIT_OPEN.labels(self.host).set(1)
@@ -23,6 +23,10 @@ class ConnectionTransportError(BaseTransportException):
     """All connection errors. We do not have any response from server"""
 
 
+class CircuitOpenError(ConnectionTransportError):
+    """Request wasn't sent, the circuit of the host is open after failures."""
+
+
 class ClientError(BaseTransportException):
     """HTTP errors with 400 <= status < 500."""
 
@@ -1,14 +1,27 @@
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from http import HTTPStatus
-from typing import Any
+from http import HTTPMethod, HTTPStatus
+from typing import Any, cast
 
 import structlog
-from httpx import AsyncClient, HTTPStatusError, Request, Response
+from httpx import (
+    AsyncClient,
+    HTTPStatusError,
+    Limits,
+    Request,
+    Response,
+    TransportError,
+)
 from pydantic import AnyHttpUrl
 
 from recipebot.config.config import HTTPTransportSettings
 from recipebot.infra.transport.base import AbstractAsyncHTTPTransport, ResponseMetadata
+from recipebot.infra.transport.circuit_breaker import CircuitBreaker
 from recipebot.infra.transport.exceptions import (
+    CircuitOpenError,
     ClientError,
     ConnectionTransportError,
     ServerError,
@@ -18,12 +31,27 @@ from recipebot.infra.transport.schemas import (
     HTTPRequestData,
     ResponseContent,
 )
+from recipebot.metrics.http import (
+    HTTP_CLIENT_CIRCUIT_REJECTIONS,
+    HTTP_CLIENT_REQUEST_SECONDS,
+    HTTP_CLIENT_RETRIES,
+    HTTPRetryReasonEnum,
+)
 
 logger = structlog.get_logger(__name__)
 
 
+# Only requests safe to send twice are retried
+RETRYABLE_METHODS = frozenset({HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS})
+
+
 class HttpxHTTPTransport(AbstractAsyncHTTPTransport):
-    """Based on httpx, for async calls. TODO:Retry and backoff support with backoff lib."""
+    """Based on httpx, for async calls.
+
+    Transient errors are retried with jittered exponential backoff within the
+    deadline of the call. Every host has its own circuit breaker, requests
+    fail fast with `CircuitOpenError` while its circuit is open.
+    """
 
     def __init__(
         self,
@@ -32,31 +60,21 @@ class HttpxHTTPTransport(AbstractAsyncHTTPTransport):
     ) -> None:
         self.client = client
         self.settings = settings
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
 
     async def request(
         self, data: HTTPRequestData
     ) -> tuple[ResponseContent, ResponseMetadata]:
-        response = await self._make_request(data)
+        deadline = self._deadline()
+        response = await self._make_request(data, deadline)
 
         # Handle redirects manually to capture Location header
         redirect_chain: list[AnyHttpUrl] = [AnyHttpUrl(str(response.url))]
 
         # If this is a redirect response (3xx), follow it manually
-        is_redirect = (
-            HTTPStatus.MULTIPLE_CHOICES <= response.status_code < HTTPStatus.BAD_REQUEST
-        )
-        if is_redirect and "location" in response.headers:
-            location = response.headers["location"]
-            redirect_chain.append(AnyHttpUrl(location))
-
-            # Create a new request to the redirect location
-            redirect_data = HTTPRequestData(
-                url=location,
-                method=data.method,
-                headers=data.headers,
-                params=data.params,
-            )
-            response = await self._make_request(redirect_data)
+        if redirect_data := self._redirect_data(data, response):
+            redirect_chain.append(AnyHttpUrl(redirect_data.url))
+            response = await self._make_request(redirect_data, deadline)
 
         content = self._handle_response(response)
 
@@ -71,21 +89,140 @@ class HttpxHTTPTransport(AbstractAsyncHTTPTransport):
 
         return content, metadata
 
-    async def stream(self, data: HTTPRequestData) -> Response:
-        """Returns a httpx.Response created with stream=True"""
-        response = await self._make_request(data, stream=True)
+    @asynccontextmanager
+    async def stream(self, data: HTTPRequestData) -> AsyncIterator[Response]:
+        """Yields a httpx.Response created with stream=True, closed on exit.
 
+        Redirect is followed the same way as in `request`, error responses
+        are read and raised before yielding. The deadline covers receiving
+        response headers, reading the body is limited by the client timeout.
+        """
+        deadline = self._deadline()
+        response = await self._make_request(data, deadline, stream=True)
         try:
-            return response
+            if redirect_data := self._redirect_data(data, response):
+                await response.aclose()
+                response = await self._make_request(
+                    redirect_data, deadline, stream=True
+                )
+
+            if response.is_error:
+                await response.aread()
+                self._handle_response(response)
+
+            yield response
         finally:
             await response.aclose()
 
-    async def _make_request(self, data: HTTPRequestData, **kwargs) -> Response:
-        try:
-            request = self._prepare_request(data)
-            return await self.client.send(request, **kwargs)
-        except Exception as exc:
-            raise ConnectionTransportError(message=str(exc))
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _make_request(
+        self, data: HTTPRequestData, deadline: float, **kwargs
+    ) -> Response:
+        """Send request, retrying transient errors.
+
+        Retrying stops after `max_retries`, or earlier if the backoff would
+        end past the deadline. The last response is returned as is, error
+        statuses are handled by the caller.
+        """
+        request = self._prepare_request(data)
+        host = request.url.host
+        circuit_breaker = self._circuit_breaker(host)
+        attempt = 0
+        while True:
+            if not circuit_breaker.allow():
+                HTTP_CLIENT_CIRCUIT_REJECTIONS.labels(host).inc()
+                raise CircuitOpenError(message=f"Circuit of {host} is open")
+
+            response: Response | None = None
+            error: ConnectionTransportError | None = None
+            started = time.perf_counter()
+            try:
+                async with asyncio.timeout_at(deadline):
+                    response = await self.client.send(request, **kwargs)
+            except TimeoutError:
+                error = ConnectionTransportError(message="Request deadline exceeded")
+            except TransportError as exc:
+                error = ConnectionTransportError(message=str(exc))
+            finally:
+                HTTP_CLIENT_REQUEST_SECONDS.labels(host).observe(
+                    time.perf_counter() - started
+                )
+
+            if response is None or response.is_server_error:
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
+
+            reason = self._retry_reason(data, response)
+            backoff = self._backoff(attempt)
+            if (
+                reason is None
+                or attempt >= self.settings.max_retries
+                or asyncio.get_running_loop().time() + backoff >= deadline
+            ):
+                if error is not None:
+                    raise error
+                return cast(Response, response)
+
+            bound_logger = logger.bind(host=host, attempt=attempt, reason=reason)
+            bound_logger.warning("Retrying HTTP request", backoff=backoff)
+            HTTP_CLIENT_RETRIES.labels(host, reason).inc()
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+    def _retry_reason(
+        self, data: HTTPRequestData, response: Response | None
+    ) -> HTTPRetryReasonEnum | None:
+        """Reason to retry the request, None if it shouldn't be retried."""
+        if data.method not in RETRYABLE_METHODS:
+            return None
+        if response is None:
+            return HTTPRetryReasonEnum.CONNECTION_ERROR
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return HTTPRetryReasonEnum.RATE_LIMITED
+        if response.is_server_error:
+            return HTTPRetryReasonEnum.SERVER_ERROR
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        ceiling = min(
+            self.settings.retry_backoff_max,
+            self.settings.retry_backoff_base * 2**attempt,
+        )
+        return random.uniform(0, ceiling)  # nosec B311
+
+    def _deadline(self) -> float:
+        return asyncio.get_running_loop().time() + self.settings.deadline
+
+    def _circuit_breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._circuit_breakers:
+            self._circuit_breakers[host] = CircuitBreaker(
+                host,
+                self.settings.circuit_failure_threshold,
+                self.settings.circuit_reset_timeout,
+            )
+        return self._circuit_breakers[host]
+
+    def _redirect_data(
+        self, data: HTTPRequestData, response: Response
+    ) -> HTTPRequestData | None:
+        """Request to the Location of a redirect response, None otherwise."""
+        is_redirect = (
+            HTTPStatus.MULTIPLE_CHOICES <= response.status_code < HTTPStatus.BAD_REQUEST
+        )
+        if not is_redirect or "location" not in response.headers:
+            return None
+        return HTTPRequestData(
+            url=response.headers["location"],
+            method=data.method,
+            headers=data.headers,
+            params=data.params,
+        )
 
     def _prepare_request(self, data: HTTPRequestData) -> Request:
         return self.client.build_request(
@@ -130,16 +267,28 @@ def get_client(  # pragma: no cover
         headers=settings.common_headers,
         timeout=settings.default_timeout,
         follow_redirects=settings.follow_redirects,
+        http2=settings.http2,
+        limits=Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
     )
 
 
+def create_transport(  # pragma: no cover
+    settings: HTTPTransportSettings = HTTPTransportSettings(),
+) -> HttpxHTTPTransport:
+    """Create long-lived transport, the caller is responsible for closing it."""
+    return HttpxHTTPTransport(get_client(settings), settings)
+
+
 @asynccontextmanager
 async def init_transport(  # pragma: no cover
     settings: HTTPTransportSettings = HTTPTransportSettings(),
 ):
-    client = get_client(settings)
-    transport = HttpxHTTPTransport(client, settings)
+    transport = create_transport(settings)
     try:
         yield transport
     finally:
-        await client.aclose()
+        await transport.aclose()
@@ -0,0 +1,40 @@
+from enum import StrEnum
+
+from prometheus_client import Counter
+
+
+class CacheEvictionReasonEnum(StrEnum):
+    SIZE = "size"
+    EXPIRED = "expired"
+
+
+CACHE_HITS = Counter(
+    "recipebot_cache_hits_total",
+    "Total number of in-process cache hits",
+    ["cache"],
+)
+
+CACHE_MISSES = Counter(
+    "recipebot_cache_misses_total",
+    "Total number of in-process cache misses",
+    ["cache"],
+)
+
+CACHE_EVICTIONS = Counter(
+    "recipebot_cache_evictions_total",
+    "Total number of entries evicted from in-process cache",
+    ["cache", "reason"],
+)
+
+
+class TikTokRecipeCacheResultEnum(StrEnum):
+    MEMORY_HIT = "memory_hit"
+    DATABASE_HIT = "database_hit"
+    MISS = "miss"
+
+
+TIKTOK_RECIPE_CACHE_LOOKUPS = Counter(
+    "recipebot_tiktok_recipe_cache_lookups_total",
+    "Total number of parsed TikTok recipe cache lookups by result",
+    ["result"],
+)
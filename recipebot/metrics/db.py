@@ -0,0 +1,27 @@
+from enum import StrEnum
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+class DBPoolConnectionStateEnum(StrEnum):
+    IN_USE = "in_use"
+    IDLE = "idle"
+    MAX = "max"
+
+
+DB_POOL_CONNECTIONS = Gauge(
+    "recipebot_db_pool_connections",
+    "Number of asyncpg pool connections by state",
+    ["state"],
+)
+
+DB_POOL_ACQUIRE_SECONDS = Histogram(
+    "recipebot_db_pool_acquire_seconds",
+    "Time spent waiting for a connection from asyncpg pool",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+DB_POOL_ACQUIRE_TIMEOUTS = Counter(
+    "recipebot_db_pool_acquire_timeouts_total",
+    "Total number of asyncpg pool acquire attempts that timed out",
+)
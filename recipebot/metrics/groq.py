@@ -0,0 +1,26 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+GROQ_QUEUED = Gauge(
+    "recipebot_groq_queued_requests",
+    "Number of Groq requests waiting for rate limit budget",
+    ["model"],
+)
+
+GROQ_QUEUE_WAIT_SECONDS = Histogram(
+    "recipebot_groq_queue_wait_seconds",
+    "Time Groq requests waited for rate limit budget",
+    ["model", "priority"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60),
+)
+
+GROQ_RATE_LIMIT_PAUSES = Counter(
+    "recipebot_groq_rate_limit_pauses_total",
+    "Total number of 429 responses pausing requests of the model",
+    ["model"],
+)
+
+GROQ_TOKENS = Counter(
+    "recipebot_groq_tokens_total",
+    "Total number of tokens used by Groq requests",
+    ["model"],
+)
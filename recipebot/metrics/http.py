@@ -0,0 +1,35 @@
+from enum import StrEnum
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+class HTTPRetryReasonEnum(StrEnum):
+    CONNECTION_ERROR = "connection_error"
+    RATE_LIMITED = "rate_limited"
+    SERVER_ERROR = "server_error"
+
+
+HTTP_CLIENT_REQUEST_SECONDS = Histogram(
+    "recipebot_http_client_request_seconds",
+    "Duration of outgoing HTTP request attempts until response headers",
+    ["host"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 30),
+)
+
+HTTP_CLIENT_RETRIES = Counter(
+    "recipebot_http_client_retries_total",
+    "Total number of retried outgoing HTTP requests by reason",
+    ["host", "reason"],
+)
+
+HTTP_CLIENT_CIRCUIT_OPEN = Gauge(
+    "recipebot_http_client_circuit_open",
+    "Whether circuit of the host is open (1) or closed (0)",
+    ["host"],
+)
+
+HTTP_CLIENT_CIRCUIT_REJECTIONS = Counter(
+    "recipebot_http_client_circuit_rejections_total",
+    "Total number of outgoing HTTP requests not sent because of open circuit",
+    ["host"],
+)
@@ -0,0 +1,25 @@
+from prometheus_client import Counter, Histogram
+
+PERSISTENCE_FLUSH_SECONDS = Histogram(
+    "recipebot_persistence_flush_seconds",
+    "Time spent writing changed bot persistence entries to the database",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+PERSISTENCE_BYTES_WRITTEN = Counter(
+    "recipebot_persistence_bytes_written_total",
+    "Total number of serialized bot persistence bytes written",
+    ["namespace"],
+)
+
+PERSISTENCE_ENTRIES_WRITTEN = Counter(
+    "recipebot_persistence_entries_written_total",
+    "Total number of bot persistence entries written or deleted",
+    ["namespace"],
+)
+
+PERSISTENCE_ENTRIES_UNCHANGED = Counter(
+    "recipebot_persistence_entries_unchanged_total",
+    "Total number of bot persistence entries skipped as unchanged",
+    ["namespace"],
+)
@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge, Histogram
 
 
 class RecipeCreationSourceEnum(StrEnum):
@@ -14,3 +14,40 @@ RECIPES_CREATED = Counter(
     "Total number of recipes created by users",
     ["source"],
 )
+
+RECIPE_IMPORT_STAGE_SECONDS = Histogram(
+    "recipebot_recipe_import_stage_seconds",
+    "Time TikTok import jobs spend in each stage, total is the whole job",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60),
+)
+
+RECIPE_IMPORT_JOBS = Counter(
+    "recipebot_recipe_import_jobs_total",
+    "Total number of finished TikTok import jobs by status",
+    ["status"],
+)
+
+RECIPE_IMPORT_QUEUED = Gauge(
+    "recipebot_recipe_import_queued",
+    "Number of TikTok import jobs waiting for a worker",
+)
+
+
+class RecipeParserEnum(StrEnum):
+    RULES = "rules"
+    LLM = "llm"
+
+
+RECIPE_PARSES = Counter(
+    "recipebot_recipe_parses_total",
+    "Total number of parsed recipe texts by the parser used, rules skip the LLM",
+    ["kind", "parser"],
+)
+
+RECIPE_PARSE_CONFIDENCE = Histogram(
+    "recipebot_recipe_parse_confidence",
+    "Confidence of rule-based parsing, the LLM is used below the minimum",
+    ["kind"],
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1),
+)
@@ -17,3 +17,9 @@ class RecipeNotFound(RepositoryException):
         self.message = message
         self.recipe_id = recipe_id
         super().__init__(self.message, self.recipe_id)
+
+
+class MissingQueryFiles(RepositoryException):
+    def __init__(self, paths: list[str]) -> None:
+        self.paths = paths
+        super().__init__(f"SQL query files are missing: {', '.join(paths)}")
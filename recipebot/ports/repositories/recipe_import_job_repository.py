@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from recipebot.domain.recipe.recipe import RecipeImportJob
+
+
+class RecipeImportJobRepositoryABC(ABC):
+    @abstractmethod
+    async def add(self, job: RecipeImportJob) -> None:
+        pass
+
+    @abstractmethod
+    async def update(self, job: RecipeImportJob) -> None:
+        """Save status, stage and result of the job."""
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: UUID) -> RecipeImportJob | None:
+        pass
+
+    @abstractmethod
+    async def list_unfinished(self) -> list[RecipeImportJob]:
+        """Queued and running jobs, oldest first."""
+        pass
@@ -2,7 +2,15 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
-from recipebot.domain.recipe.recipe import Recipe
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageRequest,
+    RecipePage,
+)
+from recipebot.domain.recipe.recipe import (
+    Recipe,
+    RecipeIngredientMatch,
+    RecipeSummary,
+)
 
 
 class RecipeRepositoryABC(ABC):
@@ -19,6 +27,28 @@ class RecipeRepositoryABC(ABC):
         """List recipes with optional filtering by tags and categories."""
         pass
 
+    @abstractmethod
+    async def list_summaries(
+        self, filters: RecipeFilters, page: PageRequest
+    ) -> RecipePage[RecipeSummary]:
+        """List a single page of filtered recipe summaries ordered by title."""
+        pass
+
+    @abstractmethod
+    async def fuzzy_search(self, user_id: int, query: str) -> list[RecipeSummary]:
+        """Find recipes whose title or ingredients resemble the query.
+
+        Tolerates typos, results are ordered by similarity.
+        """
+        pass
+
+    @abstractmethod
+    async def list_by_ingredients(
+        self, user_id: int, ingredient_names: list[str], limit: int = 10
+    ) -> list[RecipeIngredientMatch]:
+        """List recipes using any of the ingredients, most matched first."""
+        pass
+
     @abstractmethod
     async def update(self, recipe_data: Recipe) -> Recipe:
         pass
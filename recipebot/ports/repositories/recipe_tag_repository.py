@@ -22,3 +22,10 @@ class RecipeTagRepositoryABC(ABC):
     async def get_or_create_tag(self, name: str, user_id: int) -> RecipeTag:
         """Get existing tag or create new one."""
         pass
+
+    @abstractmethod
+    async def get_or_create_tags(
+        self, names: list[str], user_id: int
+    ) -> list[RecipeTag]:
+        """Get existing tags or create missing ones, in no particular order."""
+        pass
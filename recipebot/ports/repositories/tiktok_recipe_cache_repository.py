@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from recipebot.domain.recipe.recipe import TikTokRecipeCacheEntry
+
+
+class TikTokRecipeCacheRepositoryABC(ABC):
+    @abstractmethod
+    async def get(self, video_id: str) -> TikTokRecipeCacheEntry | None:
+        """Get parsed recipe of the video, None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def add(self, entry: TikTokRecipeCacheEntry) -> None:
+        pass
@@ -0,0 +1,5 @@
+from recipebot.ports.services.recipe_import_notifier.recipe_import_notifier import (
+    RecipeImportNotifierABC,
+)
+
+__all__ = ["RecipeImportNotifierABC"]
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from recipebot.domain.recipe.recipe import RecipeImportJob, RecipePreview
+
+
+class RecipeImportNotifierABC(ABC):
+    """Report progress and result of a background TikTok import to the user."""
+
+    @abstractmethod
+    async def progress(self, job: RecipeImportJob) -> None:
+        """Job moved to the next stage."""
+        pass
+
+    @abstractmethod
+    async def preview(self, job: RecipeImportJob, preview: RecipePreview) -> None:
+        """Part of the recipe was parsed, called often while parsing."""
+        pass
+
+    @abstractmethod
+    async def completed(self, job: RecipeImportJob) -> None:
+        """Job is done, `job.recipe` is set."""
+        pass
+
+    @abstractmethod
+    async def failed(self, job: RecipeImportJob) -> None:
+        """Job failed, `job.error` is set."""
+        pass
@@ -1,4 +1,7 @@
-from recipebot.ports.services.recipe_parser.recipe_parser import RecipeParserABC
+from recipebot.ports.services.recipe_parser.recipe_parser import (
+    PreviewCallback,
+    RecipeParserABC,
+)
 from recipebot.ports.services.recipe_parser.schemas import RecipeDTO
 
-__all__ = ["RecipeParserABC", "RecipeDTO"]
+__all__ = ["PreviewCallback", "RecipeParserABC", "RecipeDTO"]
@@ -1,14 +1,26 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 
-from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO
+from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO, RecipePreview
+
+# Called with the recipe parsed so far, e.g. to show it to the user
+type PreviewCallback = Callable[[RecipePreview], Awaitable[None]]
 
 
 class RecipeParserABC(ABC):
     """Parse recipe description."""
 
     @abstractmethod
-    async def parse(self, description: str) -> RecipeDTO:
-        """Parse recipe description, ingredients and steps from raw text with LLM."""
+    async def parse(
+        self, description: str, on_preview: PreviewCallback | None = None
+    ) -> RecipeDTO:
+        """Parse recipe description, ingredients and steps from raw text with LLM.
+
+        Args:
+            description: Raw recipe text
+            on_preview: Called with the recipe parsed so far, if the parser
+                can report it before the whole recipe is parsed
+        """
         pass
 
     @abstractmethod
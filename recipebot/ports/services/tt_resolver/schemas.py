@@ -6,3 +6,5 @@ class ResolutionResult(BaseModel):
 
     description: str | None
     source_url: AnyHttpUrl
+    # Canonical id from the final URL, same for every link to the video
+    video_id: str | None = None
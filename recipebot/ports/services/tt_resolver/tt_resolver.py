@@ -6,6 +6,16 @@ from recipebot.ports.services.tt_resolver.schemas import ResolutionResult
 class TTResolverABC(ABC):
     """Resolve TikTok recipe description from URL."""
 
+    @abstractmethod
+    def canonical_video_id(self, url: str) -> str | None:
+        """Get video id from a full TikTok video URL without any requests.
+
+        Returns:
+            Video id, or None for short (vm./vt.) links which have to be
+            resolved first
+        """
+        pass
+
     @abstractmethod
     async def resolve(self, url: str) -> ResolutionResult:
         """Resolve TikTok description from URL.
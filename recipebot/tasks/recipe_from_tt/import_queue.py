@@ -0,0 +1,162 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+import structlog
+
+from recipebot.config import settings
+from recipebot.config.config import RecipeImportSettings
+from recipebot.domain.recipe.recipe import (
+    RecipeImportJob,
+    RecipeImportJobStatus,
+    RecipeImportStage,
+    RecipePreview,
+)
+from recipebot.metrics.recipes import (
+    RECIPE_IMPORT_JOBS,
+    RECIPE_IMPORT_QUEUED,
+    RECIPE_IMPORT_STAGE_SECONDS,
+)
+from recipebot.ports.repositories.recipe_import_job_repository import (
+    RecipeImportJobRepositoryABC,
+)
+from recipebot.ports.services.recipe_import_notifier import RecipeImportNotifierABC
+from recipebot.tasks.recipe_from_tt.recipe_from_tt import RecipeFromTTTask
+
+logger = structlog.get_logger(__name__)
+
+# Label of the whole job duration in the stage histogram
+TOTAL_STAGE_LABEL = "total"
+
+
+class RecipeImportQueueFull(Exception):
+    """Too many imports are waiting for a worker."""
+
+
+class RecipeImportQueue:
+    """Runs TikTok imports on a bounded pool of background workers.
+
+    Jobs are stored before they are queued and every stage change is saved,
+    so jobs interrupted by a restart are queued again by `start`. Progress
+    and results are reported through the notifier, its errors never fail
+    the job.
+    """
+
+    def __init__(
+        self,
+        task: RecipeFromTTTask,
+        job_repo: RecipeImportJobRepositoryABC,
+        notifier: RecipeImportNotifierABC,
+        cfg: RecipeImportSettings = settings.RECIPE_IMPORT,
+    ) -> None:
+        self.task = task
+        self.job_repo = job_repo
+        self.notifier = notifier
+        self.cfg = cfg
+        self._queue: asyncio.Queue[RecipeImportJob] = asyncio.Queue()
+        # Monotonic time jobs were queued at, for the queued stage latency
+        self._queued_at: dict[UUID, float] = {}
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Queue unfinished jobs of the previous run and start workers."""
+        unfinished = await self.job_repo.list_unfinished()
+        for job in unfinished:
+            self._enqueue(job)
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"recipe-import-worker-{i}")
+            for i in range(self.cfg.workers)
+        ]
+        logger.info(
+            "Started recipe import workers",
+            workers=self.cfg.workers,
+            resumed=len(unfinished),
+        )
+
+    async def stop(self) -> None:
+        """Cancel workers, interrupted jobs are resumed on the next start."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, job: RecipeImportJob) -> None:
+        """Store the job and queue it for a worker.
+
+        Raises:
+            RecipeImportQueueFull: If `max_queued` jobs are already waiting.
+        """
+        if self._queue.qsize() >= self.cfg.max_queued:
+            raise RecipeImportQueueFull(f"{self._queue.qsize()} imports are queued")
+        await self.job_repo.add(job)
+        self._enqueue(job)
+
+    def _enqueue(self, job: RecipeImportJob) -> None:
+        self._queued_at[job.id] = time.perf_counter()
+        self._queue.put_nowait(job)
+        RECIPE_IMPORT_QUEUED.set(self._queue.qsize())
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            RECIPE_IMPORT_QUEUED.set(self._queue.qsize())
+            try:
+                await self._run(job)
+            except Exception:
+                logger.exception("Recipe import job crashed", job_id=job.id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: RecipeImportJob) -> None:
+        bound_logger = logger.bind(job_id=job.id, user_id=job.user_id)
+        job_started = self._queued_at.pop(job.id, time.perf_counter())
+        stage_started = job_started
+
+        async def on_stage(stage: RecipeImportStage) -> None:
+            nonlocal stage_started
+            now = time.perf_counter()
+            RECIPE_IMPORT_STAGE_SECONDS.labels(job.stage).observe(now - stage_started)
+            stage_started = now
+            job.stage = stage
+            await self.job_repo.update(job)
+            if stage != RecipeImportStage.FINISHED:
+                await self._notify(self.notifier.progress, job)
+
+        async def on_preview(preview: RecipePreview) -> None:
+            await self._notify(self.notifier.preview, job, preview)
+
+        # Resumed jobs start over, whatever stage they were interrupted at
+        job.stage = RecipeImportStage.QUEUED
+        job.status = RecipeImportJobStatus.RUNNING
+        bound_logger.info("Running recipe import job")
+        try:
+            job.recipe = await self.task.run(job.url, on_stage, on_preview)
+            job.status = RecipeImportJobStatus.DONE
+        except Exception as exc:
+            bound_logger.warning("Recipe import job failed", error=str(exc))
+            job.error = str(exc)
+            job.status = RecipeImportJobStatus.FAILED
+
+        await on_stage(RecipeImportStage.FINISHED)
+        RECIPE_IMPORT_STAGE_SECONDS.labels(TOTAL_STAGE_LABEL).observe(
+            time.perf_counter() - job_started
+        )
+        RECIPE_IMPORT_JOBS.labels(job.status).inc()
+
+        if job.status == RecipeImportJobStatus.DONE:
+            await self._notify(self.notifier.completed, job)
+        else:
+            await self._notify(self.notifier.failed, job)
+
+    async def _notify(
+        self,
+        notify: Callable[..., Awaitable[None]],
+        job: RecipeImportJob,
+        *args: Any,
+    ) -> None:
+        try:
+            await notify(job, *args)
+        except Exception:
+            logger.exception("Failed to notify about recipe import job", job_id=job.id)
@@ -1,31 +1,102 @@
 import logging
+from collections.abc import Awaitable, Callable
 
-from recipebot.domain.recipe.recipe import RecipeDTO
-from recipebot.ports.services.recipe_parser import RecipeParserABC
+from recipebot.domain.recipe.recipe import (
+    RecipeDTO,
+    RecipeImportStage,
+    TikTokRecipeCacheEntry,
+)
+from recipebot.ports.repositories.tiktok_recipe_cache_repository import (
+    TikTokRecipeCacheRepositoryABC,
+)
+from recipebot.ports.services.recipe_parser import PreviewCallback, RecipeParserABC
 from recipebot.ports.services.tt_resolver import ResolutionResult, TTResolverABC
 
 logger = logging.getLogger(__name__)
 
+# Called when the task starts a stage, e.g. to report progress to the user
+type StageCallback = Callable[[RecipeImportStage], Awaitable[None]]
+
+
+async def _ignore_stage(stage: RecipeImportStage) -> None:
+    pass
+
 
 class RecipeFromTTTask:
     def __init__(
         self,
         tt_resolver: TTResolverABC,
         recipe_parser: RecipeParserABC,
+        recipe_cache: TikTokRecipeCacheRepositoryABC | None = None,
     ):
         self.tt_resolver = tt_resolver
         self.recipe_parser = recipe_parser
+        self.recipe_cache = recipe_cache
+
+    async def run(
+        self,
+        url: str,
+        on_stage: StageCallback = _ignore_stage,
+        on_preview: PreviewCallback | None = None,
+    ) -> RecipeDTO:
+        """Get recipe of the TikTok video, parsing its description if not cached.
 
-    async def run(self, url: str) -> RecipeDTO:
+        Full video URLs are looked up in the cache before fetching the page,
+        short links only after resolving them to the video id. `on_preview`
+        gets the recipe parsed so far while the description is parsed.
+        """
+        video_id = self.tt_resolver.canonical_video_id(url)
+        if cached := await self._get_cached(video_id):
+            return cached.recipe
+
+        await on_stage(RecipeImportStage.FETCHING)
         resolution_result = await self.tt_resolver.resolve(url)
+        if video_id is None and (
+            cached := await self._get_cached(resolution_result.video_id)
+        ):
+            return cached.recipe
+
         if resolution_result.description is None:
             logger.info("No description found in TikTok URL")
             return self._handle_no_description(resolution_result)
 
-        recipe_dto = await self.recipe_parser.parse(resolution_result.description)
+        await on_stage(RecipeImportStage.PARSING)
+        recipe_dto = await self.recipe_parser.parse(
+            resolution_result.description, on_preview
+        )
         recipe_dto.link = resolution_result.source_url
+        await self._cache(resolution_result, recipe_dto)
         return recipe_dto
 
+    async def _get_cached(self, video_id: str | None) -> TikTokRecipeCacheEntry | None:
+        if self.recipe_cache is None or video_id is None:
+            return None
+        try:
+            entry = await self.recipe_cache.get(video_id)
+        except Exception:
+            logger.exception("Failed to get cached TikTok recipe")
+            return None
+        if entry is not None:
+            logger.info(f"Using cached recipe of TikTok video {video_id}")
+        return entry
+
+    async def _cache(
+        self, resolution_result: ResolutionResult, recipe_dto: RecipeDTO
+    ) -> None:
+        if self.recipe_cache is None or resolution_result.video_id is None:
+            return
+        try:
+            await self.recipe_cache.add(
+                TikTokRecipeCacheEntry(
+                    video_id=resolution_result.video_id,
+                    description=resolution_result.description,
+                    recipe=recipe_dto.model_copy(deep=True),
+                )
+            )
+        except Exception:
+            # Parsed recipe is still good, next import just parses it again
+            logger.exception("Failed to cache parsed TikTok recipe")
+
     def _handle_no_description(self, resolution_result: ResolutionResult) -> RecipeDTO:
         return RecipeDTO(
             title="No title found in TikTok URL",
@@ -0,0 +1,56 @@
+"""Compare TikTok description extraction paths over saved HTML pages.
+
+Usage:
+    python -m recipebot.tests.benchmarks.bench_tt_description [page.html ...]
+
+Saved pages from `tests/fixtures/tiktok` are used when no files are given.
+"""
+
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+from recipebot.adapters.services.tt_resolver import (
+    HttpxTTResolver,
+    UniversalDataExtractor,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "tiktok"
+REPEATS = 5
+NUMBER = 20
+# Roughly what httpx yields per chunk of a response
+CHUNK_SIZE = 64 * 1024
+
+
+def _best_ms(func, html: str) -> float:
+    timings = timeit.repeat(lambda: func(html), repeat=REPEATS, number=NUMBER)
+    return min(timings) / NUMBER * 1000
+
+
+def _extract_streamed(resolver: HttpxTTResolver, html: str) -> str | None:
+    """Path of `resolve`, the page is fed until the end of the data script."""
+    extractor = UniversalDataExtractor()
+    for i in range(0, len(html), CHUNK_SIZE):
+        if extractor.feed(html[i : i + CHUNK_SIZE]):
+            break
+    return resolver._extract_streamed_description(extractor)
+
+
+def main(paths: list[Path]) -> None:
+    # Pages without description would log a warning on every run
+    logging.disable(logging.WARNING)
+    resolver = HttpxTTResolver(None)  # type: ignore[arg-type]
+    print(f"{'page':<40}{'size KB':>10}{'soup ms':>10}{'fast ms':>10}{'speedup':>10}")
+    for path in paths:
+        html = path.read_text()
+        soup_ms = _best_ms(resolver._extract_description_with_soup, html)
+        fast_ms = _best_ms(lambda page: _extract_streamed(resolver, page), html)
+        print(
+            f"{path.name:<40}{len(html) / 1024:>10.0f}{soup_ms:>10.2f}"
+            f"{fast_ms:>10.3f}{soup_ms / fast_ms:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([Path(p) for p in sys.argv[1:]] or sorted(FIXTURES_DIR.glob("*.html")))
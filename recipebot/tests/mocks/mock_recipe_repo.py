@@ -1,7 +1,19 @@
+from difflib import SequenceMatcher
 from uuid import UUID
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
-from recipebot.domain.recipe.recipe import Recipe
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageDirection,
+    PageRequest,
+    RecipePage,
+)
+from recipebot.config.config import FuzzySearchSettings
+from recipebot.domain.recipe.recipe import (
+    Recipe,
+    RecipeIngredientMatch,
+    RecipeSummary,
+    canonical_ingredient_name,
+)
 from recipebot.ports.repositories.exceptions import RecipeNotFound
 from recipebot.ports.repositories.recipe_repository import RecipeRepositoryABC
 from recipebot.ports.repositories.recipe_tag_repository import RecipeTagRepositoryABC
@@ -12,6 +24,7 @@ class MockRecipeRepo(RecipeRepositoryABC):
         self._recipes: list[Recipe] = []
         self.tag_repo = tag_repo
         self._next_tag_id = 1
+        self.fuzzy_cfg = FuzzySearchSettings()
 
     async def add(self, recipe_data: Recipe) -> Recipe:
         """Add a recipe and return it (simulating database insertion)."""
@@ -32,7 +45,7 @@ class MockRecipeRepo(RecipeRepositoryABC):
         raise RecipeNotFound(f"Recipe with ID {id} not found")
 
     async def list_filtered(self, filters: RecipeFilters) -> list[Recipe]:
-        """List recipes with optional filtering by tags and categories."""
+        """List recipes with optional filtering by tags, categories and text."""
         user_recipes = [
             recipe for recipe in self._recipes if recipe.user_id == filters.user_id
         ]
@@ -55,8 +68,118 @@ class MockRecipeRepo(RecipeRepositoryABC):
                     filtered_recipes.append(recipe)
             user_recipes = filtered_recipes
 
+        # Apply text filtering, every query word must be present
+        if filters.query:
+            words = filters.query.lower().split()
+            user_recipes = [
+                recipe
+                for recipe in user_recipes
+                if all(word in self._search_text(recipe) for word in words)
+            ]
+
         return user_recipes
 
+    @staticmethod
+    def _search_text(recipe: Recipe) -> str:
+        parts = [recipe.title, recipe.desc or ""]
+        parts += [ingredient.name for ingredient in recipe.ingredients]
+        parts += recipe.steps
+        return " ".join(parts).lower()
+
+    async def list_summaries(
+        self, filters: RecipeFilters, page: PageRequest
+    ) -> RecipePage[RecipeSummary]:
+        """List a single page of filtered recipe summaries ordered by (title, id).
+
+        Text queries are ordered by rank first, approximated by the number of
+        query word occurrences.
+        """
+        words = (filters.query or "").lower().split()
+
+        def rank(recipe: Recipe) -> int:
+            text = self._search_text(recipe)
+            return sum(text.count(word) for word in words)
+
+        recipes = sorted(
+            await self.list_filtered(filters),
+            key=lambda r: (-rank(r), r.title, str(r.id)),
+        )
+        page = page.clamp(len(recipes))
+
+        items: list[Recipe] = []
+        cursor = page.cursor
+        if cursor is not None:
+            ids = [r.id for r in recipes]
+            if cursor.recipe_id in ids:
+                idx = ids.index(cursor.recipe_id)
+                if cursor.direction == PageDirection.BEFORE:
+                    items = recipes[max(idx - page.page_size, 0) : idx]
+                else:
+                    items = recipes[idx + 1 : idx + 1 + page.page_size]
+        if not items:
+            items = recipes[page.offset : page.offset + page.page_size]
+
+        return RecipePage(
+            [RecipeSummary(r.id, r.title, r.category, r.tags) for r in items],
+            page.page,
+            page.page_size,
+            len(recipes),
+            keyset=not filters.query,
+        )
+
+    async def fuzzy_search(self, user_id: int, query: str) -> list[RecipeSummary]:
+        """Find recipes by best per-word similarity, approximating pg_trgm."""
+
+        def similarity(recipe: Recipe) -> float:
+            words = recipe.title.lower().split()
+            for ingredient in recipe.ingredients:
+                words += ingredient.name.lower().split()
+            return max(
+                (SequenceMatcher(None, query.lower(), word).ratio() for word in words),
+                default=0.0,
+            )
+
+        scored = [
+            (similarity(recipe), recipe)
+            for recipe in self._recipes
+            if recipe.user_id == user_id
+        ]
+        matches = sorted(
+            (
+                (score, recipe)
+                for score, recipe in scored
+                if score >= self.fuzzy_cfg.similarity_threshold
+            ),
+            key=lambda item: (-item[0], item[1].title, str(item[1].id)),
+        )
+        return [
+            RecipeSummary(r.id, r.title, r.category, r.tags)
+            for _, r in matches[: self.fuzzy_cfg.top_k]
+        ]
+
+    async def list_by_ingredients(
+        self, user_id: int, ingredient_names: list[str], limit: int = 10
+    ) -> list[RecipeIngredientMatch]:
+        """List recipes using any of the ingredients, most matched first."""
+        wanted = {canonical_ingredient_name(name) for name in ingredient_names}
+        matches = []
+        for r in self._recipes:
+            if r.user_id != user_id:
+                continue
+            names = {canonical_ingredient_name(i.name) for i in r.ingredients}
+            if matched := len(names & wanted):
+                summary = RecipeSummary(r.id, r.title, r.category, r.tags)
+                matches.append(RecipeIngredientMatch(summary, matched, len(names)))
+        matches.sort(
+            key=lambda m: (
+                -m.matched,
+                m.total - m.matched,
+                m.recipe.title,
+                str(m.recipe.id),
+            )
+        )
+        return matches[:limit]
+
     async def update(self, recipe_data: Recipe) -> Recipe:
         """Update a recipe."""
         for i, recipe in enumerate(self._recipes):
@@ -43,6 +43,14 @@ class MockRecipeTagRepo(RecipeTagRepositoryABC):
         )
         return await self.create_tag(new_tag)
 
+    async def get_or_create_tags(
+        self, names: list[str], user_id: int
+    ) -> list[RecipeTag]:
+        """Get existing tags or create missing ones."""
+        return [
+            await self.get_or_create_tag(name, user_id) for name in dict.fromkeys(names)
+        ]
+
     def get_tags(self) -> list[RecipeTag]:
         """Helper method to get all tags for testing purposes."""
         return self._tags.copy()
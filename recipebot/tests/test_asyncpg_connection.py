@@ -0,0 +1,75 @@
+"""Tests for AsyncpgConnection pool handling."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from recipebot.adapters.repositories.sql.base.base_asyncpg_repo import AsyncpgConnection
+from recipebot.metrics.db import DB_POOL_ACQUIRE_TIMEOUTS
+
+
+class FakeConnection:
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+class FakePool:
+    """Pool handing out new fake connections, or timing out when exhausted."""
+
+    def __init__(self, exhausted: bool = False) -> None:
+        self.exhausted = exhausted
+        self.acquired = 0
+
+    async def acquire(self, timeout: float | None = None):
+        if self.exhausted:
+            raise TimeoutError
+        self.acquired += 1
+        return FakeConnection()
+
+    async def release(self, conn) -> None:
+        pass
+
+
+def _connection_with(pool: FakePool) -> AsyncpgConnection:
+    conn = AsyncpgConnection()
+    conn._pool = pool  # type: ignore[assignment]
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_is_counted():
+    conn = _connection_with(FakePool(exhausted=True))
+    timeouts_before = DB_POOL_ACQUIRE_TIMEOUTS._value.get()
+
+    with pytest.raises(TimeoutError):
+        async with conn.get_cursor():
+            pass
+
+    assert DB_POOL_ACQUIRE_TIMEOUTS._value.get() == timeouts_before + 1
+
+
+@pytest.mark.asyncio
+async def test_transaction_reuses_connection():
+    pool = FakePool()
+    conn = _connection_with(pool)
+
+    async with conn.transaction() as tx_conn:
+        async with conn.get_cursor() as nested_conn:
+            assert nested_conn is tx_conn
+
+    async with conn.get_cursor() as other_conn:
+        assert other_conn is not tx_conn
+    assert pool.acquired == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_transaction_is_not_shared_between_pools():
+    conn = _connection_with(FakePool())
+    other_pool = FakePool()
+    other = _connection_with(other_pool)
+
+    async with conn.transaction() as tx_conn:
+        async with other.get_cursor() as other_conn:
+            assert other_conn is not tx_conn
+    assert other_pool.acquired == 1
@@ -0,0 +1,151 @@
+"""Tests for parsing TikTok descriptions with Groq."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from recipebot.adapters.services.groq_parser.recipe_parser import GroqRecipeParser
+from recipebot.adapters.services.groq_parser.schemas import (
+    IngredientsExtractionSchema,
+    RecipeMetadataExtractionSchema,
+    StepsExtractionSchema,
+)
+from recipebot.config.config import TiktokDescriptionParseSettings
+from recipebot.config.enums import TiktokDescriptionParseMode
+from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO, RecipePreview
+from recipebot.infra.groq.client import GroqClient, PartialCallback
+from recipebot.infra.groq.scheduler import GroqPriority
+
+DESCRIPTION = "Pancakes for 2: 200g flour, 2 eggs. Mix and fry. Ready in 15 minutes."
+
+INGREDIENTS = [
+    Ingredient(name="flour", qty="200", unit="g", group="Main"),
+    Ingredient(name="eggs", qty="2", group="Main"),
+]
+
+ANSWERS: dict[type[BaseModel], BaseModel] = {
+    RecipeMetadataExtractionSchema: RecipeMetadataExtractionSchema(
+        title="Pancakes", desc=None, servings=2, estimated_time="15 minutes"
+    ),
+    IngredientsExtractionSchema: IngredientsExtractionSchema(ingredients=INGREDIENTS),
+    StepsExtractionSchema: StepsExtractionSchema(steps=["Mix", "Fry"]),
+    RecipeDTO: RecipeDTO(
+        title="Pancakes",
+        desc=None,
+        ingredients=INGREDIENTS,
+        steps=["Mix", "Fry"],
+        estimated_time="15 minutes",
+    ),
+}
+
+
+class FakeGroqClient(GroqClient):
+    """Answers by the schema, counts completions running at once."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, GroqPriority]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def get_json_structured_output_completion(  # type: ignore[override]
+        self,
+        model: str,
+        messages,
+        schema: type[BaseModel],
+        schema_name: str,
+        priority: GroqPriority = GroqPriority.INTERACTIVE,
+    ) -> BaseModel:
+        self.calls.append((schema_name, priority))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return ANSWERS[schema]
+
+    async def stream_json_structured_output_completion(  # type: ignore[override]  # noqa: PLR0913
+        self,
+        model: str,
+        messages,
+        schema: type[BaseModel],
+        schema_name: str,
+        *,
+        on_partial: PartialCallback,
+        priority: GroqPriority = GroqPriority.INTERACTIVE,
+    ) -> BaseModel:
+        answer = ANSWERS[schema].model_dump()
+        # Report the answer as it would be streamed, one field at a time
+        partial = {}
+        for field, value in answer.items():
+            partial[field] = value
+            await on_partial(dict(partial))
+        return await self.get_json_structured_output_completion(
+            model, messages, schema, schema_name, priority
+        )
+
+
+def _parser(
+    mode: TiktokDescriptionParseMode, stream_preview: bool = True
+) -> tuple[GroqRecipeParser, FakeGroqClient]:
+    client = FakeGroqClient()
+    cfg = TiktokDescriptionParseSettings(mode=mode, stream_preview=stream_preview)
+    return GroqRecipeParser(client, cfg), client
+
+
+@pytest.mark.asyncio
+async def test_single_mode_parses_with_one_completion():
+    parser, client = _parser(TiktokDescriptionParseMode.SINGLE)
+
+    await parser.parse(DESCRIPTION)
+
+    assert client.calls == [("RecipeDTO", GroqPriority.BACKGROUND)]
+
+
+@pytest.mark.asyncio
+async def test_split_mode_merges_concurrent_extractions():
+    parser, client = _parser(TiktokDescriptionParseMode.SPLIT)
+
+    recipe = await parser.parse(DESCRIPTION)
+
+    assert client.max_running == 3  # noqa: PLR2004
+    assert sorted(client.calls) == [
+        ("Ingredients", GroqPriority.BACKGROUND),
+        ("RecipeMetadata", GroqPriority.BACKGROUND),
+        ("Steps", GroqPriority.BACKGROUND),
+    ]
+    assert recipe.title == "Pancakes"
+    assert recipe.servings == 2  # noqa: PLR2004
+    assert recipe.estimated_time == "15 minutes"
+    assert [ingredient.name for ingredient in recipe.ingredients] == ["flour", "eggs"]
+    assert recipe.steps == ["Mix", "Fry"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode", [TiktokDescriptionParseMode.SINGLE, TiktokDescriptionParseMode.SPLIT]
+)
+async def test_preview_shows_title_and_ingredients(mode: TiktokDescriptionParseMode):
+    parser, _ = _parser(mode)
+    previews: list[RecipePreview] = []
+
+    async def on_preview(preview: RecipePreview) -> None:
+        previews.append(preview)
+
+    await parser.parse(DESCRIPTION, on_preview)
+
+    # Title is shown before the ingredients are generated
+    assert previews[0] == RecipePreview(title="Pancakes")
+    assert previews[-1] == RecipePreview(title="Pancakes", ingredients=INGREDIENTS)
+
+
+@pytest.mark.asyncio
+async def test_preview_can_be_disabled():
+    parser, _ = _parser(TiktokDescriptionParseMode.SINGLE, stream_preview=False)
+    previews: list[RecipePreview] = []
+
+    async def on_preview(preview: RecipePreview) -> None:
+        previews.append(preview)
+
+    await parser.parse(DESCRIPTION, on_preview)
+
+    assert previews == []
@@ -0,0 +1,218 @@
+"""Tests for rate-limited scheduling of Groq requests."""
+
+import asyncio
+
+import httpx
+import pytest
+from groq import AsyncGroq, RateLimitError
+from pydantic import BaseModel
+
+from recipebot.config.config import GroqModelLimits, GroqSettings
+from recipebot.infra.groq.client import GroqClient, retry_after_seconds
+from recipebot.infra.groq.scheduler import (
+    GroqPriority,
+    GroqQueueFull,
+    GroqScheduler,
+    TokenBucket,
+)
+
+MODEL = "kimi"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+def _completion(content: str, total_tokens: int = 100) -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": MODEL,
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": {
+            "prompt_tokens": total_tokens - 10,
+            "completion_tokens": 10,
+            "total_tokens": total_tokens,
+        },
+    }
+
+
+def test_token_bucket_refills_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(60, 1, clock)
+
+    bucket.consume(90)
+    assert bucket.time_until(10) == 40  # noqa: PLR2004
+
+    clock.now = 100
+    assert bucket.level == 60  # noqa: PLR2004
+    # More than the capacity is never available, wait for a full bucket
+    assert bucket.time_until(1000) == 0
+
+
+@pytest.mark.parametrize(
+    ("headers", "seconds"),
+    [
+        ({"retry-after": "2"}, 2),
+        ({"x-ratelimit-reset-tokens": "7.5s"}, 7.5),
+        (
+            {
+                "x-ratelimit-reset-requests": "1m26s",
+                "x-ratelimit-reset-tokens": "2s",
+            },
+            86,
+        ),
+        ({}, 1),
+    ],
+)
+def test_retry_after_seconds(headers: dict[str, str], seconds: float):
+    assert retry_after_seconds(headers) == seconds
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_goes_first():
+    scheduler = GroqScheduler(GroqSettings(max_concurrency=1))
+    order: list[str] = []
+
+    async def request(name: str, priority: GroqPriority) -> None:
+        async with scheduler.reserve(MODEL, 10, priority):
+            order.append(name)
+
+    async with scheduler.reserve(MODEL, 10):
+        background = asyncio.create_task(request("background", GroqPriority.BACKGROUND))
+        interactive = asyncio.create_task(
+            request("interactive", GroqPriority.INTERACTIVE)
+        )
+        await asyncio.sleep(0)
+    await asyncio.gather(background, interactive)
+
+    assert order == ["interactive", "background"]
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_corrected_by_usage():
+    cfg = GroqSettings(
+        model_limits={
+            MODEL: GroqModelLimits(requests_per_minute=100, tokens_per_minute=60)
+        }
+    )
+    scheduler = GroqScheduler(cfg)
+
+    async with scheduler.reserve(MODEL, 60) as reservation:
+        reservation.used_tokens = 0
+    # Unused tokens were refunded
+    async with asyncio.timeout(0.1), scheduler.reserve(MODEL, 60) as reservation:
+        reservation.used_tokens = 60
+
+    waiting = asyncio.create_task(scheduler.reserve(MODEL, 60).__aenter__())
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert scheduler._models[MODEL].waiting == []
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_requests():
+    scheduler = GroqScheduler(GroqSettings(max_concurrency=1, max_queued=1))
+
+    async with scheduler.reserve(MODEL, 10):
+        waiting = asyncio.create_task(scheduler.reserve(MODEL, 10).__aenter__())
+        await asyncio.sleep(0)
+        with pytest.raises(GroqQueueFull):
+            async with scheduler.reserve(MODEL, 10):
+                pass
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried_after_pause():
+    responses = [
+        httpx.Response(
+            429,
+            headers={"retry-after": "0.05"},
+            json={"error": {"message": "Rate limit reached"}},
+        ),
+        httpx.Response(200, json=_completion('{"answer": "pancakes"}')),
+    ]
+    sent_at: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_at.append(asyncio.get_running_loop().time())
+        return responses.pop(0)
+
+    client = GroqClient(GroqSettings())
+    client.client = AsyncGroq(
+        api_key="test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    result = await client.get_json_structured_output_completion(
+        MODEL, [{"role": "user", "content": "What to cook?"}], Answer, "Answer"
+    )
+
+    assert result.answer == "pancakes"
+    assert sent_at[1] - sent_at[0] >= 0.05  # noqa: PLR2004
+
+
+def _client(handler, cfg: GroqSettings | None = None) -> GroqClient:
+    client = GroqClient(cfg or GroqSettings(retry_backoff_base=0))
+    client.client = AsyncGroq(
+        api_key="test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried():
+    responses = [
+        httpx.Response(503, json={"error": {"message": "Over capacity"}}),
+        httpx.Response(200, json=_completion('{"answer": "pancakes"}')),
+    ]
+    client = _client(lambda request: responses.pop(0))
+
+    result = await client.get_json_structured_output_completion(
+        MODEL, [{"role": "user", "content": "What to cook?"}], Answer, "Answer"
+    )
+
+    assert result.answer == "pancakes"
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_refunds_tokens():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            429,
+            headers={"retry-after": "0"},
+            json={"error": {"message": "Rate limit reached"}},
+        )
+
+    client = _client(handler, GroqSettings(max_retries=0))
+
+    with pytest.raises(RateLimitError):
+        await client.get_json_structured_output_completion(
+            MODEL, [{"role": "user", "content": "What to cook?"}], Answer, "Answer"
+        )
+    tokens = client.scheduler._models[MODEL].tokens
+    assert tokens.level == tokens.capacity
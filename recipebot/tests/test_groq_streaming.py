@@ -0,0 +1,115 @@
+"""Tests for streamed Groq completions parsed while they are generated."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+from groq import AsyncGroq
+from pydantic import BaseModel
+
+from recipebot.config.config import GroqSettings
+from recipebot.infra.groq.client import GroqClient
+from recipebot.infra.groq.partial_json import parse_partial_json
+
+MODEL = "kimi"
+
+
+class Recipe(BaseModel):
+    title: str
+    ingredients: list[str]
+
+
+@pytest.mark.parametrize(
+    ("text", "parsed"),
+    [
+        ("", None),
+        ("{", {}),
+        ('{"tit', {}),
+        ('{"title": ', {}),
+        ('{"title": "Panc', {"title": "Panc"}),
+        ('{"title": "Pancakes", "servings": 1', {"title": "Pancakes"}),
+        (
+            '{"title": "Pancakes", "servings": 12,',
+            {"title": "Pancakes", "servings": 12},
+        ),
+        (
+            '{"ingredients": [{"name": "flour"}, {"na',
+            {"ingredients": [{"name": "flour"}, {}]},
+        ),
+        ('{"title": "Say \\"hi', {"title": 'Say "hi'}),
+        ('{"title": "Caf\\u00', {"title": "Caf"}),
+        ('{"title": "A\\', {"title": "A"}),
+        ('{"ok": tr', {}),
+        ('{"steps": ["Mix", "Fr', {"steps": ["Mix", "Fr"]}),
+    ],
+)
+def test_parse_partial_json(text: str, parsed: Any):
+    assert parse_partial_json(text) == parsed
+
+
+def test_parse_partial_json_complete_document():
+    document = {"title": "Crêpes", "ingredients": [{"name": "milk", "qty": None}]}
+    assert parse_partial_json(json.dumps(document)) == document
+
+
+def _chunk(content: str | None, usage: dict | None = None) -> str:
+    chunk: dict[str, Any] = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": MODEL,
+        "choices": [
+            {
+                "index": 0,
+                "delta": {"content": content} if content is not None else {},
+                "finish_reason": None if content is not None else "stop",
+            }
+        ],
+    }
+    if usage is not None:
+        chunk["x_groq"] = {"id": "req_1", "usage": usage}
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+@pytest.mark.asyncio
+async def test_streamed_completion_reports_partial_json():
+    pieces = ['{"title": "Pan', 'cakes", "ingre', 'dients": ["flour"', ', "eggs"]}']
+    usage = {"prompt_tokens": 90, "completion_tokens": 10, "total_tokens": 100}
+    body = "".join(_chunk(piece) for piece in pieces)
+    body += _chunk(None, usage) + "data: [DONE]\n\n"
+    requests: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=body
+        )
+
+    client = GroqClient(GroqSettings(partial_interval=0))
+    client.client = AsyncGroq(
+        api_key="test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    partials: list[dict[str, Any]] = []
+
+    async def on_partial(partial: dict[str, Any]) -> None:
+        partials.append(partial)
+
+    result = await client.stream_json_structured_output_completion(
+        MODEL,
+        [{"role": "user", "content": "What to cook?"}],
+        Recipe,
+        "Recipe",
+        on_partial=on_partial,
+    )
+
+    assert requests[0]["stream"] is True
+    assert result == Recipe(title="Pancakes", ingredients=["flour", "eggs"])
+    assert partials == [
+        {"title": "Pan"},
+        {"title": "Pancakes"},
+        {"title": "Pancakes", "ingredients": ["flour"]},
+        {"title": "Pancakes", "ingredients": ["flour", "eggs"]},
+    ]
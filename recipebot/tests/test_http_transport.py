@@ -0,0 +1,170 @@
+"""Tests for retries and circuit breaking of the HTTP transport."""
+
+from http import HTTPMethod
+
+import httpx
+import pytest
+
+from recipebot.config.config import HTTPTransportSettings
+from recipebot.infra.transport.circuit_breaker import CircuitBreaker, CircuitStateEnum
+from recipebot.infra.transport.exceptions import (
+    CircuitOpenError,
+    ClientError,
+    ConnectionTransportError,
+    ServerError,
+)
+from recipebot.infra.transport.httpx_transport import HttpxHTTPTransport
+from recipebot.infra.transport.schemas import HTTPRequestData
+
+URL = "https://www.tiktok.com/@cook/video/42"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Upstream:
+    """Replies with queued statuses, raises on "error" and "bug", records requests."""
+
+    def __init__(self, *replies: int | str) -> None:
+        self.replies = list(replies)
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if reply == "error":
+            raise httpx.ConnectError("Connection reset", request=request)
+        if reply == "bug":
+            raise ValueError("Broken request")
+        return httpx.Response(int(reply), text="page")
+
+
+def _transport(upstream: Upstream, **settings) -> HttpxHTTPTransport:
+    cfg = HTTPTransportSettings(retry_backoff_base=0, retry_backoff_max=0, **settings)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return HttpxHTTPTransport(client, cfg)
+
+
+def _get(url: str = URL) -> HTTPRequestData:
+    return HTTPRequestData(url=url, method=HTTPMethod.GET)
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    upstream = Upstream("error", 503, 200)
+    transport = _transport(upstream, max_retries=2)
+
+    content, metadata = await transport.request(_get())
+
+    assert content == "page"
+    assert metadata.status_code == 200  # noqa: PLR2004
+    assert upstream.requests == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_retries_are_limited():
+    upstream = Upstream(502)
+    transport = _transport(upstream, max_retries=2)
+
+    with pytest.raises(ServerError):
+        await transport.request(_get())
+    assert upstream.requests == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    upstream = Upstream(404)
+    transport = _transport(upstream, max_retries=2)
+
+    with pytest.raises(ClientError):
+        await transport.request(_get())
+    assert upstream.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_unsafe_methods_are_not_retried():
+    upstream = Upstream("error")
+    transport = _transport(upstream, max_retries=2)
+
+    with pytest.raises(ConnectionTransportError):
+        await transport.request(HTTPRequestData(url=URL, method=HTTPMethod.POST))
+    assert upstream.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_unexpected_errors_propagate_without_retry():
+    upstream = Upstream("bug")
+    transport = _transport(upstream, max_retries=2, circuit_failure_threshold=1)
+
+    with pytest.raises(ValueError, match="Broken request"):
+        await transport.request(_get())
+    assert upstream.requests == 1
+    assert transport._circuit_breaker("www.tiktok.com").allow()
+
+
+@pytest.mark.asyncio
+async def test_no_retry_past_deadline(monkeypatch):
+    upstream = Upstream(503)
+    transport = _transport(upstream, max_retries=5, deadline=1)
+    # Jitter could pick a backoff within the deadline, fix it past the deadline
+    monkeypatch.setattr(transport, "_backoff", lambda attempt: 10)
+
+    with pytest.raises(ServerError):
+        await transport.request(_get())
+    assert upstream.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_per_host():
+    upstream = Upstream("error")
+    transport = _transport(upstream, max_retries=0, circuit_failure_threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionTransportError):
+            await transport.request(_get())
+    with pytest.raises(CircuitOpenError):
+        await transport.request(_get())
+    assert upstream.requests == 2  # noqa: PLR2004
+
+    upstream.replies = [200]
+    content, _ = await transport.request(_get("https://vm.tiktok.com/ZMabc/"))
+    assert content == "page"
+
+
+def test_circuit_half_opens_after_reset_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker("tiktok.com", 1, reset_timeout=30, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitStateEnum.OPEN
+    assert not breaker.allow()
+
+    clock.now = 30
+    assert breaker.allow()
+    assert breaker.state == CircuitStateEnum.HALF_OPEN
+    # Only one trial request at a time
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitStateEnum.OPEN
+
+    clock.now = 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitStateEnum.CLOSED
+    assert breaker.allow()
+
+
+def test_successes_reset_consecutive_failures():
+    breaker = CircuitBreaker("tiktok.com", 2, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitStateEnum.CLOSED
@@ -0,0 +1,70 @@
+"""Tests for versioned schema migrations."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from recipebot.adapters.repositories.sql.base.migrator import (
+    Migration,
+    apply_migrations,
+    load_migrations,
+)
+
+
+class FakeConnection:
+    """Records executed statements, pretends some versions are applied."""
+
+    def __init__(self, applied: list[int]) -> None:
+        self.applied = applied
+        self.executed: list[tuple] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query: str, *args) -> str:
+        self.executed.append((query, *args))
+        return "OK"
+
+    async def fetch(self, query: str, *args) -> list[dict]:
+        return [{"version": version} for version in self.applied]
+
+
+def test_repository_migrations_are_ordered():
+    migrations = load_migrations()
+
+    versions = [migration.version for migration in migrations]
+    assert versions == sorted(versions)
+    assert versions[0] == 1
+
+
+def test_invalid_migration_file_name(tmp_path):
+    (tmp_path / "add_index.sql").write_text("SELECT 1;")
+
+    with pytest.raises(ValueError):
+        load_migrations(tmp_path)
+
+
+def test_duplicate_migration_version(tmp_path):
+    (tmp_path / "0001_first.sql").write_text("SELECT 1;")
+    (tmp_path / "1_second.sql").write_text("SELECT 2;")
+
+    with pytest.raises(ValueError):
+        load_migrations(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_only_pending_migrations_are_applied():
+    conn = FakeConnection(applied=[1])
+    migrations = [
+        Migration(1, "first", "SELECT 'first';"),
+        Migration(2, "second", "SELECT 'second';"),
+    ]
+
+    applied = await apply_migrations(conn, migrations)  # type: ignore[arg-type]
+
+    assert applied == [2]
+    statements = [query for query, *_ in conn.executed]
+    assert "SELECT 'first';" not in statements
+    assert "SELECT 'second';" in statements
+    assert (conn.executed[-1][1], conn.executed[-1][2]) == (2, "second")
@@ -0,0 +1,258 @@
+"""Tests for keyset pagination of recipe lists."""
+
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from telegram import InlineKeyboardMarkup, Update
+from telegram.ext import ContextTypes
+
+from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import (
+    PageCursor,
+    PageDirection,
+    PageRequest,
+    RecipePage,
+)
+from recipebot.config import settings
+from recipebot.domain.recipe.recipe import Recipe, RecipeCategory, RecipeSummary
+from recipebot.drivers.handlers.recipe_crud.handlers.list_recipes.handler import (
+    _show_recipe_list,
+    handle_pagination,
+)
+from recipebot.drivers.handlers.recipe_crud.shared import (
+    create_paginated_keyboard,
+    parse_keyset_pagination_callback,
+)
+from recipebot.drivers.state import container
+
+PAGE_SIZE = 2
+TOTAL_RECIPES = 5
+
+
+class TestPageCursor:
+    """Test PageCursor encoding."""
+
+    def test_encode_decode_roundtrip(self):
+        cursor = PageCursor(recipe_id=uuid4(), direction=PageDirection.BEFORE)
+        assert PageCursor.decode(cursor.encode()) == cursor
+
+    def test_encoded_callback_fits_telegram_limit(self):
+        cursor = PageCursor(recipe_id=uuid4())
+        assert len(f"delete_page_999_{cursor.encode()}".encode()) <= 64  # noqa: PLR2004
+
+    @pytest.mark.parametrize("token", ["", "x123", "a-not-a-uuid"])
+    def test_decode_invalid(self, token):
+        assert PageCursor.decode(token) is None
+
+
+class TestParseKeysetPaginationCallback:
+    """Test parse_keyset_pagination_callback."""
+
+    def test_legacy_page_only(self):
+        assert parse_keyset_pagination_callback("list_page_3", "list_page") == (3, None)
+
+    def test_page_with_cursor(self):
+        cursor = PageCursor(recipe_id=uuid4())
+        parsed = parse_keyset_pagination_callback(
+            f"list_page_2_{cursor.encode()}", "list_page"
+        )
+        assert parsed == (2, cursor)
+
+    def test_other_prefix(self):
+        assert parse_keyset_pagination_callback("edit_page_2", "list_page") is None
+
+
+class TestMockRecipeRepoListSummaries:
+    """Test the list_summaries method in MockRecipeRepo."""
+
+    @pytest_asyncio.fixture
+    async def mock_repo_with_data(self, mock_recipe_repo):
+        # Insert in reverse order to make sure the page is sorted by title
+        for i in reversed(range(TOTAL_RECIPES)):
+            await mock_recipe_repo.add(
+                Recipe(
+                    id=uuid4(),
+                    title=f"Recipe {i}",
+                    user_id=1,
+                    category=RecipeCategory.BREAKFAST,
+                    ingredients=[],
+                    steps=["Step 1"],
+                    tags=["quick"],
+                )
+            )
+        return mock_recipe_repo
+
+    @pytest.mark.asyncio
+    async def test_first_page(self, mock_repo_with_data):
+        page = await mock_repo_with_data.list_summaries(
+            RecipeFilters(user_id=1), PageRequest(page_size=PAGE_SIZE)
+        )
+
+        assert [r.title for r in page.current_page_items] == ["Recipe 0", "Recipe 1"]
+        assert page.total_items == TOTAL_RECIPES
+        assert page.total_pages == 3  # noqa: PLR2004
+        assert not page.has_previous
+        assert page.has_next
+        assert page.previous_cursor is None
+        assert page.current_page_items[0] == RecipeSummary(
+            page.current_page_items[0].id,
+            "Recipe 0",
+            RecipeCategory.BREAKFAST,
+            ["quick"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_navigation(self, mock_repo_with_data):
+        filters = RecipeFilters(user_id=1)
+        first = await mock_repo_with_data.list_summaries(
+            filters, PageRequest(page_size=PAGE_SIZE)
+        )
+        second = await mock_repo_with_data.list_summaries(
+            filters,
+            PageRequest(page=2, page_size=PAGE_SIZE, cursor=first.next_cursor),
+        )
+        assert [r.title for r in second.current_page_items] == ["Recipe 2", "Recipe 3"]
+
+        back = await mock_repo_with_data.list_summaries(
+            filters,
+            PageRequest(page=1, page_size=PAGE_SIZE, cursor=second.previous_cursor),
+        )
+        assert [r.title for r in back.current_page_items] == ["Recipe 0", "Recipe 1"]
+
+    @pytest.mark.asyncio
+    async def test_page_out_of_range_is_clamped(self, mock_repo_with_data):
+        page = await mock_repo_with_data.list_summaries(
+            RecipeFilters(user_id=1), PageRequest(page=10, page_size=PAGE_SIZE)
+        )
+        assert page.page == 3  # noqa: PLR2004
+        assert [r.title for r in page.current_page_items] == ["Recipe 4"]
+
+    @pytest.mark.asyncio
+    async def test_empty(self, mock_repo_with_data):
+        page = await mock_repo_with_data.list_summaries(
+            RecipeFilters(user_id=999), PageRequest(page_size=PAGE_SIZE)
+        )
+        assert page.total_items == 0
+        assert page.current_page_items == []
+        assert not page.has_next
+
+    @pytest.mark.asyncio
+    async def test_text_query_pages_by_number(self, mock_repo_with_data):
+        page = await mock_repo_with_data.list_summaries(
+            RecipeFilters(user_id=1, query="recipe 3"),
+            PageRequest(page_size=PAGE_SIZE),
+        )
+        assert [r.title for r in page.current_page_items] == ["Recipe 3"]
+        # Ranked results aren't ordered by title, so no keyset cursors
+        assert page.next_cursor is None
+        assert page.previous_cursor is None
+
+
+def test_keyboard_navigation_carries_cursor():
+    recipes = [
+        RecipeSummary(uuid4(), f"Recipe {i}", RecipeCategory.BREAKFAST, [])
+        for i in range(PAGE_SIZE)
+    ]
+    page = RecipePage(recipes, page=2, page_size=PAGE_SIZE, total_items=TOTAL_RECIPES)
+
+    keyboard = create_paginated_keyboard(
+        page, lambda r, _: f"recipe_{r.id}", navigation_prefix="list_page"
+    )
+    navigation = [button.callback_data for button in keyboard.inline_keyboard[-1]]
+
+    assert f"list_page_1_{page.previous_cursor.encode()}" in navigation  # type: ignore[union-attr]
+    assert f"list_page_3_{page.next_cursor.encode()}" in navigation  # type: ignore[union-attr]
+
+
+class FakeCallbackQuery:
+    def __init__(self, data: str | None = None) -> None:
+        self.data = data
+        self.edits: list[tuple[str, InlineKeyboardMarkup | None]] = []
+
+    async def answer(self) -> None:
+        pass
+
+    async def edit_message_text(
+        self, text: str, reply_markup: InlineKeyboardMarkup | None = None
+    ) -> None:
+        self.edits.append((text, reply_markup))
+
+
+def _callback_update(data: str | None = None) -> tuple[Update, FakeCallbackQuery]:
+    query = FakeCallbackQuery(data)
+    update = SimpleNamespace(
+        callback_query=query,
+        effective_chat=SimpleNamespace(id=1),
+        effective_user=SimpleNamespace(id=1),
+    )
+    return cast(Update, update), query
+
+
+def _listed_titles(markup: InlineKeyboardMarkup | None) -> list[str]:
+    assert markup is not None
+    return [
+        str(button.text)
+        for row in markup.inline_keyboard
+        for button in row
+        if str(button.callback_data).startswith("recipe_")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_pages_stay_filtered_and_ranked(mock_recipe_repo, monkeypatch):
+    # "Chicken" rank is the number of its mentions, others don't match at all
+    for title, mentions in [("A", 1), ("B", 4), ("C", 2), ("D", 3), ("E", 5)]:
+        await mock_recipe_repo.add(
+            Recipe(
+                id=uuid4(),
+                title=f"Chicken {title}",
+                user_id=1,
+                category=RecipeCategory.DINNER,
+                ingredients=[],
+                steps=["Add chicken"] * (mentions - 1) or ["Serve"],
+                tags=[],
+            )
+        )
+    for i in range(10):
+        await mock_recipe_repo.add(
+            Recipe(
+                id=uuid4(),
+                title=f"Salad {i}",
+                user_id=1,
+                category=RecipeCategory.LUNCH,
+                ingredients=[],
+                steps=["Mix"],
+                tags=[],
+            )
+        )
+    monkeypatch.setitem(container, "recipe_repo", mock_recipe_repo)
+    monkeypatch.setattr(settings.APP, "recipe_page_size", PAGE_SIZE)
+    context = cast(
+        ContextTypes.DEFAULT_TYPE,
+        SimpleNamespace(user_data={}, bot=SimpleNamespace(send_message=AsyncMock())),
+    )
+    filters = RecipeFilters(user_id=1, query="chicken")
+    first_page = await mock_recipe_repo.list_summaries(
+        filters, PageRequest(page_size=PAGE_SIZE)
+    )
+
+    update, query = _callback_update()
+    await _show_recipe_list(
+        update, context, edit_message=True, filters=filters, recipe_page=first_page
+    )
+    next_callback = next(
+        str(button.callback_data)
+        for button in (query.edits[0][1] or InlineKeyboardMarkup([])).inline_keyboard[
+            -1
+        ]
+        if str(button.callback_data).startswith("list_page_2")
+    )
+    update, query = _callback_update(next_callback)
+    await handle_pagination(update, context)
+
+    assert _listed_titles(query.edits[0][1]) == ["Chicken D", "Chicken C"]
+    assert "Page 2/3" in query.edits[0][0]
@@ -0,0 +1,109 @@
+"""Tests for the incremental asyncpg bot persistence."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from recipebot.adapters.repositories.sql.persistence.persistence import (
+    AsyncpgPersistence,
+)
+from recipebot.config.config import PersistenceSettings
+
+
+class FakeConnection:
+    """In-memory bot_persistence table counting round trips."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], bytes] = {}
+        self.reads = 0
+        self.batches: list[list[tuple]] = []
+
+    async def init_pool(self) -> None:
+        pass
+
+    async def init_db(self) -> None:
+        pass
+
+    @asynccontextmanager
+    async def get_cursor(self):
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield self
+
+    async def fetchval(self, query: str, namespace: str, key: str):
+        self.reads += 1
+        return self.rows.get((namespace, key))
+
+    async def fetch(self, query: str, namespace: str):
+        self.reads += 1
+        return [
+            {"key": key, "data": data}
+            for (row_namespace, key), data in self.rows.items()
+            if row_namespace == namespace
+        ]
+
+    async def executemany(self, query: str, args: list[tuple]) -> None:
+        self.batches.append(args)
+        for namespace, key, *data in args:
+            if data:
+                self.rows[(namespace, key)] = data[0]
+            else:
+                self.rows.pop((namespace, key), None)
+
+
+@pytest.fixture
+def fake_conn() -> FakeConnection:
+    return FakeConnection()
+
+
+@pytest.fixture
+def persistence(fake_conn) -> AsyncpgPersistence:
+    return AsyncpgPersistence(fake_conn, PersistenceSettings())  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_changed_entries_are_written_in_one_batch(persistence, fake_conn):
+    await asyncio.gather(
+        persistence.update_user_data(1, {"step": 1}),
+        persistence.update_user_data(2, {"step": 2}),
+        persistence.update_conversation("add_recipe", (1, 1), 3),
+    )
+    assert len(fake_conn.batches) == 1
+    assert len(fake_conn.batches[0]) == 3  # noqa: PLR2004
+
+    # Same data again, nothing to write
+    await persistence.update_user_data(1, {"step": 1})
+    assert len(fake_conn.batches) == 1
+
+    await persistence.update_user_data(1, {"step": 2})
+    assert fake_conn.batches[-1] == [
+        ("user_data", "1", fake_conn.rows[("user_data", "1")])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_user_data_is_loaded_lazily(persistence, fake_conn):
+    await persistence.update_user_data(1, {"step": 1})
+    restarted = AsyncpgPersistence(fake_conn, PersistenceSettings())  # type: ignore[arg-type]
+
+    assert await restarted.get_user_data() == {}
+    user_data: dict = {}
+    await restarted.refresh_user_data(1, user_data)
+    await restarted.refresh_user_data(1, user_data)
+
+    assert user_data == {"step": 1}
+    assert fake_conn.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_conversations_survive_restart(persistence, fake_conn):
+    await persistence.update_conversation("add_recipe", (1, 1), 3)
+    await persistence.update_conversation("add_recipe", (2, 2), 4)
+    await persistence.update_conversation("add_recipe", (2, 2), None)
+    await persistence.flush()
+
+    restarted = AsyncpgPersistence(fake_conn, PersistenceSettings())  # type: ignore[arg-type]
+    assert await restarted.get_conversations("add_recipe") == {(1, 1): 3}
@@ -0,0 +1,45 @@
+"""Tests for SQL query registry."""
+
+import pytest
+
+from recipebot.adapters.repositories.sql.base.utils import QueryRegistry
+from recipebot.adapters.repositories.sql.recipe import recipe_repo
+from recipebot.adapters.repositories.sql.recipe.queries import GET_RECIPE_BY_ID_QUERY
+from recipebot.ports.repositories.exceptions import MissingQueryFiles
+
+
+def _make_sql_package(root, declared: dict[str, str], files: list[str]):
+    repo_dir = root / "fakesql" / "repo"
+    queries_dir = repo_dir / "queries"
+    queries_dir.mkdir(parents=True)
+    (root / "fakesql" / "__init__.py").touch()
+    (repo_dir / "__init__.py").touch()
+    (queries_dir / "__init__.py").write_text(
+        "\n".join(f'{attr} = "{name}"' for attr, name in declared.items())
+    )
+    for name in files:
+        (queries_dir / f"{name}.sql").write_text(f"SELECT '{name}';")
+    return repo_dir
+
+
+def test_registry_loads_repository_queries():
+    registry = QueryRegistry()
+    registry.load()
+
+    query = registry.get(recipe_repo.__file__, GET_RECIPE_BY_ID_QUERY)
+    assert "FROM recipes" in query
+    # Same object is returned every time, no file reads on hot path
+    assert registry.get(recipe_repo.__file__, GET_RECIPE_BY_ID_QUERY) is query
+
+
+def test_registry_fails_fast_on_missing_file(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _make_sql_package(
+        tmp_path, {"PRESENT_QUERY": "present", "ABSENT_QUERY": "absent"}, ["present"]
+    )
+    registry = QueryRegistry(root=tmp_path / "fakesql", package="fakesql")
+
+    with pytest.raises(MissingQueryFiles) as exc_info:
+        registry.load()
+
+    assert [path.rsplit("/", 1)[-1] for path in exc_info.value.paths] == ["absent.sql"]
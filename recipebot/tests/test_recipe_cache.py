@@ -0,0 +1,106 @@
+"""Tests for in-process recipe caching."""
+
+import pytest
+import pytest_asyncio
+
+from recipebot.adapters.repositories.cache.recipe_repo import CachedRecipeRepo
+from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
+from recipebot.adapters.repositories.sql.recipe.recipe_page import PageRequest
+from recipebot.config.config import RecipeCacheSettings
+from recipebot.domain.recipe.recipe import Recipe, RecipeCategory
+from recipebot.infra.cache.ttl_lru import TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLLRUCache:
+    """Test TTLLRUCache behaviour."""
+
+    def test_entry_expires(self):
+        clock = FakeClock()
+        cache: TTLLRUCache[str, int] = TTLLRUCache("test", 10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.get("b") == 2  # noqa: PLR2004
+
+    def test_least_recently_used_is_evicted(self):
+        cache: TTLLRUCache[str, int] = TTLLRUCache("test", 2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_discard_where(self):
+        cache: TTLLRUCache[tuple[int, str], int] = TTLLRUCache("test", 10, ttl=60)
+        cache.set((1, "a"), 1)
+        cache.set((2, "a"), 2)
+        cache.discard_where(lambda key: key[0] == 1)
+
+        assert len(cache) == 1
+        assert (2, "a") in cache
+
+
+class TestCachedRecipeRepo:
+    """Test CachedRecipeRepo read-through and invalidation."""
+
+    @pytest_asyncio.fixture
+    async def recipe(self, mock_recipe_repo):
+        return await mock_recipe_repo.add(
+            Recipe(
+                title="Pancakes",
+                user_id=1,
+                category=RecipeCategory.BREAKFAST,
+                ingredients=[],
+                steps=["Fry"],
+            )
+        )
+
+    @pytest_asyncio.fixture
+    async def cached_repo(self, mock_recipe_repo):
+        return CachedRecipeRepo(mock_recipe_repo, RecipeCacheSettings())
+
+    @pytest.mark.asyncio
+    async def test_get_is_served_from_cache(
+        self, cached_repo, mock_recipe_repo, recipe
+    ):
+        await cached_repo.get(recipe.id)
+        mock_recipe_repo._recipes.clear()
+
+        cached = await cached_repo.get(recipe.id)
+        assert cached == recipe
+        # Mutating returned recipe doesn't leak into the cache
+        cached.title = "Changed"
+        assert (await cached_repo.get(recipe.id)).title == "Pancakes"
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates(self, cached_repo, recipe):
+        filters = RecipeFilters(user_id=1)
+        await cached_repo.get(recipe.id)
+        await cached_repo.list_summaries(filters, PageRequest())
+
+        await cached_repo.update(recipe.model_copy(update={"title": "Waffles"}))
+
+        assert (await cached_repo.get(recipe.id)).title == "Waffles"
+        page = await cached_repo.list_summaries(filters, PageRequest())
+        assert [r.title for r in page.current_page_items] == ["Waffles"]
+
+    @pytest.mark.asyncio
+    async def test_add_invalidates_user_lists(self, cached_repo, recipe):
+        filters = RecipeFilters(user_id=1)
+        assert len(await cached_repo.list_filtered(filters)) == 1
+
+        await cached_repo.add(recipe.model_copy(update={"id": None}))
+        assert len(await cached_repo.list_filtered(filters)) == 2  # noqa: PLR2004
@@ -0,0 +1,276 @@
+"""Tests for background TikTok import jobs."""
+
+import asyncio
+from typing import cast
+from uuid import UUID
+
+import pytest
+from pydantic import AnyHttpUrl
+from telegram import Bot
+
+from recipebot.adapters.services.tt_resolver import HttpxTTResolver
+from recipebot.config.config import RecipeImportSettings
+from recipebot.domain.recipe.recipe import (
+    Ingredient,
+    RecipeDTO,
+    RecipeImportJob,
+    RecipeImportJobStatus,
+    RecipeImportStage,
+    RecipePreview,
+)
+from recipebot.drivers.handlers.recipe_crud.handlers.from_tiktok.notifier import (
+    TelegramRecipeImportNotifier,
+)
+from recipebot.ports.repositories.recipe_import_job_repository import (
+    RecipeImportJobRepositoryABC,
+)
+from recipebot.ports.services.recipe_import_notifier import RecipeImportNotifierABC
+from recipebot.ports.services.recipe_parser import PreviewCallback, RecipeParserABC
+from recipebot.ports.services.tt_resolver import ResolutionResult, TikTokNotAccessible
+from recipebot.tasks.recipe_from_tt.import_queue import (
+    RecipeImportQueue,
+    RecipeImportQueueFull,
+)
+from recipebot.tasks.recipe_from_tt.recipe_from_tt import RecipeFromTTTask
+
+VIDEO_URL = "https://www.tiktok.com/@cook/video/42"
+
+
+class FakeResolver(HttpxTTResolver):
+    """Resolves after `release` is set, counts imports running at once."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.release.set()
+        self.running = 0
+        self.max_running = 0
+
+    async def resolve(self, url: str) -> ResolutionResult:
+        if url == "broken":
+            raise TikTokNotAccessible("TikTok is down")
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.running -= 1
+        return ResolutionResult(
+            description="Pancakes: flour, eggs",
+            source_url=AnyHttpUrl(VIDEO_URL),
+        )
+
+
+class FakeParser(RecipeParserABC):
+    async def parse(
+        self, description: str, on_preview: PreviewCallback | None = None
+    ) -> RecipeDTO:
+        if on_preview is not None:
+            await on_preview(RecipePreview(title="Pancakes"))
+        return RecipeDTO(
+            title="Pancakes",
+            desc=None,
+            ingredients=[Ingredient(name="flour", qty=None, group="Main")],
+            steps=["Fry"],
+            estimated_time=None,
+        )
+
+    async def parse_ingredients(self, ingredients_text: str) -> list[Ingredient]:
+        return []
+
+    async def parse_steps(self, steps_text: str) -> list[str]:
+        return []
+
+
+class InMemoryJobRepo(RecipeImportJobRepositoryABC):
+    def __init__(self, *jobs: RecipeImportJob) -> None:
+        self.jobs = {job.id: job.model_copy() for job in jobs}
+
+    async def add(self, job: RecipeImportJob) -> None:
+        self.jobs[job.id] = job.model_copy()
+
+    async def update(self, job: RecipeImportJob) -> None:
+        self.jobs[job.id] = job.model_copy()
+
+    async def get(self, job_id: UUID) -> RecipeImportJob | None:
+        return self.jobs.get(job_id)
+
+    async def list_unfinished(self) -> list[RecipeImportJob]:
+        return [job for job in self.jobs.values() if not job.finished]
+
+
+class RecordingNotifier(RecipeImportNotifierABC):
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.events: list[
+            tuple[str, RecipeImportStage | RecipeImportJobStatus | str]
+        ] = []
+        self.finished = asyncio.Event()
+
+    async def progress(self, job: RecipeImportJob) -> None:
+        self.events.append(("progress", job.stage))
+        if self.fail:
+            raise RuntimeError("Message to edit not found")
+
+    async def preview(self, job: RecipeImportJob, preview: RecipePreview) -> None:
+        self.events.append(("preview", preview.title or ""))
+        if self.fail:
+            raise RuntimeError("Message to edit not found")
+
+    async def completed(self, job: RecipeImportJob) -> None:
+        self.events.append(("completed", job.status))
+        self.finished.set()
+
+    async def failed(self, job: RecipeImportJob) -> None:
+        self.events.append(("failed", job.status))
+        self.finished.set()
+
+
+def _job(url: str = VIDEO_URL, **fields) -> RecipeImportJob:
+    return RecipeImportJob(user_id=1, chat_id=1, message_id=10, url=url, **fields)
+
+
+def _queue(
+    repo: InMemoryJobRepo,
+    notifier: RecordingNotifier,
+    resolver: FakeResolver | None = None,
+    **cfg,
+) -> RecipeImportQueue:
+    task = RecipeFromTTTask(resolver or FakeResolver(), FakeParser())
+    return RecipeImportQueue(task, repo, notifier, RecipeImportSettings(**cfg))
+
+
+@pytest.mark.asyncio
+async def test_job_reports_progress_and_stores_recipe():
+    repo, notifier = InMemoryJobRepo(), RecordingNotifier()
+    queue = _queue(repo, notifier)
+    await queue.start()
+    job = _job()
+
+    await queue.submit(job)
+    await asyncio.wait_for(notifier.finished.wait(), 1)
+    await queue.stop()
+
+    assert notifier.events == [
+        ("progress", RecipeImportStage.FETCHING),
+        ("progress", RecipeImportStage.PARSING),
+        ("preview", "Pancakes"),
+        ("completed", RecipeImportJobStatus.DONE),
+    ]
+    stored = repo.jobs[job.id]
+    assert stored.status == RecipeImportJobStatus.DONE
+    assert stored.stage == RecipeImportStage.FINISHED
+    assert stored.recipe is not None
+    assert stored.recipe.title == "Pancakes"
+
+
+@pytest.mark.asyncio
+async def test_failed_job_stores_error():
+    repo, notifier = InMemoryJobRepo(), RecordingNotifier()
+    queue = _queue(repo, notifier)
+    await queue.start()
+    job = _job("broken")
+
+    await queue.submit(job)
+    await asyncio.wait_for(notifier.finished.wait(), 1)
+    await queue.stop()
+
+    assert notifier.events[-1] == ("failed", RecipeImportJobStatus.FAILED)
+    assert repo.jobs[job.id].error == "TikTok is down"
+
+
+@pytest.mark.asyncio
+async def test_notifier_errors_dont_fail_job():
+    repo, notifier = InMemoryJobRepo(), RecordingNotifier(fail=True)
+    queue = _queue(repo, notifier)
+    await queue.start()
+    job = _job()
+
+    await queue.submit(job)
+    await asyncio.wait_for(notifier.finished.wait(), 1)
+    await queue.stop()
+
+    assert repo.jobs[job.id].status == RecipeImportJobStatus.DONE
+
+
+@pytest.mark.asyncio
+async def test_workers_bound_concurrency():
+    repo, notifier, resolver = InMemoryJobRepo(), RecordingNotifier(), FakeResolver()
+    resolver.release.clear()
+    queue = _queue(repo, notifier, resolver, workers=2)
+    await queue.start()
+
+    jobs = [_job() for _ in range(5)]
+    for job in jobs:
+        await queue.submit(job)
+    await asyncio.sleep(0.01)
+    assert resolver.running == 2  # noqa: PLR2004
+
+    resolver.release.set()
+    await asyncio.wait_for(queue._queue.join(), 1)
+    await queue.stop()
+
+    assert resolver.max_running == 2  # noqa: PLR2004
+    assert all(repo.jobs[job.id].status == RecipeImportJobStatus.DONE for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_jobs():
+    repo, notifier = InMemoryJobRepo(), RecordingNotifier()
+    # Workers aren't started, so submitted jobs stay queued
+    queue = _queue(repo, notifier, max_queued=1)
+
+    await queue.submit(_job())
+    with pytest.raises(RecipeImportQueueFull):
+        await queue.submit(_job())
+    assert len(repo.jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_unfinished_jobs_resume_on_start():
+    interrupted = _job(
+        status=RecipeImportJobStatus.RUNNING, stage=RecipeImportStage.PARSING
+    )
+    done = _job(status=RecipeImportJobStatus.DONE)
+    repo, notifier = InMemoryJobRepo(interrupted, done), RecordingNotifier()
+    queue = _queue(repo, notifier)
+
+    await queue.start()
+    await asyncio.wait_for(notifier.finished.wait(), 1)
+    await queue.stop()
+
+    assert repo.jobs[interrupted.id].status == RecipeImportJobStatus.DONE
+    assert notifier.events[0] == ("progress", RecipeImportStage.FETCHING)
+    assert notifier.events.count(("completed", RecipeImportJobStatus.DONE)) == 1
+
+
+class EditRecordingBot:
+    def __init__(self) -> None:
+        self.edits: list[str] = []
+
+    async def edit_message_text(self, text: str, **kwargs) -> None:
+        self.edits.append(text)
+
+
+@pytest.mark.asyncio
+async def test_telegram_previews_are_throttled():
+    bot = EditRecordingBot()
+    notifier = TelegramRecipeImportNotifier(cast(Bot, bot), preview_interval=0.05)
+    job = _job()
+
+    # Nothing to show yet
+    await notifier.preview(job, RecipePreview())
+    await notifier.preview(job, RecipePreview(title="Pancakes"))
+    # Within the interval, skipped
+    await notifier.preview(
+        job, RecipePreview(title="Pancakes", ingredients=[Ingredient(name="flour")])
+    )
+    await asyncio.sleep(0.05)
+    await notifier.preview(
+        job,
+        RecipePreview(
+            title="Pancakes",
+            ingredients=[Ingredient(name="flour"), Ingredient(name="eggs", qty="2")],
+        ),
+    )
+
+    assert len(bot.edits) == 2  # noqa: PLR2004
+    assert "Pancakes" in bot.edits[0]
+    assert "• 2 eggs" in bot.edits[1]
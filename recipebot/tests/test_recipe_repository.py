@@ -1,9 +1,16 @@
 """Tests for recipe repository functionality."""
 
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
 import pytest
 
 from recipebot.adapters.repositories.sql.recipe.recipe_filters import RecipeFilters
-from recipebot.domain.recipe.recipe import Recipe, RecipeCategory
+from recipebot.adapters.repositories.sql.recipe.recipe_repo import RecipeAsyncpgRepo
+from recipebot.config.config import FuzzySearchSettings
+from recipebot.domain.recipe.recipe import Ingredient, Recipe, RecipeCategory
+
+RECIPE_ID = uuid4()
 
 
 class TestRecipeFilters:
@@ -187,3 +194,115 @@ class TestMockRecipeRepoListFiltered:
         )
         recipes = await mock_repo_with_data.list_filtered(filters)
         assert len(recipes) == 0
+
+
+class FakeConnection:
+    """Records executed statements, writes return the recipe id only."""
+
+    def __init__(self) -> None:
+        self.executed: list[tuple] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield self
+
+    async def execute(self, query: str, *args) -> str:
+        self.executed.append((query, *args))
+        return "SELECT 1"
+
+    async def fetch(self, query: str, *args) -> list:
+        self.executed.append((query, *args))
+        return []
+
+    async def fetchrow(self, query: str, *args) -> dict:
+        self.executed.append((query, *args))
+        return {"id": RECIPE_ID}
+
+
+class TestFuzzySearch:
+    """Test typo tolerant recipe lookup."""
+
+    @pytest.mark.asyncio
+    async def test_threshold_and_top_k_are_applied(self, mock_tag_repo):
+        conn = FakeConnection()
+        repo = RecipeAsyncpgRepo(
+            conn,  # type: ignore[arg-type]
+            mock_tag_repo,
+            FuzzySearchSettings(similarity_threshold=0.5, top_k=3),
+        )
+
+        await repo.fuzzy_search(1, "pancaks")
+
+        (set_threshold, threshold), (_, user_id, query, top_k) = conn.executed
+        assert "word_similarity_threshold" in set_threshold
+        assert threshold == "0.5"
+        assert (user_id, query, top_k) == (1, "pancaks", 3)
+
+    @pytest.mark.asyncio
+    async def test_mock_finds_misspelled_title(self, mock_recipe_repo):
+        for title in ["Pancakes", "Borscht"]:
+            await mock_recipe_repo.add(
+                Recipe(
+                    id=uuid4(),
+                    title=title,
+                    user_id=1,
+                    category=RecipeCategory.BREAKFAST,
+                    ingredients=[],
+                    steps=["Cook"],
+                )
+            )
+
+        suggestions = await mock_recipe_repo.fuzzy_search(1, "pancaks")
+
+        assert [recipe.title for recipe in suggestions] == ["Pancakes"]
+        assert await mock_recipe_repo.fuzzy_search(2, "pancaks") == []
+
+
+class TestRecipeIngredients:
+    """Test ingredient-level lookups."""
+
+    @staticmethod
+    def _recipe(title: str, *ingredients: str) -> Recipe:
+        return Recipe(
+            id=uuid4(),
+            title=title,
+            desc=None,
+            user_id=1,
+            category=RecipeCategory.DINNER,
+            ingredients=[
+                Ingredient(name=name, qty=None, group="Main") for name in ingredients
+            ],
+            steps=["Cook"],
+            estimated_time=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_canonical_names_are_synced(self, mock_tag_repo):
+        conn = FakeConnection()
+        repo = RecipeAsyncpgRepo(conn, mock_tag_repo)  # type: ignore[arg-type]
+        recipe = self._recipe("Curry", " Green  Peas", "rice", "Rice")
+
+        await repo.add(recipe)
+        _, recipe_id, user_id, names = conn.executed[-1]
+        assert (recipe_id, user_id, names) == (RECIPE_ID, 1, ["green peas", "rice"])
+
+        conn.executed.clear()
+        await repo.update(recipe)
+        deleted, inserted = conn.executed[1:]
+        assert "DELETE FROM recipe_ingredients" in deleted[0]
+        assert inserted[3] == ["green peas", "rice"]
+
+    @pytest.mark.asyncio
+    async def test_most_matched_recipes_first(self, mock_recipe_repo):
+        await mock_recipe_repo.add(self._recipe("Omelette", "egg", "milk", "salt"))
+        await mock_recipe_repo.add(self._recipe("Boiled egg", "Egg"))
+        await mock_recipe_repo.add(self._recipe("Pancakes", "egg", "milk", "flour"))
+        await mock_recipe_repo.add(self._recipe("Soup", "water"))
+
+        matches = await mock_recipe_repo.list_by_ingredients(1, ["EGG", "milk"])
+
+        assert [(m.recipe.title, m.matched) for m in matches] == [
+            ("Omelette", 2),
+            ("Pancakes", 2),
+            ("Boiled egg", 1),
+        ]
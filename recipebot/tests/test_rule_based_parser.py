@@ -0,0 +1,210 @@
+"""Tests for parsing well structured recipe texts without the LLM."""
+
+import pytest
+
+from recipebot.adapters.services.rule_based_parser.recipe_parser import (
+    RuleBasedRecipeParser,
+)
+from recipebot.adapters.services.rule_based_parser.rules import (
+    extract_recipe,
+    extract_steps,
+    parse_ingredient,
+)
+from recipebot.config.config import TiktokDescriptionParseSettings
+from recipebot.domain.recipe.recipe import Ingredient, RecipeDTO
+from recipebot.metrics.recipes import RECIPE_PARSES, RecipeParserEnum
+from recipebot.ports.services.recipe_parser import PreviewCallback, RecipeParserABC
+
+STRUCTURED_DESCRIPTION = """Fluffy Pancakes 🥞 #breakfast
+Serves 2, ready in 15 minutes
+
+INGREDIENTS 🛒
+• 200g flour
+• 2 eggs
+- 1 1/2 cups milk
+Topping:
+- Maple syrup to taste
+- Blueberries (100g)
+
+Steps:
+1. Mix the flour and eggs.
+2. Whisk in the milk.
+Let it rest for 5 minutes.
+3. Fry on medium heat.
+Enjoy! 😋
+#pancakes #recipe"""
+
+UNSTRUCTURED_DESCRIPTION = (
+    "Best pasta ever!! Boil some spaghetti, fry garlic in lots of butter and "
+    "toss it all with parmesan #pasta #easyrecipe"
+)
+
+
+class FakeLLMParser(RecipeParserABC):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def parse(
+        self, description: str, on_preview: PreviewCallback | None = None
+    ) -> RecipeDTO:
+        self.calls += 1
+        return RecipeDTO(
+            title="From LLM",
+            desc=None,
+            ingredients=[],
+            steps=[],
+            estimated_time=None,
+        )
+
+    async def parse_ingredients(self, ingredients_text: str) -> list[Ingredient]:
+        self.calls += 1
+        return [Ingredient(name="from llm", qty=None, group="Main")]
+
+    async def parse_steps(self, steps_text: str) -> list[str]:
+        self.calls += 1
+        return ["From LLM"]
+
+
+@pytest.mark.parametrize(
+    ("line", "ingredient"),
+    [
+        ("200g flour", Ingredient(name="flour", qty="200", unit="g", group="Main")),
+        ("2 eggs", Ingredient(name="eggs", qty="2", group="Main")),
+        (
+            "1 1/2 cups of milk",
+            Ingredient(name="milk", qty="1 1/2", unit="cup", group="Main"),
+        ),
+        ("½ tsp salt", Ingredient(name="salt", qty="½", unit="tsp", group="Main")),
+        (
+            "2-3 cloves garlic",
+            Ingredient(name="garlic", qty="2-3", unit="clove", group="Main"),
+        ),
+        ("1 lemon", Ingredient(name="lemon", qty="1", group="Main")),
+        (
+            "Sugar - 2 tablespoons",
+            Ingredient(name="Sugar", qty="2", unit="tbsp", group="Main"),
+        ),
+        ("Butter: 50 g", Ingredient(name="Butter", qty="50", unit="g", group="Main")),
+        (
+            "Blueberries (100g)",
+            Ingredient(name="Blueberries", qty="100", unit="g", group="Main"),
+        ),
+        ("Salt to taste", Ingredient(name="Salt to taste", qty=None, group="Main")),
+    ],
+)
+def test_parse_ingredient(line: str, ingredient: Ingredient):
+    parsed, confidence = parse_ingredient(line)
+    assert parsed == ingredient
+    assert confidence == 1.0
+
+
+def test_ingredient_without_quantity_is_uncertain():
+    parsed, confidence = parse_ingredient("fresh basil")
+    assert parsed == Ingredient(name="fresh basil")
+    assert confidence < 1.0
+
+
+def test_extract_structured_recipe():
+    recipe, confidence = extract_recipe(STRUCTURED_DESCRIPTION)
+
+    assert confidence == 1.0
+    assert recipe is not None
+    assert recipe.title == "Fluffy Pancakes"
+    assert recipe.servings == 2  # noqa: PLR2004
+    assert recipe.estimated_time == "15 minutes"
+    assert [(i.name, i.group) for i in recipe.ingredients] == [
+        ("flour", "Main"),
+        ("eggs", "Main"),
+        ("milk", "Main"),
+        ("Maple syrup to taste", "Topping"),
+        ("Blueberries", "Topping"),
+    ]
+    assert recipe.steps == [
+        "Mix the flour and eggs.",
+        "Whisk in the milk. Let it rest for 5 minutes.",
+        "Fry on medium heat.",
+    ]
+
+
+def test_inline_ingredients_section():
+    recipe, confidence = extract_recipe(
+        "Garlic bread\nIngredients: 1 baguette, 50g butter, 2 cloves garlic\n"
+        "Method:\nMix butter and garlic\nSpread on the bread\nBake"
+    )
+
+    assert confidence == 1.0
+    assert recipe is not None
+    assert [i.name for i in recipe.ingredients] == ["baguette", "butter", "garlic"]
+    assert recipe.steps == ["Mix butter and garlic", "Spread on the bread", "Bake"]
+
+
+def test_text_without_sections_has_no_confidence():
+    recipe, confidence = extract_recipe(UNSTRUCTURED_DESCRIPTION)
+    assert recipe is None
+    assert confidence == 0.0
+
+
+def test_paragraph_steps_are_uncertain():
+    steps, confidence = extract_steps(["Mix everything. Fry it. Serve warm."])
+    assert steps == ["Mix everything.", "Fry it.", "Serve warm."]
+    assert confidence < 1.0
+
+
+def _parses(kind: str, parser: RecipeParserEnum) -> float:
+    return RECIPE_PARSES.labels(kind, parser)._value.get()
+
+
+def _skipped(kind: str) -> float:
+    return _parses(kind, RecipeParserEnum.RULES)
+
+
+@pytest.mark.asyncio
+async def test_llm_is_skipped_for_structured_description():
+    llm = FakeLLMParser()
+    parser = RuleBasedRecipeParser(llm, TiktokDescriptionParseSettings())
+    skipped = _skipped("recipe")
+
+    recipe = await parser.parse(STRUCTURED_DESCRIPTION)
+
+    assert recipe.title == "Fluffy Pancakes"
+    assert llm.calls == 0
+    assert _skipped("recipe") == skipped + 1
+
+
+@pytest.mark.asyncio
+async def test_llm_parses_unstructured_description():
+    llm = FakeLLMParser()
+    parser = RuleBasedRecipeParser(llm, TiktokDescriptionParseSettings())
+    parsed_by_llm = _parses("recipe", RecipeParserEnum.LLM)
+
+    recipe = await parser.parse(UNSTRUCTURED_DESCRIPTION)
+
+    assert recipe.title == "From LLM"
+    assert llm.calls == 1
+    assert _parses("recipe", RecipeParserEnum.LLM) == parsed_by_llm + 1
+
+
+@pytest.mark.asyncio
+async def test_typed_ingredients_and_steps():
+    llm = FakeLLMParser()
+    parser = RuleBasedRecipeParser(llm, TiktokDescriptionParseSettings())
+
+    ingredients = await parser.parse_ingredients("200g flour, 2 eggs, 300 ml milk")
+    steps = await parser.parse_steps("1. Mix\n2. Fry")
+    assert llm.calls == 0
+    assert [i.name for i in ingredients] == ["flour", "eggs", "milk"]
+    assert steps == ["Mix", "Fry"]
+
+    # A paragraph is better split by the LLM
+    assert await parser.parse_steps("Mix it all. Then fry it.") == ["From LLM"]
+
+
+@pytest.mark.asyncio
+async def test_min_confidence_above_one_always_uses_llm():
+    llm = FakeLLMParser()
+    cfg = TiktokDescriptionParseSettings(rule_based_min_confidence=1.1)
+    parser = RuleBasedRecipeParser(llm, cfg)
+
+    await parser.parse(STRUCTURED_DESCRIPTION)
+
+    assert llm.calls == 1
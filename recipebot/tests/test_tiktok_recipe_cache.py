@@ -0,0 +1,159 @@
+"""Tests for caching parsed TikTok recipes by video id."""
+
+import orjson
+import pytest
+from pydantic import AnyHttpUrl
+
+from recipebot.adapters.repositories.sql.tiktok_recipe_cache.tiktok_recipe_cache_repo import (
+    TikTokRecipeCacheAsyncpgRepo,
+)
+from recipebot.adapters.services.tt_resolver import HttpxTTResolver
+from recipebot.config.config import TikTokRecipeCacheSettings
+from recipebot.domain.recipe.recipe import (
+    Ingredient,
+    RecipeDTO,
+    TikTokRecipeCacheEntry,
+)
+from recipebot.ports.services.recipe_parser import PreviewCallback, RecipeParserABC
+from recipebot.ports.services.tt_resolver import ResolutionResult
+from recipebot.tasks.recipe_from_tt.recipe_from_tt import RecipeFromTTTask
+
+VIDEO_ID = "7234567890123456789"
+VIDEO_URL = f"https://www.tiktok.com/@cook/video/{VIDEO_ID}?lang=en"
+SHORT_URL = "https://vm.tiktok.com/ZMabcdef/"
+
+
+class FakeResolver(HttpxTTResolver):
+    """Resolves every URL to the same video without network."""
+
+    def __init__(self) -> None:
+        self.resolved = 0
+
+    async def resolve(self, url: str) -> ResolutionResult:
+        self.resolved += 1
+        return ResolutionResult(
+            description="Pancakes: flour, eggs",
+            source_url=AnyHttpUrl(VIDEO_URL),
+            video_id=VIDEO_ID,
+        )
+
+
+class FakeParser(RecipeParserABC):
+    def __init__(self) -> None:
+        self.parsed = 0
+
+    async def parse(
+        self, description: str, on_preview: PreviewCallback | None = None
+    ) -> RecipeDTO:
+        self.parsed += 1
+        return RecipeDTO(
+            title="Pancakes",
+            desc=None,
+            ingredients=[],
+            steps=["Fry"],
+            estimated_time=None,
+        )
+
+    async def parse_ingredients(self, ingredients_text: str) -> list[Ingredient]:
+        return []
+
+    async def parse_steps(self, steps_text: str) -> list[str]:
+        return []
+
+
+class FakeConnection:
+    """Single-table fake of tiktok_recipe_cache."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict] = {}
+        self.reads = 0
+
+    async def fetchrow(self, query: str, video_id: str):
+        self.reads += 1
+        return self.rows.get(video_id)
+
+    async def execute(self, query: str, *args) -> str:
+        if query.lstrip().upper().startswith("INSERT"):
+            video_id, description, recipe, ttl = args
+            self.rows[video_id] = {
+                "video_id": video_id,
+                "description": description,
+                "recipe": recipe,
+                "ttl": ttl,
+            }
+        return "OK"
+
+    def get_cursor(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+
+@pytest.fixture
+def recipe_cache() -> TikTokRecipeCacheAsyncpgRepo:
+    return TikTokRecipeCacheAsyncpgRepo(
+        FakeConnection(),  # type: ignore[arg-type]
+        TikTokRecipeCacheSettings(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "video_id"),
+    [
+        (VIDEO_URL, VIDEO_ID),
+        (f"https://www.tiktok.com/@cook/photo/{VIDEO_ID}", VIDEO_ID),
+        (SHORT_URL, None),
+    ],
+)
+def test_canonical_video_id(url, video_id):
+    assert HttpxTTResolver(None).canonical_video_id(url) == video_id  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_repeated_import_skips_fetch_and_parse(recipe_cache):
+    resolver, parser = FakeResolver(), FakeParser()
+    task = RecipeFromTTTask(resolver, parser, recipe_cache)
+
+    first = await task.run(VIDEO_URL)
+    second = await task.run(VIDEO_URL)
+
+    assert second == first
+    assert (resolver.resolved, parser.parsed) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_short_link_is_resolved_but_not_parsed_again(recipe_cache):
+    resolver, parser = FakeResolver(), FakeParser()
+    task = RecipeFromTTTask(resolver, parser, recipe_cache)
+
+    await task.run(VIDEO_URL)
+    recipe = await task.run(SHORT_URL)
+
+    assert recipe.title == "Pancakes"
+    assert (resolver.resolved, parser.parsed) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_database_hit_fills_memory():
+    conn = FakeConnection()
+    conn.rows[VIDEO_ID] = {
+        "video_id": VIDEO_ID,
+        "description": "Pancakes",
+        "recipe": orjson.dumps({"title": "Pancakes", "ingredients": [], "steps": []}),
+        "ttl": 600.0,
+    }
+    recipe_cache = TikTokRecipeCacheAsyncpgRepo(
+        conn,  # type: ignore[arg-type]
+        TikTokRecipeCacheSettings(),
+    )
+
+    first = await recipe_cache.get(VIDEO_ID)
+    second = await recipe_cache.get(VIDEO_ID)
+
+    assert isinstance(first, TikTokRecipeCacheEntry)
+    assert second == first
+    assert conn.reads == 1
@@ -0,0 +1,187 @@
+"""Tests for TikTok description extraction."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from recipebot.adapters.services.tt_resolver import (
+    HttpxTTResolver,
+    UniversalDataExtractor,
+)
+from recipebot.infra.transport.httpx_transport import HttpxHTTPTransport
+from recipebot.ports.services.tt_resolver.exceptions import (
+    DescriptionNotFound,
+    TikTokNotAccessible,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "tiktok"
+
+DATA = (
+    '{"__DEFAULT_SCOPE__": {"webapp.video-detail": '
+    '{"itemInfo": {"itemStruct": {"desc": "Pancakes </b> recipe"}}}}}'
+)
+
+
+@pytest.fixture
+def resolver() -> HttpxTTResolver:
+    return HttpxTTResolver(None)  # type: ignore[arg-type]
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _feed(html: str, chunk_size: int = 1024) -> UniversalDataExtractor:
+    extractor = UniversalDataExtractor()
+    for chunk in _chunks(html, chunk_size):
+        if extractor.feed(chunk):
+            break
+    return extractor
+
+
+def _extract_description(resolver: HttpxTTResolver, html: str) -> str | None:
+    return resolver._extract_streamed_description(_feed(html))
+
+
+def _streaming_resolver(
+    html: str, sent: list[int], chunk_size: int = 1024
+) -> HttpxTTResolver:
+    """Resolver serving `html` in chunks, records index of every sent chunk."""
+
+    async def body() -> AsyncIterator[bytes]:
+        for i, chunk in enumerate(_chunks(html, chunk_size)):
+            sent.append(i)
+            yield chunk.encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404, text="Not found")
+        if request.url.host == "vm.tiktok.com":
+            return httpx.Response(
+                301, headers={"location": "https://www.tiktok.com/@cook/video/42"}
+            )
+        return httpx.Response(
+            200, headers={"content-type": "text/html; charset=utf-8"}, content=body()
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return HttpxTTResolver(HttpxHTTPTransport(client))
+
+
+def test_fast_path_matches_soup(resolver: HttpxTTResolver):
+    html = (FIXTURES_DIR / "video_page.html").read_text()
+
+    description = _extract_description(resolver, html)
+
+    assert description is not None
+    assert description.startswith("Easy fluffy pancakes")
+    assert description == resolver._extract_description_with_soup(html)
+
+
+def test_unavailable_video_has_no_description(resolver: HttpxTTResolver):
+    html = (FIXTURES_DIR / "unavailable_page.html").read_text()
+
+    assert _extract_description(resolver, html) is None
+
+
+def test_attributes_in_any_order():
+    html = (
+        '<html><script nonce="x" type="application/json" '
+        f'id="__UNIVERSAL_DATA_FOR_REHYDRATION__">{DATA}</script></html>'
+    )
+
+    assert _feed(html).payload == DATA
+
+
+def test_other_scripts_are_skipped():
+    html = (
+        '<script id="SIGI_STATE">{}</script>'
+        f'<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__">{DATA}</script>'
+    )
+
+    assert _feed(html).payload == DATA
+
+
+def test_page_without_data_script(resolver: HttpxTTResolver):
+    html = f'<script id="SIGI_STATE">{DATA}</script>'
+
+    assert _feed(html).payload is None
+    assert _extract_description(resolver, html) is None
+
+
+def test_falls_back_to_soup_on_invalid_json(resolver: HttpxTTResolver):
+    html = (
+        '<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__">{"broken": </script>'
+        f'<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__">{DATA}</script>'
+    )
+
+    # Soup finds the same first tag and reports the JSON as invalid
+    with pytest.raises(DescriptionNotFound, match="Invalid JSON"):
+        _extract_description(resolver, html)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096, 1 << 20])
+def test_extractor_handles_any_chunking(chunk_size: int):
+    html = (FIXTURES_DIR / "video_page.html").read_text()
+    extractor = UniversalDataExtractor()
+
+    fed = 0
+    for chunk in _chunks(html, chunk_size):
+        fed += 1
+        if extractor.feed(chunk):
+            break
+
+    script_start = html.index(">", html.index("__UNIVERSAL_DATA")) + 1
+    script_end = html.index("</script>", script_start) + 9
+    assert extractor.payload == html[script_start : script_end - 9]
+    # Stopped at the chunk with the end of the script
+    assert fed == -(-script_end // chunk_size)
+
+
+def test_extractor_without_data_script_keeps_page():
+    html = f'<html><script id="SIGI_STATE">{DATA}</script></html>'
+    extractor = UniversalDataExtractor()
+
+    assert not any(extractor.feed(chunk) for chunk in _chunks(html, 5))
+    assert extractor.payload is None
+    assert extractor.html == html
+
+
+@pytest.mark.asyncio
+async def test_resolve_stops_reading_after_data_script():
+    html = (
+        '<html><head><script id="__UNIVERSAL_DATA_FOR_REHYDRATION__" '
+        f'type="application/json">{DATA}</script></head>'
+        f"<body>{'<div>comment</div>' * 10_000}</body></html>"
+    )
+    sent: list[int] = []
+    resolver = _streaming_resolver(html, sent)
+
+    result = await resolver.resolve("https://vm.tiktok.com/ZMabc/")
+
+    assert result.description == "Pancakes </b> recipe"
+    assert result.video_id == "42"
+    assert str(result.source_url) == "https://www.tiktok.com/@cook/video/42"
+    assert len(sent) < len(_chunks(html, 1024)) // 10
+
+
+@pytest.mark.asyncio
+async def test_resolve_reads_whole_page_without_data_script():
+    html = f"<html><body>{'<div>comment</div>' * 1000}</body></html>"
+    sent: list[int] = []
+    resolver = _streaming_resolver(html, sent)
+
+    result = await resolver.resolve("https://www.tiktok.com/@cook/video/42")
+
+    assert result.description is None
+    assert len(sent) == len(_chunks(html, 1024))
+
+
+@pytest.mark.asyncio
+async def test_resolve_error_response():
+    resolver = _streaming_resolver("", [])
+
+    with pytest.raises(TikTokNotAccessible, match="404"):
+        await resolver.resolve("https://www.tiktok.com/missing")
@@ -0,0 +1,108 @@
+"""Tests for user repository registration cache."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from telegram import User as TGUser
+
+from recipebot.adapters.repositories.sql.auth.user_repo.user_repo import UserAsyncpgRepo
+from recipebot.config.config import RegistrationCacheSettings
+from recipebot.ports.repositories.exceptions import UserAlreadyExists
+
+
+class FakeConnection:
+    """Records queries and returns rows of registered users."""
+
+    def __init__(self) -> None:
+        self.users: dict[int, dict] = {}
+        self.queries: list[str] = []
+
+    async def fetchrow(self, query: str, *args):
+        self.queries.append(query)
+        if query.lstrip().upper().startswith("INSERT"):
+            tg_id, username, first_name, last_name = args
+            if tg_id in self.users:
+                return None
+            self.users[tg_id] = {
+                "tg_id": tg_id,
+                "username": username,
+                "first_name": first_name,
+                "last_name": last_name,
+                "created_at": datetime.now(),
+            }
+            return self.users[tg_id]
+        return self.users.get(args[0])
+
+    @asynccontextmanager
+    async def get_cursor(self):
+        yield self
+
+
+@pytest.fixture
+def fake_conn() -> FakeConnection:
+    return FakeConnection()
+
+
+@pytest.fixture
+def user_repo(fake_conn) -> UserAsyncpgRepo:
+    return UserAsyncpgRepo(
+        fake_conn,  # type: ignore[arg-type]
+        RegistrationCacheSettings(negative_ttl_seconds=0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_known_user_is_cached(user_repo, fake_conn):
+    fake_conn.users[1] = {"tg_id": 1, "username": "cook"}
+
+    assert (await user_repo.get(1)).username == "cook"
+    assert (await user_repo.get(1)).username == "cook"
+    assert len(fake_conn.queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_expires(user_repo, fake_conn):
+    assert await user_repo.get(1) is None
+
+    fake_conn.users[1] = {"tg_id": 1, "username": "cook"}
+    # Negative result has already expired (negative_ttl_seconds=0)
+    assert (await user_repo.get(1)).username == "cook"
+
+
+@pytest.mark.asyncio
+async def test_add_populates_cache(user_repo, fake_conn):
+    await user_repo.add(TGUser(id=1, first_name="Cook", is_bot=False, username="c"))
+    queries_after_add = len(fake_conn.queries)
+
+    assert await user_repo.get(1) is not None
+    assert len(fake_conn.queries) == queries_after_add
+
+
+@pytest.mark.asyncio
+async def test_add_is_single_round_trip(user_repo, fake_conn):
+    tg_user = TGUser(id=1, first_name="Cook", is_bot=False, username="c")
+    await user_repo.add(tg_user)
+    assert len(fake_conn.queries) == 1
+
+    # Registered elsewhere, conflict is reported without another lookup
+    fake_conn.users[2] = {"tg_id": 2, "username": "chef"}
+    with pytest.raises(UserAlreadyExists):
+        await user_repo.add(TGUser(id=2, first_name="Chef", is_bot=False))
+    assert len(fake_conn.queries) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_add_conflict_drops_negative_entry(fake_conn):
+    user_repo = UserAsyncpgRepo(
+        fake_conn,  # type: ignore[arg-type]
+        RegistrationCacheSettings(negative_ttl_seconds=60),
+    )
+    assert await user_repo.get(1) is None
+
+    # Registered elsewhere while the negative entry is still fresh
+    fake_conn.users[1] = {"tg_id": 1, "username": "cook"}
+    with pytest.raises(UserAlreadyExists):
+        await user_repo.add(TGUser(id=1, first_name="Cook", is_bot=False))
+
+    assert (await user_repo.get(1)).username == "cook"